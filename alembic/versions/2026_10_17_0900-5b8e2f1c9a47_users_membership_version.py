@@ -0,0 +1,24 @@
+"""users membership_version
+
+Revision ID: 5b8e2f1c9a47
+Revises: 1460a34e3066
+Create Date: 2026-10-17 09:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '5b8e2f1c9a47'
+down_revision: Union[str, None] = '1460a34e3066'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('membership_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'membership_version')
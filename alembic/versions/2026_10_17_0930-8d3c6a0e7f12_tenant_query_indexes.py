@@ -0,0 +1,44 @@
+"""tenant query indexes
+
+Revision ID: 8d3c6a0e7f12
+Revises: 5b8e2f1c9a47
+Create Date: 2026-10-17 09:30:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '8d3c6a0e7f12'
+down_revision: Union[str, None] = '5b8e2f1c9a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_contacts_organization_id_owner_id', 'contacts', ['organization_id', 'owner_id'], {}),
+    ('ix_deals_organization_id_created_at', 'deals', ['organization_id', 'created_at'], {}),
+    ('ix_deals_organization_id_updated_at', 'deals', ['organization_id', 'updated_at'], {}),
+    ('ix_deals_organization_id_amount', 'deals', ['organization_id', 'amount'], {}),
+    ('ix_deals_organization_id_status', 'deals', ['organization_id', 'status'], {}),
+    ('ix_deals_organization_id_owner_id', 'deals', ['organization_id', 'owner_id'], {}),
+    ('ix_deals_contact_id', 'deals', ['contact_id'], {}),
+    ('ix_tasks_deal_id_due_date', 'tasks', ['deal_id', 'due_date'], {}),
+    ('ix_tasks_deal_id_due_date_open', 'tasks', ['deal_id', 'due_date'], {'postgresql_where': sa.text('is_done = false')}),
+    ('ix_activities_deal_id_created_at', 'activities', ['deal_id', sa.text('created_at DESC')], {}),
+    ('ix_organization_members_user_id', 'organization_members', ['user_id'], {}),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes build
+    with op.get_context().autocommit_block():
+        for name, table, columns, kwargs in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True, **kwargs)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
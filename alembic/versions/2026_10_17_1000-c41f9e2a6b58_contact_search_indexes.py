@@ -0,0 +1,38 @@
+"""contact search indexes
+
+Revision ID: c41f9e2a6b58
+Revises: 8d3c6a0e7f12
+Create Date: 2026-10-17 10:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c41f9e2a6b58'
+down_revision: Union[str, None] = '8d3c6a0e7f12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_contacts_name_trgm', ['name'], {'postgresql_using': 'gin', 'postgresql_ops': {'name': 'gin_trgm_ops'}}),
+    ('ix_contacts_email_trgm', ['email'], {'postgresql_using': 'gin', 'postgresql_ops': {'email': 'gin_trgm_ops'}}),
+    ('ix_contacts_organization_id_name_prefix', ['organization_id', sa.text('lower(name) text_pattern_ops')], {}),
+    ('ix_contacts_organization_id_email_prefix', ['organization_id', sa.text('lower(email) text_pattern_ops')], {}),
+]
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for name, columns, kwargs in INDEXES:
+            op.create_index(name, 'contacts', columns, postgresql_concurrently=True, if_not_exists=True, **kwargs)
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed, other objects may depend on it
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='contacts', postgresql_concurrently=True, if_exists=True)
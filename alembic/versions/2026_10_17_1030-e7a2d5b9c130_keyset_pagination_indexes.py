@@ -0,0 +1,44 @@
+"""keyset pagination indexes
+
+Revision ID: e7a2d5b9c130
+Revises: c41f9e2a6b58
+Create Date: 2026-10-17 10:30:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e7a2d5b9c130'
+down_revision: Union[str, None] = 'c41f9e2a6b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (old index, new index with the id tie-breaker, table, old columns, new columns, kwargs)
+INDEXES = [
+    ('ix_deals_organization_id_created_at', 'ix_deals_organization_id_created_at_id', 'deals', ['organization_id', 'created_at'], ['organization_id', 'created_at', 'id'], {}),
+    ('ix_deals_organization_id_updated_at', 'ix_deals_organization_id_updated_at_id', 'deals', ['organization_id', 'updated_at'], ['organization_id', 'updated_at', 'id'], {}),
+    ('ix_deals_organization_id_amount', 'ix_deals_organization_id_amount_id', 'deals', ['organization_id', 'amount'], ['organization_id', 'amount', 'id'], {}),
+    ('ix_tasks_deal_id_due_date', 'ix_tasks_deal_id_due_date_id', 'tasks', ['deal_id', 'due_date'], ['deal_id', 'due_date', 'id'], {}),
+    ('ix_tasks_deal_id_due_date_open', 'ix_tasks_deal_id_due_date_id_open', 'tasks', ['deal_id', 'due_date'], ['deal_id', 'due_date', 'id'], {'postgresql_where': sa.text('is_done = false')}),
+    ('ix_activities_deal_id_created_at', 'ix_activities_deal_id_created_at_id', 'activities', ['deal_id', sa.text('created_at DESC')], ['deal_id', sa.text('created_at DESC'), sa.text('id DESC')], {}),
+    (None, 'ix_contacts_organization_id_name_id', 'contacts', None, ['organization_id', 'name', 'id'], {}),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for old, new, table, _, columns, kwargs in INDEXES:
+            op.create_index(new, table, columns, postgresql_concurrently=True, if_not_exists=True, **kwargs)
+            if old is not None:
+                op.drop_index(old, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for old, new, table, columns, _, kwargs in reversed(INDEXES):
+            if old is not None:
+                op.create_index(old, table, columns, postgresql_concurrently=True, if_not_exists=True, **kwargs)
+            op.drop_index(new, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,39 @@
+"""deal rollups
+
+Revision ID: 3f6d9b1e4a27
+Revises: e7a2d5b9c130
+Create Date: 2026-10-17 11:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '3f6d9b1e4a27'
+down_revision: Union[str, None] = 'e7a2d5b9c130'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('deal_rollups',
+    sa.Column('organization_id', sa.Integer(), nullable=False),
+    sa.Column('stage', postgresql.ENUM(name='dealstage', create_type=False), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='dealstatus', create_type=False), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('total_amount', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ),
+    sa.PrimaryKeyConstraint('organization_id', 'stage', 'status')
+    )
+    # Backfill from existing deals; DealService keeps it current from here on
+    op.execute(
+        'INSERT INTO deal_rollups (organization_id, stage, status, count, total_amount)'
+        ' SELECT organization_id, stage, status, count(*), coalesce(sum(amount), 0)'
+        ' FROM deals GROUP BY organization_id, stage, status'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('deal_rollups')
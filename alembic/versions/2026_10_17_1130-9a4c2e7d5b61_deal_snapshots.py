@@ -0,0 +1,34 @@
+"""deal snapshots
+
+Revision ID: 9a4c2e7d5b61
+Revises: 3f6d9b1e4a27
+Create Date: 2026-10-17 11:30:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '9a4c2e7d5b61'
+down_revision: Union[str, None] = '3f6d9b1e4a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('deal_snapshots',
+    sa.Column('organization_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('stage', postgresql.ENUM(name='dealstage', create_type=False), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='dealstatus', create_type=False), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('total_amount', sa.Numeric(precision=18, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ),
+    sa.PrimaryKeyConstraint('organization_id', 'day', 'stage', 'status')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('deal_snapshots')
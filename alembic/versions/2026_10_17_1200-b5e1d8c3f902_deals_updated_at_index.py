@@ -0,0 +1,26 @@
+"""deals updated_at index
+
+Revision ID: b5e1d8c3f902
+Revises: 9a4c2e7d5b61
+Create Date: 2026-10-17 12:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'b5e1d8c3f902'
+down_revision: Union[str, None] = '9a4c2e7d5b61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps deals writable while the index builds
+    with op.get_context().autocommit_block():
+        op.create_index('ix_deals_updated_at', 'deals', ['updated_at'], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_deals_updated_at', table_name='deals', postgresql_concurrently=True, if_exists=True)
@@ -1,10 +1,14 @@
 """SQLAdmin configuration."""
 
+from typing import Any
+
 from sqladmin import Admin, ModelView
+from starlette.requests import Request
 
-from src.core.database import engine
+from src.core.database import AsyncSessionLocal, engine
 from src.models.auth import Organization, OrganizationMember, User
 from src.models.crm import Activity, Contact, Deal, Task
+from src.services import AnalyticsService, AuthService, OrganizationService
 
 
 class UserAdmin(ModelView, model=User):
@@ -25,6 +29,14 @@ class UserAdmin(ModelView, model=User):
     name_plural = "Пользователи"
     icon = "fa-solid fa-user"
 
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        await AuthService.invalidate_principal(model.id)
+
+    async def after_model_delete(self, model: Any, request: Request) -> None:
+        await AuthService.invalidate_principal(model.id)
+
 
 class OrganizationAdmin(ModelView, model=Organization):
     column_list = [Organization.id, Organization.name, Organization.created_at]
@@ -59,6 +71,37 @@ class OrganizationMemberAdmin(ModelView, model=OrganizationMember):
     name_plural = "Участники"
     icon = "fa-solid fa-users"
 
+    async def on_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        # Membership before the edit, whose user loses it if the row moves
+        request.state.previous_membership = (
+            None if is_created else (model.organization_id, model.user_id)
+        )
+
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        previous = request.state.previous_membership
+        current = (model.organization_id, model.user_id)
+        await _record_membership_changes(
+            {current} if previous is None else {previous, current}
+        )
+
+    async def after_model_delete(self, model: Any, request: Request) -> None:
+        await _record_membership_changes(
+            {(model.organization_id, model.user_id)}
+        )
+
+
+async def _record_membership_changes(
+    memberships: set[tuple[int, int]],
+) -> None:
+    async with AsyncSessionLocal() as session:
+        service = OrganizationService(session)
+        for organization_id, user_id in sorted(memberships):
+            await service.record_membership_change(organization_id, user_id)
+
 
 class ContactAdmin(ModelView, model=Contact):
     column_list = [
@@ -110,6 +153,31 @@ class DealAdmin(ModelView, model=Deal):
     name_plural = "Сделки"
     icon = "fa-solid fa-handshake"
 
+    # Deals edited here bypass DealService, so their organization's rollups
+    # are rebuilt instead of updated incrementally
+    async def on_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        # Organization before the edit, whose rollups change too if it moves
+        request.state.deal_organization_id = (
+            None if is_created else model.organization_id
+        )
+
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        previous = request.state.deal_organization_id
+        await _rebuild_deal_rollups({previous, model.organization_id} - {None})
+
+    async def after_model_delete(self, model: Any, request: Request) -> None:
+        await _rebuild_deal_rollups({model.organization_id})
+
+
+async def _rebuild_deal_rollups(organization_ids: set[int]) -> None:
+    async with AsyncSessionLocal() as session:
+        for organization_id in sorted(organization_ids):
+            await AnalyticsService(session).rebuild_rollups(organization_id)
+
 
 class TaskAdmin(ModelView, model=Task):
     column_list = [
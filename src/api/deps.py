@@ -1,12 +1,15 @@
+import hmac
 from typing import Annotated
 
 from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.core.database import get_db
 from src.core.exceptions import ForbiddenError, UnauthorizedError
-from src.models import OrganizationMember, User
+from src.core.security import decode_token
+from src.domain import Principal, TenantContext
 from src.services import AuthService, OrganizationService
 
 security = HTTPBearer()
@@ -15,7 +18,7 @@ security = HTTPBearer()
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
+) -> Principal:
     """Get current authenticated user from JWT token."""
     try:
         auth_service = AuthService(db)
@@ -38,14 +41,18 @@ async def get_organization_id(
 
 async def get_organization_context(
     organization_id: Annotated[int, Depends(get_organization_id)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> OrganizationMember:
-    """Get current user's membership in the organization."""
+) -> TenantContext:
+    """Resolve the current user's role in the organization, once per request."""
     try:
         org_service = OrganizationService(db)
-        member = await org_service.get_membership(organization_id, current_user)
-        return member
+        # Already verified by get_current_user, served from the token cache
+        claims = decode_token(credentials.credentials)
+        return await org_service.get_context(
+            organization_id, current_user, claims
+        )
     except ForbiddenError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -53,8 +60,21 @@ async def get_organization_context(
         )
 
 
+async def require_admin(
+    x_admin_key: Annotated[str | None, Header()] = None,
+) -> None:
+    """Allow operator-only endpoints for callers with the admin API key."""
+    if not settings.ADMIN_API_KEY or not hmac.compare_digest(
+        x_admin_key or "", settings.ADMIN_API_KEY
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
+
+
 # Type aliases for cleaner dependency injection
 DbSession = Annotated[AsyncSession, Depends(get_db)]
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
 OrgId = Annotated[int, Depends(get_organization_id)]
-OrgContext = Annotated[OrganizationMember, Depends(get_organization_context)]
+OrgContext = Annotated[TenantContext, Depends(get_organization_context)]
@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from src.api.v1 import (
     activities,
+    admin,
     analytics,
     auth,
     contacts,
@@ -19,3 +20,4 @@ router.include_router(deals.router)
 router.include_router(tasks.router)
 router.include_router(activities.router)
 router.include_router(analytics.router)
+router.include_router(admin.router)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, Query, status
 
-from src.api.deps import CurrentUser, DbSession, OrgId
+from src.api.deps import DbSession, OrgContext
 from src.core.exceptions import NotFoundError, ValidationError
 from src.models.enums import ActivityType
 from src.schemas import (
@@ -17,22 +17,27 @@ router = APIRouter(prefix="/deals/{deal_id}/activities", tags=["Activities"])
 async def get_activities(
     deal_id: int,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page, instead of page"
+    ),
 ):
     """Get activities (timeline) for a deal."""
     try:
         service = ActivityService(db)
-        activities = await service.get_activities(
+        result = await service.get_activities(
             deal_id=deal_id,
-            organization_id=organization_id,
-            user=current_user,
+            ctx=ctx,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+        )
+        return ActivityListResponse(
+            items=result.items,  # type: ignore[arg-type]
+            next_cursor=result.next_cursor,
         )
-        return ActivityListResponse(items=activities)  # type: ignore[arg-type]
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
@@ -46,8 +51,7 @@ async def create_activity(
     deal_id: int,
     data: CreateCommentRequest,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Create comment activity (only type users can create directly)."""
     if data.type != ActivityType.COMMENT:
@@ -67,8 +71,7 @@ async def create_activity(
         service = ActivityService(db)
         return await service.create_comment(
             deal_id=deal_id,
-            organization_id=organization_id,
-            user=current_user,
+            ctx=ctx,
             text=text,
         )
     except NotFoundError as e:
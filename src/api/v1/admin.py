@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Depends
+
+from src.api.deps import require_admin
+from src.core import cache
+
+router = APIRouter(
+    prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)]
+)
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """Get per-namespace cache statistics of the serving worker."""
+    return cache.stats()
@@ -1,6 +1,8 @@
+from datetime import date
+
 from fastapi import APIRouter, Query
 
-from src.api.deps import CurrentUser, DbSession, OrgId
+from src.api.deps import DbSession, OrgContext
 from src.schemas import DealsFunnelResponse, DealsSummaryResponse
 from src.services import AnalyticsService
 
@@ -10,28 +12,32 @@ router = APIRouter(prefix="/analytics", tags=["Analytics"])
 @router.get("/deals/summary", response_model=DealsSummaryResponse)
 async def get_deals_summary(
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
     days: int = Query(30, ge=1, le=365),
+    as_of: date | None = Query(
+        None, description="Read the daily snapshot of this day instead"
+    ),
 ):
     """Get deals summary analytics."""
     service = AnalyticsService(db)
     return await service.get_deals_summary(
-        organization_id=organization_id,
-        user=current_user,
+        ctx=ctx,
         days=days,
+        as_of=as_of,
     )
 
 
 @router.get("/deals/funnel", response_model=DealsFunnelResponse)
 async def get_deals_funnel(
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
+    as_of: date | None = Query(
+        None, description="Read the daily snapshot of this day instead"
+    ),
 ):
     """Get sales funnel analytics."""
     service = AnalyticsService(db)
     return await service.get_deals_funnel(
-        organization_id=organization_id,
-        user=current_user,
+        ctx=ctx,
+        as_of=as_of,
     )
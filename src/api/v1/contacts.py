@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException, Query, status
 
-from src.api.deps import CurrentUser, DbSession, OrgId
+from src.api.deps import DbSession, OrgContext
 from src.core.exceptions import ConflictError, ForbiddenError, NotFoundError
+from src.core.pagination import CountStrategy
 from src.schemas import (
     ContactCreate,
     ContactListResponse,
@@ -16,28 +17,41 @@ router = APIRouter(prefix="/contacts", tags=["Contacts"])
 @router.get("", response_model=ContactListResponse)
 async def get_contacts(
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     search: str | None = None,
     owner_id: int | None = None,
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page, instead of page"
+    ),
+    include_total: bool = Query(
+        True, description="Count the matching items, total is null if false"
+    ),
+    count: CountStrategy = Query(
+        CountStrategy.EXACT,
+        description="exact, capped at LIST_COUNT_CAP, or planner estimate",
+    ),
 ):
     """Get paginated list of contacts."""
     service = ContactService(db)
-    contacts, total = await service.get_contacts(
-        organization_id=organization_id,
-        user=current_user,
+    result = await service.get_contacts(
+        ctx=ctx,
         page=page,
         page_size=page_size,
         search=search,
         owner_id=owner_id,
+        cursor=cursor,
+        include_total=include_total,
+        count=count,
     )
     return ContactListResponse(
-        items=contacts,  # type: ignore[arg-type]
-        total=total,
+        items=result.items,  # type: ignore[arg-type]
+        total=result.total,
         page=page,
         page_size=page_size,
+        next_cursor=result.next_cursor,
+        total_is_exact=result.total_is_exact,
     )
 
 
@@ -45,15 +59,12 @@ async def get_contacts(
 async def get_contact(
     contact_id: int,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Get contact by ID."""
     try:
         service = ContactService(db)
-        return await service.get_contact(
-            contact_id, organization_id, current_user
-        )
+        return await service.get_contact(contact_id, ctx)
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
@@ -66,14 +77,12 @@ async def get_contact(
 async def create_contact(
     data: ContactCreate,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Create new contact."""
     service = ContactService(db)
     return await service.create_contact(
-        organization_id=organization_id,
-        user=current_user,
+        ctx=ctx,
         name=data.name,
         email=data.email,
         phone=data.phone,
@@ -85,16 +94,14 @@ async def update_contact(
     contact_id: int,
     data: ContactUpdate,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Update contact."""
     try:
         service = ContactService(db)
         return await service.update_contact(
             contact_id=contact_id,
-            organization_id=organization_id,
-            user=current_user,
+            ctx=ctx,
             **data.model_dump(exclude_unset=True),
         )
     except NotFoundError as e:
@@ -111,13 +118,12 @@ async def update_contact(
 async def delete_contact(
     contact_id: int,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Delete contact (only if no deals)."""
     try:
         service = ContactService(db)
-        await service.delete_contact(contact_id, organization_id, current_user)
+        await service.delete_contact(contact_id, ctx)
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
@@ -2,8 +2,9 @@ from decimal import Decimal
 
 from fastapi import APIRouter, HTTPException, Query, status
 
-from src.api.deps import CurrentUser, DbSession, OrgId
+from src.api.deps import DbSession, OrgContext
 from src.core.exceptions import ForbiddenError, NotFoundError, ValidationError
+from src.core.pagination import CountStrategy
 from src.models.enums import DealStage, DealStatus
 from src.schemas import DealCreate, DealListResponse, DealResponse, DealUpdate
 from src.services import DealService
@@ -14,8 +15,7 @@ router = APIRouter(prefix="/deals", tags=["Deals"])
 @router.get("", response_model=DealListResponse)
 async def get_deals(
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     status: list[DealStatus] | None = Query(None),
@@ -27,12 +27,21 @@ async def get_deals(
         "created_at", pattern="^(created_at|amount|updated_at)$"
     ),
     order: str = Query("desc", pattern="^(asc|desc)$"),
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page, instead of page"
+    ),
+    include_total: bool = Query(
+        True, description="Count the matching items, total is null if false"
+    ),
+    count: CountStrategy = Query(
+        CountStrategy.EXACT,
+        description="exact, capped at LIST_COUNT_CAP, or planner estimate",
+    ),
 ):
     """Get paginated list of deals with filters."""
     service = DealService(db)
-    deals, total = await service.get_deals(
-        organization_id=organization_id,
-        user=current_user,
+    result = await service.get_deals(
+        ctx=ctx,
         page=page,
         page_size=page_size,
         status=status,
@@ -42,12 +51,17 @@ async def get_deals(
         max_amount=max_amount,
         order_by=order_by,
         order=order,
+        cursor=cursor,
+        include_total=include_total,
+        count=count,
     )
     return DealListResponse(
-        items=deals,  # type: ignore[arg-type]
-        total=total,
+        items=result.items,  # type: ignore[arg-type]
+        total=result.total,
         page=page,
         page_size=page_size,
+        next_cursor=result.next_cursor,
+        total_is_exact=result.total_is_exact,
     )
 
 
@@ -55,13 +69,12 @@ async def get_deals(
 async def get_deal(
     deal_id: int,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Get deal by ID."""
     try:
         service = DealService(db)
-        return await service.get_deal(deal_id, organization_id, current_user)
+        return await service.get_deal(deal_id, ctx)
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
@@ -74,15 +87,13 @@ async def get_deal(
 async def create_deal(
     data: DealCreate,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Create new deal."""
     try:
         service = DealService(db)
         return await service.create_deal(
-            organization_id=organization_id,
-            user=current_user,
+            ctx=ctx,
             contact_id=data.contact_id,
             title=data.title,
             amount=data.amount,
@@ -99,16 +110,14 @@ async def update_deal(
     deal_id: int,
     data: DealUpdate,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Update deal (with status/stage validations)."""
     try:
         service = DealService(db)
         return await service.update_deal(
             deal_id=deal_id,
-            organization_id=organization_id,
-            user=current_user,
+            ctx=ctx,
             **data.model_dump(exclude_unset=True),
         )
     except NotFoundError as e:
@@ -129,13 +138,12 @@ async def update_deal(
 async def delete_deal(
     deal_id: int,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Delete deal."""
     try:
         service = DealService(db)
-        await service.delete_deal(deal_id, organization_id, current_user)
+        await service.delete_deal(deal_id, ctx)
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
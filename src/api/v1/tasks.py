@@ -2,7 +2,7 @@ from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query, status
 
-from src.api.deps import CurrentUser, DbSession, OrgId
+from src.api.deps import DbSession, OrgContext
 from src.core.exceptions import ForbiddenError, NotFoundError, ValidationError
 from src.schemas import TaskCreate, TaskListResponse, TaskResponse, TaskUpdate
 from src.services import TaskService
@@ -13,29 +13,34 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"])
 @router.get("", response_model=TaskListResponse)
 async def get_tasks(
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
     deal_id: int | None = None,
     only_open: bool = False,
     due_before: datetime | None = None,
     due_after: datetime | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(
+        None, description="next_cursor of the previous page, instead of page"
+    ),
 ):
     """Get tasks with optional filters."""
     try:
         service = TaskService(db)
-        tasks = await service.get_tasks(
-            organization_id=organization_id,
-            user=current_user,
+        result = await service.get_tasks(
+            ctx=ctx,
             deal_id=deal_id,
             only_open=only_open,
             due_before=due_before,
             due_after=due_after,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+        )
+        return TaskListResponse(
+            items=result.items,  # type: ignore[arg-type]
+            next_cursor=result.next_cursor,
         )
-        return TaskListResponse(items=tasks)  # type: ignore[arg-type]
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
@@ -46,13 +51,12 @@ async def get_tasks(
 async def get_task(
     task_id: int,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Get task by ID."""
     try:
         service = TaskService(db)
-        return await service.get_task(task_id, organization_id, current_user)
+        return await service.get_task(task_id, ctx)
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
@@ -65,15 +69,13 @@ async def get_task(
 async def create_task(
     data: TaskCreate,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Create new task for a deal."""
     try:
         service = TaskService(db)
         return await service.create_task(
-            organization_id=organization_id,
-            user=current_user,
+            ctx=ctx,
             deal_id=data.deal_id,
             title=data.title,
             due_date=data.due_date,
@@ -98,16 +100,14 @@ async def update_task(
     task_id: int,
     data: TaskUpdate,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Update task."""
     try:
         service = TaskService(db)
         return await service.update_task(
             task_id=task_id,
-            organization_id=organization_id,
-            user=current_user,
+            ctx=ctx,
             **data.model_dump(exclude_unset=True),
         )
     except NotFoundError as e:
@@ -128,13 +128,12 @@ async def update_task(
 async def delete_task(
     task_id: int,
     db: DbSession,
-    current_user: CurrentUser,
-    organization_id: OrgId,
+    ctx: OrgContext,
 ):
     """Delete task."""
     try:
         service = TaskService(db)
-        await service.delete_task(task_id, organization_id, current_user)
+        await service.delete_task(task_id, ctx)
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=e.message
@@ -7,9 +7,11 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Protocol
 
+from src.core.pagination import CountStrategy
 from src.domain.enums import DealStage, DealStatus
 
 if TYPE_CHECKING:
+    from src.core.pagination import Cursor, Page
     from src.models import Deal, Task
 
 
@@ -28,18 +30,39 @@ class DealRepositoryProtocol(Protocol):
         max_amount: Decimal | None = None,
         order_by: str = "created_at",
         order: str = "desc",
+        after: Cursor | None = None,
     ) -> Sequence[Deal]: ...
 
+    async def get_page(
+        self,
+        organization_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        status: list[DealStatus] | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        order_by: str = "created_at",
+        order: str = "desc",
+        after: Cursor | None = None,
+        count: CountStrategy | None = CountStrategy.EXACT,
+    ) -> Page: ...
+
     async def count_by_organization(
         self,
         organization_id: int,
         status: list[DealStatus] | None = None,
         stage: DealStage | None = None,
         owner_id: int | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
     ) -> int: ...
 
     async def get_by_id(self, deal_id: int) -> Deal | None: ...
 
+    async def get_for_update(self, deal_id: int) -> Deal | None: ...
+
     async def create(self, **kwargs) -> Deal: ...
 
     async def update(self, deal: Deal, **kwargs) -> Deal: ...
@@ -56,6 +79,9 @@ class TaskRepositoryProtocol(Protocol):
         only_open: bool = False,
         due_before: datetime | None = None,
         due_after: datetime | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Cursor | None = None,
     ) -> Sequence[Task]: ...
 
     async def get_by_organization(
@@ -66,6 +92,7 @@ class TaskRepositoryProtocol(Protocol):
         due_after: datetime | None = None,
         skip: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
     ) -> Sequence[Task]: ...
 
     async def get_by_id(self, task_id: int) -> Task | None: ...
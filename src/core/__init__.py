@@ -6,6 +6,7 @@ from src.core.exceptions import (
     ConflictError,
     ForbiddenError,
     NotFoundError,
+    ServiceUnavailableError,
     UnauthorizedError,
     ValidationError,
 )
@@ -14,5 +15,8 @@ from src.core.security import (
     create_refresh_token,
     decode_token,
     hash_password,
+    hash_password_async,
+    password_needs_update,
     verify_password,
+    verify_password_async,
 )
@@ -0,0 +1,441 @@
+"""Application cache.
+
+Module-level async API over the configured ``CacheBackend``: the
+in-process LRU (``memory``) or a Redis-protocol server shared by all
+workers (``redis``).
+
+Invalidation is generation based: callers embed ``generation(tag)`` into
+their keys and ``invalidate_tag(tag)`` bumps it, so every key built from
+the old generation simply stops being read and ages out of the LRU.
+"""
+
+import asyncio
+import builtins
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from functools import wraps
+from typing import Any, NamedTuple
+
+from src.core.cache import stats as _stats
+from src.core.cache.backend import CacheBackend, CacheError
+from src.core.cache.keys import make_digest, resolve_param
+from src.core.cache.memory import MemoryBackend, namespace_of
+from src.core.cache.redis import RedisBackend
+from src.core.config import settings
+from src.core.metrics import Gauge
+
+logger = logging.getLogger(__name__)
+
+
+def create_backend() -> CacheBackend:
+    """Build the backend selected by ``settings.CACHE_BACKEND``."""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisBackend(
+            settings.CACHE_REDIS_URL,
+            key_prefix=settings.CACHE_KEY_PREFIX,
+            pool_size=settings.CACHE_REDIS_POOL_SIZE,
+            timeout=settings.CACHE_REDIS_TIMEOUT_SECONDS,
+        )
+    return MemoryBackend(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        max_bytes=settings.CACHE_MAX_BYTES,
+        on_remove=_stats.record_removal,
+    )
+
+
+_backend: CacheBackend = create_backend()
+
+
+def get_backend() -> CacheBackend:
+    return _backend
+
+
+def set_backend(backend: CacheBackend) -> None:
+    global _backend
+    _backend = backend
+
+
+def is_shared() -> bool:
+    """Whether all workers see the same entries and invalidations."""
+    return not isinstance(_backend, MemoryBackend)
+
+
+# The cache is an optimization: when a shared backend is unreachable, reads
+# miss and writes are dropped instead of failing the request.
+
+
+async def _lookup(key: str) -> Any | None:
+    try:
+        return await _backend.get(key)
+    except CacheError as e:
+        logger.warning("Cache get failed for %s: %s", key, e)
+        return None
+
+
+async def get(key: str) -> Any | None:
+    value = await _lookup(key)
+    counter = _stats.MISSES if value is None else _stats.HITS
+    counter.inc(namespace=namespace_of(key))
+    return value
+
+
+async def set(
+    key: str, value: Any, ttl: float = 60, soft_ttl: float | None = None
+) -> None:
+    """Store a value; with ``soft_ttl`` it is stored the way ``get_or_set``
+    stores stale-while-revalidate values, e.g. to refresh one eagerly."""
+    if soft_ttl is not None:
+        value = _Fresh(value, time.time() + soft_ttl)
+    try:
+        await _backend.set(key, value, ttl)
+    except CacheError as e:
+        logger.warning("Cache set failed for %s: %s", key, e)
+
+
+async def delete(key: str) -> None:
+    try:
+        await _backend.delete(key)
+    except CacheError as e:
+        logger.error("Cache delete failed for %s: %s", key, e)
+
+
+async def incr(key: str, amount: int = 1, ttl: float = 60) -> int:
+    """Atomic counter; unlike reads, errors propagate to the caller."""
+    return await _backend.incr(key, amount, ttl)
+
+
+async def generations(tags: Sequence[str]) -> list[int]:
+    """Current generations of tags, to be embedded into cache keys."""
+    try:
+        return await _backend.generations(tags)
+    except CacheError as e:
+        logger.warning("Cache generation lookup failed for %s: %s", tags, e)
+        return [0] * len(tags)
+
+
+async def generation(tag: str) -> int:
+    (value,) = await generations([tag])
+    return value
+
+
+async def invalidate_tag(tag: str) -> None:
+    """Invalidate every key built from the current generation of ``tag``."""
+    try:
+        await _backend.invalidate_tag(tag)
+    except CacheError as e:
+        logger.error("Cache invalidation failed for %s: %s", tag, e)
+
+
+async def clear() -> None:
+    await _backend.clear()
+
+
+class Namespace:
+    """Key space of one kind of cached data, partitioned by tenant.
+
+    Keys embed the generations of the namespace, of the tenant within the
+    namespace and of the tenant globally, so a namespace, one tenant's part
+    of it, or everything cached for a tenant can be dropped in O(1).
+
+    Usage:
+        analytics = Namespace("analytics")
+        key = await analytics.key("summary", {"days": 30}, tenant=org_id)
+        await analytics.invalidate_tenant(org_id)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def _tags(self, tenant: Any) -> list[str]:
+        if tenant is None:
+            return [f"ns:{self.name}"]
+        return [
+            f"ns:{self.name}",
+            f"ns:{self.name}:tenant:{tenant}",
+            f"tenant:{tenant}",
+        ]
+
+    async def key(
+        self, name: str, params: dict[str, Any], tenant: Any = None
+    ) -> str:
+        gens = await generations(self._tags(tenant))
+        digest = make_digest({"params": params, "generations": gens})
+        return (
+            f"{self.name}:{'-' if tenant is None else tenant}:{name}:{digest}"
+        )
+
+    async def invalidate(self) -> None:
+        await invalidate_tag(f"ns:{self.name}")
+
+    async def invalidate_tenant(self, tenant: Any) -> None:
+        await invalidate_tag(f"ns:{self.name}:tenant:{tenant}")
+
+
+async def drop_tenant(tenant: Any) -> None:
+    """Invalidate everything cached for a tenant in every namespace."""
+    await invalidate_tag(f"tenant:{tenant}")
+
+
+async def close() -> None:
+    await _backend.close()
+
+
+class _LeaderCancelled(Exception):
+    """The computing caller was cancelled, followers must retry."""
+
+
+# Computations in flight in this process, keyed by cache key.
+_inflight: dict[str, asyncio.Future[Any]] = {}
+
+
+async def single_flight(key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``factory`` once for concurrent callers of the same ``key``.
+
+    The first caller (leader) computes, the others await its result. If the
+    leader fails, followers get the same exception; if it is cancelled,
+    one of the followers takes over.
+    """
+    while True:
+        future = _inflight.get(key)
+        if future is None:
+            break
+        try:
+            # shield: a cancelled follower must not cancel the shared future
+            return await asyncio.shield(future)
+        except _LeaderCancelled:
+            continue
+
+    future = asyncio.get_running_loop().create_future()
+    # Mark the exception as retrieved even when nobody is waiting.
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _inflight[key] = future
+    try:
+        result = await factory()
+    except asyncio.CancelledError:
+        future.set_exception(_LeaderCancelled())
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+class _Fresh(NamedTuple):
+    """Stored value with its soft expiry (wall clock, shared by workers)."""
+
+    value: Any
+    fresh_until: float
+
+
+# Keys with a background refresh scheduled in this process. (``builtins``:
+# the module-level ``set`` function shadows the builtin here.)
+_refreshing: builtins.set[str] = builtins.set()
+_background_tasks: builtins.set[asyncio.Task[None]] = builtins.set()
+
+
+async def _compute_and_store(
+    key: str,
+    factory: Callable[[], Awaitable[Any]],
+    ttl: float,
+    soft_ttl: float | None,
+) -> Any:
+    started = time.perf_counter()
+    value = await factory()
+    _stats.RECOMPUTE_SECONDS.observe(
+        time.perf_counter() - started, namespace=namespace_of(key)
+    )
+    await set(key, value, ttl, soft_ttl)
+    return value
+
+
+def _schedule_refresh(
+    key: str,
+    factory: Callable[[], Awaitable[Any]],
+    ttl: float,
+    soft_ttl: float,
+) -> None:
+    if key in _refreshing or key in _inflight:
+        return
+    _refreshing.add(key)
+
+    async def refresh() -> None:
+        try:
+            await single_flight(
+                key, lambda: _compute_and_store(key, factory, ttl, soft_ttl)
+            )
+        except Exception:
+            logger.exception("Background refresh failed for %s", key)
+        finally:
+            _refreshing.discard(key)
+
+    task = asyncio.create_task(refresh())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def get_or_set(
+    key: str,
+    factory: Callable[[], Awaitable[Any]],
+    ttl: float = 60,
+    soft_ttl: float | None = None,
+    refresh: Callable[[], Awaitable[Any]] | None = None,
+) -> Any:
+    """Return the cached value or compute it once and store it.
+
+    Concurrent misses for the same key are coalesced onto one computation.
+
+    With ``soft_ttl`` the cache serves stale-while-revalidate: once the
+    value is older than ``soft_ttl`` it is still returned right away and a
+    single background refresh is scheduled; ``ttl`` is the hard limit after
+    which callers wait for a synchronous recompute. ``refresh`` replaces
+    ``factory`` for background runs, e.g. to open its own DB session since
+    the request that triggered it may be gone by then.
+    """
+    value = await get(key)
+    if isinstance(value, _Fresh):
+        if soft_ttl is not None and value.fresh_until <= time.time():
+            _stats.STALE_HITS.inc(namespace=namespace_of(key))
+            _schedule_refresh(key, refresh or factory, ttl, soft_ttl)
+        return value.value
+    if value is not None:
+        return value
+
+    async def compute() -> Any:
+        # Another leader may have stored the value while we were waiting.
+        value = await _lookup(key)
+        if isinstance(value, _Fresh):
+            return value.value
+        if value is not None:
+            return value
+        return await _compute_and_store(key, factory, ttl, soft_ttl)
+
+    return await single_flight(key, compute)
+
+
+def _memory_stats() -> dict[str, tuple[int, int]]:
+    if isinstance(_backend, MemoryBackend):
+        return _backend.store.namespace_stats()
+    return {}
+
+
+ENTRIES = Gauge(
+    "cache_entries",
+    "Entries currently stored (in-process backend only)",
+    ["namespace"],
+    callback=lambda: {(ns,): n for ns, (n, _) in _memory_stats().items()},
+)
+BYTES = Gauge(
+    "cache_bytes",
+    "Estimated bytes currently stored (in-process backend only)",
+    ["namespace"],
+    callback=lambda: {(ns,): b for ns, (_, b) in _memory_stats().items()},
+)
+
+
+def stats() -> dict[str, Any]:
+    """Per-namespace cache statistics of this process."""
+    counters = {
+        "hits": _stats.HITS,
+        "misses": _stats.MISSES,
+        "stale_hits": _stats.STALE_HITS,
+        "expirations": _stats.EXPIRATIONS,
+        "evictions": _stats.EVICTIONS,
+    }
+    stored = _memory_stats()
+    namespaces = builtins.set(stored)
+    for counter in (*counters.values(), _stats.RECOMPUTE_SECONDS):
+        namespaces.update(
+            labels["namespace"] for _, labels, _ in counter.samples()
+        )
+
+    result: dict[str, Any] = {}
+    for ns in sorted(namespaces):
+        entries, size = stored.get(ns, (0, 0))
+        lookups = _stats.HITS.value(namespace=ns) + _stats.MISSES.value(
+            namespace=ns
+        )
+        result[ns] = {
+            **{
+                name: int(c.value(namespace=ns)) for name, c in counters.items()
+            },
+            "hit_ratio": round(_stats.HITS.value(namespace=ns) / lookups, 4)
+            if lookups
+            else None,
+            "entries": entries,
+            "bytes": size,
+            "recompute_seconds": _stats.RECOMPUTE_SECONDS.summary(namespace=ns),
+        }
+    backend = "memory" if isinstance(_backend, MemoryBackend) else "redis"
+    return {"backend": backend, "namespaces": result}
+
+
+async def run_sweeper(interval: float) -> None:
+    """Periodically drop expired in-process entries (background task)."""
+    while True:
+        await asyncio.sleep(interval)
+        if not isinstance(_backend, MemoryBackend):
+            continue
+        removed = _backend.store.sweep()
+        if removed:
+            logger.debug("Cache sweep removed %d expired entries", removed)
+
+
+def cached(
+    ttl: float = 60,
+    namespace: str = "default",
+    key: Sequence[str] = (),
+    tenant: str | None = None,
+    soft_ttl: float | None = None,
+) -> Callable:
+    """Decorator for caching funct results
+
+    Only the parameters listed in ``key`` make up the cache key (dotted
+    paths reach into objects, e.g. ``"member.role"``), so ``self``, sessions
+    and ORM objects never leak into it. ``tenant`` names the parameter that
+    partitions the namespace.
+
+    Usage:
+        @cached(
+            ttl=30,
+            namespace="analytics",
+            key=("days",),
+            tenant="organization_id",
+        )
+        async def get_summary(self, organization_id: int, days: int) -> dict:
+            ...
+    """
+    space = Namespace(namespace)
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        for path in (*key, *([tenant] if tenant else [])):
+            if path.split(".")[0] not in signature.parameters:
+                raise TypeError(
+                    f"{func.__qualname__} has no parameter {path!r}"
+                )
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {
+                path: resolve_param(bound.arguments, path) for path in key
+            }
+            tenant_id = bound.arguments[tenant] if tenant else None
+            cache_key = await space.key(func.__qualname__, params, tenant_id)
+            return await get_or_set(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                ttl,
+                soft_ttl=soft_ttl,
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,39 @@
+"""Cache backend interface (port)."""
+
+from collections.abc import Sequence
+from typing import Any, Protocol
+
+
+class CacheError(Exception):
+    """Cache backend is unreachable or returned an error."""
+
+
+class CacheBackend(Protocol):
+    """Storage used by ``src.core.cache``.
+
+    Values passed to ``set`` must be picklable. Counters created by ``incr``
+    are a separate key space (stored under a ``counter:`` prefix) and are
+    only read back through ``incr``.
+    """
+
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def incr(self, key: str, amount: int = 1, ttl: float = 60) -> int:
+        """Atomically add to a counter, TTL applies when it is created."""
+        ...
+
+    async def generations(self, tags: Sequence[str]) -> list[int]:
+        """Current generations of tags, to be embedded into cache keys."""
+        ...
+
+    async def invalidate_tag(self, tag: str) -> None:
+        """Bump the tag generation, orphaning keys built from the old one."""
+        ...
+
+    async def clear(self) -> None: ...
+
+    async def close(self) -> None: ...
@@ -0,0 +1,32 @@
+"""Cache key building."""
+
+import hashlib
+import json
+from enum import Enum
+from typing import Any
+
+
+def _default(value: Any) -> Any:
+    # Enums, Decimals, dates... serialize by value, never by repr
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def make_digest(payload: Any) -> str:
+    """Fixed-length (32 hex chars) digest of JSON-serializable key parts."""
+    data = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=_default
+    )
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+
+def resolve_param(arguments: dict[str, Any], path: str) -> Any:
+    """Resolve ``"name"`` or ``"name.attr.attr"`` against bound arguments."""
+    name, *attrs = path.split(".")
+    value = arguments[name]
+    for attr in attrs:
+        value = getattr(value, attr)
+    return value
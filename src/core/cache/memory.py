@@ -0,0 +1,213 @@
+"""Bounded in-process LRU cache with per-entry TTL.
+
+Entries live in an ``OrderedDict`` kept in recency order, so lookups,
+inserts and evictions are O(1). Memory is bounded both by entry count and
+by an estimated byte budget. Expired entries are dropped lazily on read and
+by a periodic sweep that walks one-second expiry buckets, so the sweep only
+touches entries that actually expired.
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: Any, expires_at: float, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+def _sizeof(obj: Any, _seen: set[int] | None = None) -> int:
+    """Rough deep size of a cached value in bytes."""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            _sizeof(k, _seen) + _sizeof(v, _seen) for k, v in obj.items()
+        )
+    elif isinstance(obj, list | tuple | set | frozenset):
+        size += sum(_sizeof(item, _seen) for item in obj)
+    return size
+
+
+def namespace_of(key: str) -> str:
+    """Keys are ``<namespace>:<rest>``, see ``src.core.cache.Namespace``."""
+    return key.split(":", 1)[0]
+
+
+class TTLCache:
+    """Bounded LRU cache with per-entry TTL.
+
+    Entry count and bytes are also tracked per key namespace, and
+    ``on_remove(key, reason)`` is called for every entry that expires
+    (``"expired"``) or is pushed out by the limits (``"evicted"``).
+
+    Usage:
+        store = TTLCache(max_entries=1000, max_bytes=1024 * 1024)
+        store.set("key", {"a": 1}, ttl=60)
+        store.get("key")
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+        on_remove: Callable[[str, str], None] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._on_remove = on_remove
+        self._namespaces: dict[str, list[int]] = {}
+        self._data: OrderedDict[str, _Entry] = OrderedDict()
+        self._buckets: dict[int, set[str]] = {}
+        self._next_bucket = int(clock())
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def namespace_stats(self) -> dict[str, tuple[int, int]]:
+        """``{namespace: (entries, bytes)}`` of what is currently stored."""
+        return {ns: (n, size) for ns, (n, size) in self._namespaces.items()}
+
+    def get(self, key: str) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key, "expired")
+            return None
+        self._data.move_to_end(key)
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: float = 60) -> None:
+        size = _sizeof(key) + _sizeof(value)
+        if key in self._data:
+            self._remove(key)
+        if size > self.max_bytes:
+            return
+
+        expires_at = self._clock() + ttl
+        self._data[key] = _Entry(value, expires_at, size)
+        self._buckets.setdefault(int(expires_at), set()).add(key)
+        self._bytes += size
+        stats = self._namespaces.setdefault(namespace_of(key), [0, 0])
+        stats[0] += 1
+        stats[1] += size
+
+        while (
+            len(self._data) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._data))
+            self._remove(oldest, "evicted")
+
+    def incr(self, key: str, amount: int = 1, ttl: float = 60) -> int:
+        """Add to an integer entry; the TTL is only set when it is created."""
+        entry = self._data.get(key)
+        if entry is None or entry.expires_at <= self._clock():
+            self.set(key, amount, ttl)
+            return amount
+        entry.value += amount
+        self._data.move_to_end(key)
+        return entry.value
+
+    def delete(self, key: str) -> None:
+        if key in self._data:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._buckets.clear()
+        self._namespaces.clear()
+        self._bytes = 0
+
+    def sweep(self) -> int:
+        """Drop expired entries, return how many were removed."""
+        # Only fully elapsed seconds are swept; the current one may still
+        # hold live entries and is revisited on the next run.
+        current = int(self._clock())
+        removed = 0
+        for bucket in range(self._next_bucket, current):
+            for key in list(self._buckets.get(bucket, ())):
+                self._remove(key, "expired")
+                removed += 1
+        self._next_bucket = max(self._next_bucket, current)
+        return removed
+
+    def _remove(self, key: str, reason: str | None = None) -> None:
+        entry = self._data.pop(key)
+        self._bytes -= entry.size
+        namespace = namespace_of(key)
+        stats = self._namespaces[namespace]
+        stats[0] -= 1
+        stats[1] -= entry.size
+        if not stats[0]:
+            del self._namespaces[namespace]
+        if reason is not None and self._on_remove is not None:
+            self._on_remove(key, reason)
+        bucket = self._buckets.get(int(entry.expires_at))
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[int(entry.expires_at)]
+
+
+class MemoryBackend:
+    """Per-process ``CacheBackend`` on top of ``TTLCache``.
+
+    Tag generations live in a plain dict next to the LRU so they can never be
+    evicted and reset while keys built from an old version are still live.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        on_remove: Callable[[str, str], None] | None = None,
+    ):
+        self.store = TTLCache(
+            max_entries=max_entries, max_bytes=max_bytes, on_remove=on_remove
+        )
+        self._tags: dict[str, int] = {}
+
+    async def get(self, key: str) -> Any | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self.store.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self.store.delete(key)
+
+    async def incr(self, key: str, amount: int = 1, ttl: float = 60) -> int:
+        return self.store.incr(f"counter:{key}", amount, ttl)
+
+    async def generations(self, tags: Sequence[str]) -> list[int]:
+        return [self._tags.get(tag, 0) for tag in tags]
+
+    async def invalidate_tag(self, tag: str) -> None:
+        self._tags[tag] = self._tags.get(tag, 0) + 1
+
+    async def clear(self) -> None:
+        self.store.clear()
+        self._tags.clear()
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,190 @@
+"""Shared ``CacheBackend`` speaking the Redis protocol (RESP2).
+
+A deliberately small client: a fixed-size pool of asyncio connections and
+the handful of commands the cache needs, so any Redis-compatible server
+(Redis, Valkey, KeyDB, Dragonfly) can back the cache of all workers.
+
+Needs Redis 7.0+ for ``PEXPIRE ... NX``. Value keys always carry a TTL
+while tag generations do not, so run the server with a ``volatile-*`` eviction
+policy to keep tag generations from being evicted.
+"""
+
+import asyncio
+import pickle
+from collections.abc import Sequence
+from typing import Any
+from urllib.parse import urlparse
+
+from src.core.cache.backend import CacheError
+
+Command = Sequence[str | bytes | int]
+
+
+def _encode(command: Command) -> bytes:
+    parts = [b"*%d\r\n" % len(command)]
+    for arg in command:
+        if isinstance(arg, str):
+            arg = arg.encode()
+        elif isinstance(arg, int):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readuntil(b"\r\n")
+    prefix, payload = line[:1], line[1:-2]
+    if prefix == b"+":
+        return payload.decode()
+    if prefix == b"-":
+        raise CacheError(payload.decode())
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length == -1:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if prefix == b"*":
+        length = int(payload)
+        if length == -1:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+    raise CacheError(f"Unexpected reply prefix: {prefix!r}")
+
+
+class _Connection:
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        self.reader = reader
+        self.writer = writer
+
+    async def execute(self, *commands: Command) -> list[Any]:
+        """Send commands in one write (pipelined), return their replies."""
+        self.writer.write(b"".join(_encode(c) for c in commands))
+        await self.writer.drain()
+        return [await _read_reply(self.reader) for _ in commands]
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class RedisBackend:
+    """``CacheBackend`` shared between processes through a Redis server."""
+
+    def __init__(
+        self,
+        url: str,
+        key_prefix: str = "",
+        pool_size: int = 10,
+        timeout: float = 1.0,
+    ):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.key_prefix = key_prefix
+        self.timeout = timeout
+        self._idle: list[_Connection] = []
+        self._slots = asyncio.Semaphore(pool_size)
+
+    async def _connect(self) -> _Connection:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        conn = _Connection(reader, writer)
+        if self.password:
+            await conn.execute(("AUTH", self.password))
+        if self.db:
+            await conn.execute(("SELECT", self.db))
+        return conn
+
+    async def execute(self, *commands: Command) -> list[Any]:
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else None
+            try:
+                async with asyncio.timeout(self.timeout):
+                    if conn is None:
+                        conn = await self._connect()
+                    replies = await conn.execute(*commands)
+            except (
+                OSError,
+                TimeoutError,
+                asyncio.IncompleteReadError,
+                CacheError,
+            ) as e:
+                # Replies may be left unread after a failure, drop the
+                # connection instead of returning it to the pool.
+                if conn is not None:
+                    conn.close()
+                if isinstance(e, CacheError):
+                    raise
+                raise CacheError(f"Cache server error: {e!r}") from e
+            self._idle.append(conn)
+            return replies
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}{key}"
+
+    def _counter_key(self, key: str) -> str:
+        return f"{self.key_prefix}counter:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.key_prefix}tag:{tag}"
+
+    async def get(self, key: str) -> Any | None:
+        (raw,) = await self.execute(("GET", self._key(key)))
+        if raw is None:
+            return None
+        try:
+            return pickle.loads(raw)
+        except Exception as e:
+            # Corrupt entry, or written by code whose classes changed since
+            raise CacheError(f"Cannot unpickle cached value: {e!r}") from e
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        await self.execute(
+            ("SET", self._key(key), data, "PX", max(int(ttl * 1000), 1))
+        )
+
+    async def delete(self, key: str) -> None:
+        await self.execute(("DEL", self._key(key)))
+
+    async def incr(self, key: str, amount: int = 1, ttl: float = 60) -> int:
+        full_key = self._counter_key(key)
+        ttl_ms = max(int(ttl * 1000), 1)
+        # NX only sets the expiry when the counter has none, i.e. was just
+        # created by INCRBY.
+        value, _ = await self.execute(
+            ("INCRBY", full_key, amount), ("PEXPIRE", full_key, ttl_ms, "NX")
+        )
+        return int(value)
+
+    async def generations(self, tags: Sequence[str]) -> list[int]:
+        if not tags:
+            return []
+        (raws,) = await self.execute(
+            ("MGET", *(self._tag_key(tag) for tag in tags))
+        )
+        return [int(raw) if raw is not None else 0 for raw in raws]
+
+    async def invalidate_tag(self, tag: str) -> None:
+        await self.execute(("INCR", self._tag_key(tag)))
+
+    async def clear(self) -> None:
+        """Delete every key under this backend's prefix."""
+        cursor = b"0"
+        while True:
+            ((cursor, keys),) = await self.execute(
+                ("SCAN", cursor, "MATCH", f"{self.key_prefix}*", "COUNT", 500)
+            )
+            if keys:
+                await self.execute(("DEL", *keys))
+            if cursor == b"0":
+                break
+
+    async def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
@@ -0,0 +1,31 @@
+"""Cache metrics, labelled by key namespace."""
+
+from src.core.cache.memory import namespace_of
+from src.core.metrics import Counter, Histogram
+
+HITS = Counter("cache_hits_total", "Cache lookups served", ["namespace"])
+MISSES = Counter("cache_misses_total", "Cache lookups missed", ["namespace"])
+STALE_HITS = Counter(
+    "cache_stale_hits_total",
+    "Stale values served while refreshing in background",
+    ["namespace"],
+)
+EXPIRATIONS = Counter(
+    "cache_expirations_total", "Entries dropped after their TTL", ["namespace"]
+)
+EVICTIONS = Counter(
+    "cache_evictions_total",
+    "Entries evicted by the entry/byte limits",
+    ["namespace"],
+)
+RECOMPUTE_SECONDS = Histogram(
+    "cache_recompute_seconds",
+    "Time spent computing values on cache misses and refreshes",
+    ["namespace"],
+)
+
+
+def record_removal(key: str, reason: str) -> None:
+    """``TTLCache.on_remove`` hook."""
+    counter = EXPIRATIONS if reason == "expired" else EVICTIONS
+    counter.inc(namespace=namespace_of(key))
@@ -1,3 +1,6 @@
+from typing import Literal
+
+from pydantic import PositiveFloat, PositiveInt
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -26,10 +29,111 @@ class Settings(BaseSettings):
             f"@{self.DB_HOST}:{port}/{self.DB_NAME}"
         )
 
+    # Connection pool of each worker process: POOL_SIZE connections kept
+    # open, up to MAX_OVERFLOW more under load; a checkout waits at most
+    # POOL_TIMEOUT for one before failing. Connections older than
+    # POOL_RECYCLE are replaced (-1 never), PRE_PING tests each on checkout
+    # so connections dropped by the server are not handed to requests.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # asyncpg prepared statements cached per connection; 0 disables the
+    # cache (needed behind pgbouncer in transaction mode)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Server-side statement_timeout of app connections, 0 disables it
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+
     # Security
     SECRET_KEY: str = "change-me-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Embed the user's organization roles into access tokens, so requests
+    # are authorized without membership lookups while the roles are current
+    # (checked against the membership version, read from the DB on every
+    # request unless CACHE_BACKEND=redis)
+    ACCESS_TOKEN_ROLE_CLAIMS: bool = False
+    # Password hashing (passlib scheme and its cost: log2 rounds for bcrypt,
+    # iterations for pbkdf2). Hashes made with another cost or a legacy
+    # scheme are rehashed on the next successful login.
+    PASSWORD_HASH_SCHEME: str = "bcrypt"
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_LEGACY_SCHEMES: list[str] = []
+    # bcrypt runs on a pool of PASSWORD_HASH_WORKERS threads; once
+    # PASSWORD_HASH_MAX_QUEUE more jobs wait, login/register answer 503.
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    # Verified access/refresh tokens cached in-process until they expire
+    JWT_CACHE_MAX_ENTRIES: int = 10_000
+    # Key for /api/v1/admin/* and /metrics (X-Admin-Key header), empty
+    # disables them
+    ADMIN_API_KEY: str = ""
+
+    # Rate limiting per (X-Organization-Id, user, route): buckets of BURST
+    # requests refilled at RATE per second. ROUTES overrides the budget of
+    # "METHOD /path" (numeric ids as {id}) as [rate, burst].
+    # TENANT_MULTIPLIERS scales the budgets of an organization id (keys in
+    # canonical form, "1" not "01"). Rates, bursts and multipliers must be
+    # positive. SHARED enforces budgets across workers through the cache
+    # backend (use with CACHE_BACKEND=redis).
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_RATE: PositiveFloat = 20
+    RATE_LIMIT_BURST: PositiveInt = 100
+    RATE_LIMIT_ROUTES: dict[str, tuple[PositiveFloat, PositiveInt]] = {
+        "POST /api/v1/auth/login": (1, 10),
+    }
+    RATE_LIMIT_TENANT_MULTIPLIERS: dict[str, PositiveFloat] = {}
+    RATE_LIMIT_SHARED: bool = False
+
+    # Cache
+    #
+    # "memory" keeps a cache per worker process, "redis" shares one between
+    # all workers (any Redis-protocol server, 7.0+).
+    CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    CACHE_REDIS_URL: str = "redis://redis:6379/0"
+    CACHE_REDIS_POOL_SIZE: int = 10
+    CACHE_REDIS_TIMEOUT_SECONDS: float = 1.0
+    CACHE_KEY_PREFIX: str = "crm:"
+    CACHE_MAX_ENTRIES: int = 10_000
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_SWEEP_INTERVAL_SECONDS: int = 30
+    # Analytics is invalidated on deal writes. Past the soft TTL a cached
+    # result is served stale while one background refresh runs; past the
+    # hard TTL requests wait for a synchronous recompute.
+    ANALYTICS_CACHE_SOFT_TTL_SECONDS: int = 60
+    ANALYTICS_CACHE_TTL_SECONDS: int = 3600
+    # Authenticated user snapshots, dropped when the user is edited in the
+    # admin (in all workers with the redis backend, else within the TTL).
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    # Organization roles and membership versions, dropped on member
+    # add/role change/removal. Only the redis backend carries that to all
+    # workers: with the memory backend entries live at most LOCAL_TTL, so
+    # other workers see a removal or demotion within seconds.
+    MEMBERSHIP_CACHE_TTL_SECONDS: int = 300
+    MEMBERSHIP_CACHE_LOCAL_TTL_SECONDS: PositiveFloat = 5
+    # Analytics of the TOP_N most recently active organizations is warmed on
+    # startup and then every interval, by one worker at a time (advisory
+    # lock): with the memory backend only that worker's cache is warm, use
+    # redis to share it. Entries are recomputed in place, stale or not, so
+    # CONCURRENCY caps the DB connections the warmer holds (plus one for
+    # the lock), keep it well below the pool size.
+    ANALYTICS_WARMER_ENABLED: bool = True
+    ANALYTICS_WARMER_TOP_N: int = 50
+    ANALYTICS_WARMER_CONCURRENCY: int = 2
+    ANALYTICS_WARMER_INTERVAL_SECONDS: int = 300
+    # Deal rollups of every organization are copied into the snapshot of the
+    # current UTC day on startup and then every interval (by one worker at a
+    # time), BATCH_SIZE organizations per transaction; the last run of a
+    # day is the day's snapshot, read by analytics with as_of.
+    PIPELINE_SNAPSHOT_ENABLED: bool = True
+    PIPELINE_SNAPSHOT_INTERVAL_SECONDS: int = 3600
+    PIPELINE_SNAPSHOT_BATCH_SIZE: int = 500
+
+    # Lists
+    # count=capped stops counting past LIST_COUNT_CAP matching items and
+    # reports the cap as an inexact total ("1000+")
+    LIST_COUNT_CAP: int = 1000
 
     model_config = SettingsConfigDict(case_sensitive=True, env_file=".env")
 
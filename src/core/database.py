@@ -1,13 +1,78 @@
+"""Async engine, session factory and the declarative base.
+
+The engine's pool is an ``InstrumentedPool``: checkout waits, checkout
+timeouts and the connections in use are exported as metrics, so requests
+queueing for a connection show up on ``/metrics``.
+"""
+
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from src.core.config import settings
+from src.core.metrics import Counter, Gauge, Histogram
+
+POOL_WAIT_SECONDS = Histogram(
+    "db_pool_wait_seconds",
+    "Time to check out a connection from the pool, opening one included",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0),
+)
+POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after waiting DB_POOL_TIMEOUT_SECONDS",
+)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool timing every checkout into ``POOL_WAIT_SECONDS``."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_WAIT_SECONDS.observe(time.perf_counter() - started)
+
+
+def engine_options() -> dict[str, Any]:
+    """Pool and connection options of ``create_async_engine`` from
+    ``settings``."""
+    server_settings = {}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        server_settings["statement_timeout"] = str(
+            settings.DB_STATEMENT_TIMEOUT_MS
+        )
+    return {
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": server_settings,
+        },
+    }
 
-engine = create_async_engine(settings.SQLALCHEMY_DATABASE_URI, echo=False)
+
+engine = create_async_engine(
+    settings.SQLALCHEMY_DATABASE_URI, echo=False, **engine_options()
+)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -17,10 +82,43 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def _pool_connections() -> dict[tuple[str, ...], float]:
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return {}
+    return {("in_use",): pool.checkedout(), ("idle",): pool.checkedin()}
+
+
+POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Connections of the app pool, checked out (in_use) or idle",
+    ["state"],
+    callback=_pool_connections,
+)
+
+
 class Base(DeclarativeBase):
     pass
 
 
+@asynccontextmanager
+async def try_advisory_lock(
+    session_factory: async_sessionmaker[AsyncSession], name: str
+) -> AsyncIterator[bool]:
+    """Try to take the Postgres advisory lock ``name``; yield whether this
+    process holds it.
+
+    The lock lives in a transaction open for the whole block, so of many
+    workers running the same periodic job only one runs it at a time and
+    a crashed holder releases it with its connection.
+    """
+    async with session_factory() as session, session.begin():
+        acquired = await session.scalar(
+            select(func.pg_try_advisory_xact_lock(func.hashtext(name)))
+        )
+        yield bool(acquired)
+
+
 async def get_db():
     async with AsyncSessionLocal() as session:
         yield session
@@ -40,3 +40,10 @@ class ValidationError(AppException):
 
     def __init__(self, message: str):
         super().__init__(message, status_code=400)
+
+
+class ServiceUnavailableError(AppException):
+    """Temporarily overloaded, the client should retry later."""
+
+    def __init__(self, message: str = "Service temporarily unavailable"):
+        super().__init__(message, status_code=503)
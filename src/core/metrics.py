@@ -0,0 +1,185 @@
+"""In-process metrics with Prometheus text exposition.
+
+A small dependency-free subset of the Prometheus client: counters, gauges
+(set directly or computed on scrape) and histograms, all with labels.
+Every metric registers itself in ``REGISTRY``, rendered by ``/metrics``.
+"""
+
+import math
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any
+
+Labels = tuple[str, ...]
+Sample = tuple[str, dict[str, str], float]
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: "Registry | None" = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        (registry or REGISTRY).register(self)
+
+    def _key(self, labels: dict[str, str]) -> Labels:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {labels}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: Labels) -> dict[str, str]:
+        return dict(zip(self.labelnames, key, strict=True))
+
+    def samples(self) -> Iterator[Sample]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterator[Sample]:
+        for key, value in self._values.items():
+            yield self.name, self._labels(key), value
+
+
+class Gauge(Counter):
+    """Gauge set by the caller, or computed on scrape by ``callback``.
+
+    The callback returns ``{label values tuple: value}``.
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        *args: Any,
+        callback: Callable[[], dict[Labels, float]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.callback = callback
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        if self.callback is not None:
+            return self.callback().get(self._key(labels), 0)
+        return super().value(**labels)
+
+    def samples(self) -> Iterator[Sample]:
+        values = self.callback() if self.callback is not None else self._values
+        for key, value in values.items():
+            yield self.name, self._labels(key), value
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        *args: Any,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = (*sorted(buckets), math.inf)
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        counts = self._counts.setdefault(key, [0] * len(self.buckets))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+        self._sums[key] = self._sums.get(key, 0) + value
+
+    def summary(self, **labels: str) -> dict[str, float]:
+        """Count, sum and mean of observations, for JSON endpoints."""
+        key = self._key(labels)
+        count = self._counts.get(key, [0])[-1]
+        total = self._sums.get(key, 0)
+        return {
+            "count": count,
+            "sum": round(total, 6),
+            "mean": round(total / count, 6) if count else 0,
+        }
+
+    def samples(self) -> Iterator[Sample]:
+        for key, counts in self._counts.items():
+            labels = self._labels(key)
+            for bound, count in zip(self.buckets, counts, strict=True):
+                le = "+Inf" if bound == math.inf else repr(bound)
+                yield f"{self.name}_bucket", {**labels, "le": le}, count
+            yield f"{self.name}_count", labels, counts[-1]
+            yield f"{self.name}_sum", labels, self._sums[key]
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                if labels:
+                    rendered = ",".join(
+                        f'{k}="{_escape(v)}"' for k, v in labels.items()
+                    )
+                    lines.append(f"{name}{{{rendered}}} {value}")
+                else:
+                    lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+REGISTRY = Registry()
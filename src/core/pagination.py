@@ -0,0 +1,215 @@
+"""Keyset (cursor) pagination.
+
+``OFFSET`` makes the database walk past every skipped row, so deep pages get
+linearly slower. A cursor names the last row of a page by its sort key and
+id instead; the next page is an index range scan starting right after it,
+the same cost at any depth.
+
+Tokens are opaque to clients (URL-safe base64 of JSON) and tied to the
+ordering they were issued for.
+
+Totals are counted with a ``CountStrategy``: exactly, up to a cap, or from
+the planner's row estimate, which costs no scan at all.
+"""
+
+import base64
+import decimal
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import QueryableAttribute
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import ClauseElement
+
+from src.core.config import settings
+from src.core.exceptions import ValidationError
+
+
+class CountStrategy(str, Enum):  # noqa: UP042
+    EXACT = "exact"
+    CAPPED = "capped"
+    ESTIMATED = "estimated"
+
+
+def _dump(value: Any) -> tuple[str, Any]:
+    if value is None:
+        return "none", None
+    if isinstance(value, datetime):
+        return "datetime", value.isoformat()
+    if isinstance(value, Decimal):
+        return "decimal", str(value)
+    if isinstance(value, int | str):
+        return type(value).__name__, value
+    raise TypeError(f"Unsupported cursor key: {value!r}")
+
+
+def _load(kind: str, value: Any) -> Any:
+    if kind == "datetime":
+        return datetime.fromisoformat(value)
+    if kind == "decimal":
+        return Decimal(value)
+    if kind in ("int", "str") and type(value).__name__ == kind:
+        return value
+    if kind == "none" and value is None:
+        return None
+    raise ValueError(f"Unsupported cursor key type: {kind}")
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    """Position after a row: its sort key and id, for ordering ``sort``."""
+
+    sort: str
+    key: Any
+    id: int
+
+    def encode(self) -> str:
+        kind, value = _dump(self.key)
+        data = json.dumps(
+            [self.sort, kind, value, self.id], separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str, sort: str) -> "Cursor":
+        """Parse a token issued for ``sort``; raise ``ValidationError``."""
+        try:
+            data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            token_sort, kind, value, id = json.loads(data)
+            key = _load(kind, value)
+            if not isinstance(id, int):
+                raise ValueError("Cursor id must be an integer")
+        except (ValueError, TypeError, decimal.InvalidOperation) as e:
+            raise ValidationError("Invalid cursor") from e
+        if token_sort != sort:
+            raise ValidationError("Cursor was issued for another ordering")
+        return cls(sort, key, id)
+
+
+@dataclass(slots=True)
+class Page:
+    """A page of a list, its total and the cursor to the next page, if any."""
+
+    items: Sequence[Any]
+    total: int | None = None
+    next_cursor: str | None = None
+    total_is_exact: bool = True
+
+
+def keyset(
+    stmt: Select[Any],
+    key: ColumnElement[Any] | QueryableAttribute[Any],
+    id: QueryableAttribute[int],
+    descending: bool,
+    after: Cursor | None = None,
+) -> Select[Any]:
+    """Order ``stmt`` by ``(key, id)``, keeping only rows after ``after``.
+
+    The id breaks ties between equal keys, so every row has one position.
+    """
+    if after is not None:
+        position = tuple_(key, id)
+        bound = tuple_(after.key, after.id)
+        stmt = stmt.where(position < bound if descending else position > bound)
+    if descending:
+        return stmt.order_by(key.desc(), id.desc())
+    return stmt.order_by(key.asc(), id.asc())
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, binds processed as usual."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]):
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(
+    element: _Explain, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_count(session: AsyncSession, matching: Select[Any]) -> int:
+    """Rows the planner expects ``matching`` to return, without running it."""
+    result = await session.execute(_Explain(matching))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _count(matching: Select[Any], strategy: CountStrategy) -> Select[Any]:
+    if strategy is CountStrategy.CAPPED:
+        matching = matching.limit(settings.LIST_COUNT_CAP + 1)
+    return select(func.count()).select_from(matching.subquery())
+
+
+def _total(count: int, strategy: CountStrategy) -> tuple[int, bool]:
+    if strategy is CountStrategy.CAPPED and count > settings.LIST_COUNT_CAP:
+        return settings.LIST_COUNT_CAP, False
+    return count, True
+
+
+async def fetch_page(
+    session: AsyncSession,
+    stmt: Select[Any],
+    matching: Select[Any],
+    count: CountStrategy | None,
+    first: bool,
+) -> Page:
+    """Run a page query and count the rows of ``matching`` (the filtered
+    query without ordering or paging) with strategy ``count``.
+
+    Exact and capped counts ride along as an uncorrelated scalar subquery
+    column (run once by Postgres), so the page and the total take one round
+    trip. A window ``count(*) OVER ()`` would count only the rows after a
+    cursor. ``count=None`` skips the total.
+    """
+    if count is None or count is CountStrategy.ESTIMATED:
+        result = await session.execute(stmt)
+        items = result.scalars().all()
+        if count is None:
+            return Page(items)
+        total = await estimate_count(session, matching)
+        return Page(items, total, total_is_exact=False)
+
+    total_stmt = _count(matching, count)
+    result = await session.execute(
+        stmt.add_columns(total_stmt.scalar_subquery())
+    )
+    rows = result.all()
+    if rows:
+        total, exact = _total(rows[0][1], count)
+        return Page([row[0] for row in rows], total, total_is_exact=exact)
+    if first:
+        return Page([], 0)
+    # Past the last page no row carries the count
+    total, exact = _total(await session.scalar(total_stmt) or 0, count)
+    return Page([], total, total_is_exact=exact)
+
+
+def next_cursor(
+    items: Sequence[Any], limit: int, sort: str, key: str | None
+) -> str | None:
+    """Cursor after the last item of a full page, ``None`` on the last page.
+
+    ``key`` is the attribute holding the sort key of an item, ``None`` when
+    the key is computed by the query and the repository looks it up by id.
+    """
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    value = getattr(last, key) if key is not None else None
+    return Cursor(sort, value, last.id).encode()
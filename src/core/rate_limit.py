@@ -0,0 +1,182 @@
+"""Per-tenant, per-user, per-route rate limiting (ASGI middleware).
+
+Every API request takes a token from the bucket of its
+``(X-Organization-Id, user, route)``; anonymous requests count per client
+address. A bucket holds ``burst`` tokens and refills at ``rate`` tokens per
+second; route budgets and per-organization multipliers come from
+``Settings``. Rejected requests get ``429`` with ``Retry-After``.
+
+Buckets live in process memory by default. With ``RATE_LIMIT_SHARED`` the
+budget is enforced across workers through the cache backend's atomic
+``incr``: a fixed window of ``burst / rate`` seconds admitting ``burst``
+requests, the same average rate as the bucket with coarser smoothing.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import re
+import time
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core import cache
+from src.core.cache.backend import CacheError
+from src.core.cache.memory import TTLCache
+from src.core.config import settings
+from src.core.metrics import Counter
+from src.core.security import decode_token
+
+logger = logging.getLogger(__name__)
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+REJECTED = Counter(
+    "rate_limit_rejected_total",
+    "Requests rejected by the rate limiter, by route",
+    ["route"],
+)
+
+
+class TokenBuckets:
+    """In-process token buckets; an idle bucket is dropped once full."""
+
+    def __init__(self, max_entries: int = 100_000):
+        self._buckets = TTLCache(max_entries=max_entries)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def take(
+        self, key: str, rate: float, burst: int, now: float | None = None
+    ) -> float:
+        """Take one token; return 0 if allowed, else seconds to wait."""
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens, updated = float(burst), now
+        else:
+            tokens, updated = bucket
+            tokens = min(burst, tokens + (now - updated) * rate)
+
+        if tokens < 1:
+            self._buckets.set(key, (tokens, now), ttl=(burst - tokens) / rate)
+            return (1 - tokens) / rate
+        tokens -= 1
+        self._buckets.set(key, (tokens, now), ttl=(burst - tokens) / rate)
+        return 0
+
+
+async def _take_shared(key: str, rate: float, burst: int) -> float:
+    window = burst / rate
+    now = time.time()
+    index = int(now // window)
+    count = await cache.incr(f"ratelimit:{key}:{index}", ttl=window)
+    if count <= burst:
+        return 0
+    return (index + 1) * window - now
+
+
+def _budget(route: str, organization: str) -> tuple[float, int]:
+    rate, burst = settings.RATE_LIMIT_ROUTES.get(
+        route, (settings.RATE_LIMIT_RATE, settings.RATE_LIMIT_BURST)
+    )
+    scale = settings.RATE_LIMIT_TENANT_MULTIPLIERS.get(organization, 1.0)
+    return rate * scale, max(1, int(burst * scale))
+
+
+def _route_of(scope: Scope) -> str:
+    """``METHOD /path`` with numeric ids replaced by ``{id}``.
+
+    All path parameters of the API are ids, so this names the route
+    without running the router, e.g. ``GET /api/v1/deals/{id}``.
+    """
+    path = _ID_SEGMENT.sub("/{id}", scope["path"])
+    return f"{scope['method']} {path}"
+
+
+def _organization_of(value: bytes | None) -> str:
+    """Organization id in canonical form, ``-`` when absent or invalid.
+
+    The API parses the header as an integer, so "01", " 1" and "+1" all
+    reach organization 1 and must share its bucket.
+    """
+    try:
+        return str(int(value)) if value is not None else "-"
+    except ValueError:
+        return "-"
+
+
+def _caller(scope: Scope) -> tuple[str, str]:
+    """Organization (``-`` when absent) and user id, or the client address
+    for anonymous requests such as login."""
+    headers = dict(scope["headers"])
+    organization = _organization_of(headers.get(b"x-organization-id"))
+    client = scope.get("client")
+    user = f"ip:{client[0]}" if client else "-"
+    authorization = headers.get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        payload = decode_token(token)
+        if payload and payload.get("sub"):
+            user = str(payload["sub"])
+    return organization, user
+
+
+_buckets = TokenBuckets()
+
+
+def reset() -> None:
+    """Drop all in-process buckets (for tests)."""
+    _buckets.clear()
+
+
+class RateLimitMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.buckets = _buckets
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or not settings.RATE_LIMIT_ENABLED
+            or not scope["path"].startswith(settings.API_V1_STR)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        route = _route_of(scope)
+        organization, user = _caller(scope)
+        rate, burst = _budget(route, organization)
+        raw_key = f"{organization}:{user}:{route}"
+        key = hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
+
+        if settings.RATE_LIMIT_SHARED:
+            try:
+                retry_after = await _take_shared(key, rate, burst)
+            except CacheError as e:
+                # Fail open: a cache outage must not take the API down
+                logger.warning("Rate limit backend failed: %s", e)
+                retry_after = 0
+        else:
+            retry_after = self.buckets.take(key, rate, burst)
+
+        if retry_after <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        REJECTED.inc(route=route)
+        body = json.dumps({"error": "Rate limit exceeded"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(math.ceil(retry_after)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -1,12 +1,36 @@
+import asyncio
+import copy
+import hashlib
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from jose import jwt
 from passlib.context import CryptContext
 
+from src.core.cache.memory import TTLCache
 from src.core.config import settings
+from src.core.exceptions import ServiceUnavailableError
+from src.core.metrics import Counter, Gauge, Histogram
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _password_context() -> CryptContext:
+    """Hash with the configured scheme and cost; legacy schemes still verify
+    and, like hashes with another cost, are reported by ``needs_update``."""
+    scheme = settings.PASSWORD_HASH_SCHEME
+    return CryptContext(
+        schemes=[scheme, *settings.PASSWORD_HASH_LEGACY_SCHEMES],
+        deprecated="auto",
+        **{f"{scheme}__rounds": settings.PASSWORD_HASH_ROUNDS},
+    )
+
+
+pwd_context = _password_context()
+
+# Verified payloads by token digest, each kept until the token's ``exp``
+_verified_tokens = TTLCache(max_entries=settings.JWT_CACHE_MAX_ENTRIES)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -17,6 +41,85 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def password_needs_update(hashed_password: str) -> bool:
+    """True if the hash uses an outdated scheme or cost (cheap, no hashing)."""
+    return pwd_context.needs_update(hashed_password)
+
+
+# bcrypt releases the GIL, so a few threads hash in parallel while the event
+# loop keeps serving other requests. Jobs past the queue limit are rejected
+# instead of piling up behind a login storm.
+_password_pool = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_password_jobs = 0
+
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Time spent hashing or verifying a password, by operation",
+    ["operation"],
+)
+PASSWORD_HASH_WAIT_SECONDS = Histogram(
+    "password_hash_wait_seconds",
+    "Time a password job waited for a free hashing thread",
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password jobs rejected because the hashing queue was full",
+)
+PASSWORD_HASH_JOBS = Gauge(
+    "password_hash_jobs",
+    "Password jobs running or waiting for a hashing thread",
+    callback=lambda: {(): _password_jobs},
+)
+
+
+async def _run_password_job(
+    operation: str, func: Callable[..., Any], *args: Any
+) -> Any:
+    global _password_jobs
+    limit = settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE
+    if _password_jobs >= limit:
+        PASSWORD_HASH_REJECTED.inc()
+        raise ServiceUnavailableError(
+            "Too many authentication requests, try again later"
+        )
+
+    submitted = time.perf_counter()
+
+    def job() -> Any:
+        started = time.perf_counter()
+        PASSWORD_HASH_WAIT_SECONDS.observe(started - submitted)
+        try:
+            return func(*args)
+        finally:
+            PASSWORD_HASH_SECONDS.observe(
+                time.perf_counter() - started, operation=operation
+            )
+
+    _password_jobs += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_pool, job)
+    finally:
+        _password_jobs -= 1
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    """``verify_password`` on the bounded hashing pool."""
+    return await _run_password_job(
+        "verify", verify_password, plain_password, hashed_password
+    )
+
+
+async def hash_password_async(password: str) -> str:
+    """``hash_password`` on the bounded hashing pool."""
+    return await _run_password_job("hash", hash_password, password)
+
+
 def create_access_token(
     data: dict[str, Any], expires_delta: timedelta | None = None
 ) -> str:
@@ -42,10 +145,27 @@ def create_refresh_token(
 
 
 def decode_token(token: str) -> dict[str, Any] | None:
+    """Verify a token and return its payload, None if invalid or expired.
+
+    Verified payloads are cached in-process until the token expires, so a
+    token sent again skips signature and claim checks. Callers get a deep
+    copy, nested claims included, so they cannot alter the cached one.
+    """
+    key = "jwt:" + hashlib.sha256(token.encode()).hexdigest()
+    payload = _verified_tokens.get(key)
+    if payload is not None:
+        return copy.deepcopy(payload)
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        return payload
     except jwt.JWTError:
         return None
+
+    exp = payload.get("exp")
+    if isinstance(exp, int | float):
+        ttl = exp - time.time()
+        if ttl > 0:
+            _verified_tokens.set(key, payload, ttl=ttl)
+    return copy.deepcopy(payload)
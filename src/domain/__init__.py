@@ -10,6 +10,7 @@ from src.domain.organization_rules import (
     can_manage_all,
     can_modify_settings,
 )
+from src.domain.principal import Membership, Principal, TenantContext
 from src.domain.task_rules import ensure_due_date_not_in_past
 
 __all__ = [
@@ -17,6 +18,9 @@ __all__ = [
     "DealStatus",
     "DealStage",
     "ActivityType",
+    "Principal",
+    "Membership",
+    "TenantContext",
     "STAGE_ORDER",
     "ensure_status_change_is_valid",
     "ensure_stage_change_is_valid",
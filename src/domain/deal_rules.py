@@ -10,7 +10,8 @@ from src.core.exceptions import ForbiddenError, ValidationError
 from src.domain.enums import DealStage, DealStatus, UserRole
 
 if TYPE_CHECKING:
-    from src.models import Deal, OrganizationMember
+    from src.domain.principal import TenantContext
+    from src.models import Deal
 
 
 STAGE_ORDER: Sequence[DealStage] = [
@@ -40,7 +41,7 @@ def ensure_status_change_is_valid(
 def ensure_stage_change_is_valid(
     deal: Deal,
     new_stage: DealStage,
-    member: OrganizationMember,
+    ctx: TenantContext,
 ) -> None:
     """Validate stage transition rules for a deal.
 
@@ -50,7 +51,7 @@ def ensure_stage_change_is_valid(
     old_idx = STAGE_ORDER.index(deal.stage)
     new_idx = STAGE_ORDER.index(new_stage)
 
-    if new_idx < old_idx and member.role not in [
+    if new_idx < old_idx and ctx.role not in [
         UserRole.OWNER,
         UserRole.ADMIN,
     ]:
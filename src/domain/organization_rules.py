@@ -7,16 +7,16 @@ from typing import TYPE_CHECKING
 from src.domain.enums import UserRole
 
 if TYPE_CHECKING:
-    from src.models.auth import OrganizationMember
+    from src.domain.principal import TenantContext
 
 
-def can_manage_all(member: OrganizationMember) -> bool:
+def can_manage_all(ctx: TenantContext) -> bool:
     """Return True if member can manage all entities in an organization."""
 
-    return member.role in (UserRole.OWNER, UserRole.ADMIN, UserRole.MANAGER)
+    return ctx.role in (UserRole.OWNER, UserRole.ADMIN, UserRole.MANAGER)
 
 
-def can_modify_settings(member: OrganizationMember) -> bool:
+def can_modify_settings(ctx: TenantContext) -> bool:
     """Return True if member can modify organization-level settings."""
 
-    return member.role in (UserRole.OWNER, UserRole.ADMIN)
+    return ctx.role in (UserRole.OWNER, UserRole.ADMIN)
@@ -0,0 +1,52 @@
+"""Authenticated principal and its organization memberships."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.domain.enums import UserRole
+
+if TYPE_CHECKING:
+    from src.models.auth import OrganizationMember, User
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Immutable snapshot of a user, safe to cache and share between
+    requests (unlike ORM instances bound to a session)."""
+
+    id: int
+    email: str
+    name: str
+
+    @classmethod
+    def from_user(cls, user: User) -> Principal:
+        return cls(id=user.id, email=user.email, name=user.name)
+
+
+@dataclass(frozen=True, slots=True)
+class Membership:
+    """Snapshot of a user's role in an organization, safe to cache."""
+
+    organization_id: int
+    user_id: int
+    role: UserRole
+
+    @classmethod
+    def from_member(cls, member: OrganizationMember) -> Membership:
+        return cls(
+            organization_id=member.organization_id,
+            user_id=member.user_id,
+            role=member.role,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TenantContext:
+    """Who acts in which organization with which role, resolved once per
+    request by the API layer and passed to services."""
+
+    user: Principal
+    organization_id: int
+    role: UserRole
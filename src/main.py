@@ -1,17 +1,24 @@
+import asyncio
+import contextlib
 import logging
 import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from sqlalchemy import text
 
 from src.admin import setup_admin
+from src.api.deps import require_admin
+from src.core import cache
 from src.core.database import AsyncSessionLocal
 from src.core.exceptions import AppException
+from src.core.metrics import REGISTRY
+from src.core.rate_limit import RateLimitMiddleware
 from src.infrastructure import settings
 from src.interface import router as api_router
+from src.services.analytics import run_snapshotter, run_warmer
 
 __version__ = "1.0.0"
 
@@ -29,8 +36,39 @@ async def lifespan(app: FastAPI):
     global _start_time
     _start_time = time.time()
     logger.info("Starting LoveKuhnya Tenant CRM API v%s...", __version__)
+    sweeper = asyncio.create_task(
+        cache.run_sweeper(settings.CACHE_SWEEP_INTERVAL_SECONDS)
+    )
+    background = [sweeper]
+    if settings.ANALYTICS_WARMER_ENABLED:
+        background.append(
+            asyncio.create_task(
+                run_warmer(
+                    AsyncSessionLocal,
+                    interval=settings.ANALYTICS_WARMER_INTERVAL_SECONDS,
+                    limit=settings.ANALYTICS_WARMER_TOP_N,
+                    concurrency=settings.ANALYTICS_WARMER_CONCURRENCY,
+                )
+            )
+        )
+    if settings.PIPELINE_SNAPSHOT_ENABLED:
+        background.append(
+            asyncio.create_task(
+                run_snapshotter(
+                    AsyncSessionLocal,
+                    interval=settings.PIPELINE_SNAPSHOT_INTERVAL_SECONDS,
+                    batch_size=settings.PIPELINE_SNAPSHOT_BATCH_SIZE,
+                )
+            )
+        )
     yield
     logger.info("Shutting down LoveKuhnya Tenant CRM API...")
+    for task in background:
+        task.cancel()
+    for task in background:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await cache.close()
 
 
 app = FastAPI(
@@ -41,6 +79,8 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Added before CORS so that 429 responses still carry CORS headers
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Configure for production
@@ -82,3 +122,14 @@ async def health_check():
         "uptime_seconds": uptime,
         "database": db_status,
     }
+
+
+@app.get(
+    "/metrics",
+    include_in_schema=False,
+    dependencies=[Depends(require_admin)],
+)
+async def metrics():
+    return PlainTextResponse(
+        REGISTRY.render(), media_type="text/plain; version=0.0.4"
+    )
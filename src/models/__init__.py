@@ -1,4 +1,11 @@
 from src.core.database import Base
 from src.domain.enums import ActivityType, DealStage, DealStatus, UserRole
 from src.models.auth import Organization, OrganizationMember, User
-from src.models.crm import Activity, Contact, Deal, Task
+from src.models.crm import (
+    Activity,
+    Contact,
+    Deal,
+    DealRollup,
+    DealSnapshot,
+    Task,
+)
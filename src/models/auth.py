@@ -3,7 +3,15 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -24,6 +32,11 @@ class User(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    # Bumped on every membership change, access tokens with role claims
+    # issued for an older version are not trusted
+    membership_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )
 
     memberships: Mapped[list[OrganizationMember]] = relationship(
         back_populates="user"
@@ -56,8 +69,10 @@ class Organization(Base):
 
 class OrganizationMember(Base):
     __tablename__ = "organization_members"
+    # uq_org_user also serves lookups by organization_id (+ user_id)
     __table_args__ = (
         UniqueConstraint("organization_id", "user_id", name="uq_org_user"),
+        Index("ix_organization_members_user_id", "user_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
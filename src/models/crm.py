@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import (
     JSON,
     Boolean,
+    Date,
     DateTime,
     ForeignKey,
+    Index,
+    Integer,
     Numeric,
     String,
     func,
+    text,
 )
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -20,11 +24,68 @@ from src.core.database import Base
 from src.domain.enums import ActivityType, DealStage, DealStatus
 
 if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
     from src.models.auth import Organization, User
 
 
+def _has_pg_trgm(
+    ddl: Any,
+    target: Any,
+    bind: Connection | None,
+    tables: Any = None,
+    state: Any = None,
+    **kw: Any,
+) -> bool:
+    """Create trigram indexes only where the pg_trgm extension is installed
+    (the migration installs it)."""
+    if bind is None:
+        return True
+    row = bind.exec_driver_sql(
+        "SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"
+    ).first()
+    return row is not None
+
+
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index(
+            "ix_contacts_organization_id_owner_id",
+            "organization_id",
+            "owner_id",
+        ),
+        Index(
+            "ix_contacts_organization_id_name_id",
+            "organization_id",
+            "name",
+            "id",
+        ),
+        # Search: trigram GIN indexes serve substring matches, the
+        # lower(...) prefix indexes serve queries too short for trigrams
+        Index(
+            "ix_contacts_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(callable_=_has_pg_trgm),
+        Index(
+            "ix_contacts_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ).ddl_if(callable_=_has_pg_trgm),
+        Index(
+            "ix_contacts_organization_id_name_prefix",
+            "organization_id",
+            text("lower(name) text_pattern_ops"),
+        ),
+        Index(
+            "ix_contacts_organization_id_email_prefix",
+            "organization_id",
+            text("lower(email) text_pattern_ops"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     organization_id: Mapped[int] = mapped_column(ForeignKey("organizations.id"))
@@ -47,6 +108,36 @@ class Contact(Base):
 
 class Deal(Base):
     __tablename__ = "deals"
+    # One index per list ordering (created_at, updated_at, amount), ending
+    # with the id tie-breaker of keyset pages, and per filter;
+    # organization_id leads, every query is tenant-scoped
+    __table_args__ = (
+        Index(
+            "ix_deals_organization_id_created_at_id",
+            "organization_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_deals_organization_id_updated_at_id",
+            "organization_id",
+            "updated_at",
+            "id",
+        ),
+        Index(
+            "ix_deals_organization_id_amount_id",
+            "organization_id",
+            "amount",
+            "id",
+        ),
+        Index("ix_deals_organization_id_status", "organization_id", "status"),
+        Index(
+            "ix_deals_organization_id_owner_id", "organization_id", "owner_id"
+        ),
+        Index("ix_deals_contact_id", "contact_id"),
+        # Most recently updated deals across tenants, for the cache warmer
+        Index("ix_deals_updated_at", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     organization_id: Mapped[int] = mapped_column(ForeignKey("organizations.id"))
@@ -86,6 +177,16 @@ class Deal(Base):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_deal_id_due_date_id", "deal_id", "due_date", "id"),
+        Index(
+            "ix_tasks_deal_id_due_date_id_open",
+            "deal_id",
+            "due_date",
+            "id",
+            postgresql_where=text("is_done = false"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     deal_id: Mapped[int] = mapped_column(ForeignKey("deals.id"))
@@ -106,6 +207,14 @@ class Task(Base):
 
 class Activity(Base):
     __tablename__ = "activities"
+    __table_args__ = (
+        Index(
+            "ix_activities_deal_id_created_at_id",
+            "deal_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     deal_id: Mapped[int] = mapped_column(ForeignKey("deals.id"))
@@ -124,3 +233,50 @@ class Activity(Base):
 
     def __str__(self) -> str:
         return f"{self.type.value} (ID: {self.id})"
+
+
+class DealRollup(Base):
+    """Deal count and amount of an organization per (stage, status).
+
+    Kept in step with deals in the transaction of every ``DealService``
+    write, so analytics read a handful of rows whatever the tenant size;
+    ``DealRollupRepository.rebuild`` recomputes it from the deals table.
+    """
+
+    __tablename__ = "deal_rollups"
+
+    organization_id: Mapped[int] = mapped_column(
+        ForeignKey("organizations.id"), primary_key=True
+    )
+    stage: Mapped[DealStage] = mapped_column(
+        SAEnum(DealStage), primary_key=True
+    )
+    status: Mapped[DealStatus] = mapped_column(
+        SAEnum(DealStatus), primary_key=True
+    )
+    count: Mapped[int] = mapped_column(Integer, default=0)
+    total_amount: Mapped[Decimal] = mapped_column(Numeric(18, 2), default=0)
+
+
+class DealSnapshot(Base):
+    """Deal rollups of an organization as of the end of a day.
+
+    Filled by the pipeline snapshot job (``snapshot_pipelines``) from
+    ``deal_rollups``, so analytics can answer for a past day without
+    replaying activities.
+    """
+
+    __tablename__ = "deal_snapshots"
+
+    organization_id: Mapped[int] = mapped_column(
+        ForeignKey("organizations.id"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    stage: Mapped[DealStage] = mapped_column(
+        SAEnum(DealStage), primary_key=True
+    )
+    status: Mapped[DealStatus] = mapped_column(
+        SAEnum(DealStatus), primary_key=True
+    )
+    count: Mapped[int] = mapped_column(Integer)
+    total_amount: Mapped[Decimal] = mapped_column(Numeric(18, 2))
@@ -2,6 +2,8 @@ from src.repositories.activity import ActivityRepository
 from src.repositories.base import BaseRepository
 from src.repositories.contact import ContactRepository
 from src.repositories.deal import DealRepository
+from src.repositories.deal_rollup import DealRollupRepository
+from src.repositories.deal_snapshot import DealSnapshotRepository
 from src.repositories.organization import OrganizationRepository
 from src.repositories.task import TaskRepository
 from src.repositories.user import UserRepository
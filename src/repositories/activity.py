@@ -3,6 +3,7 @@ from collections.abc import Sequence
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.pagination import Cursor, keyset
 from src.models import Activity, ActivityType
 from src.repositories.base import BaseRepository
 
@@ -16,15 +17,14 @@ class ActivityRepository(BaseRepository[Activity]):
         deal_id: int,
         skip: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
     ) -> Sequence[Activity]:
         """Get activities for a deal, ordered by creation time (newest first)."""
-        stmt = (
-            select(Activity)
-            .where(Activity.deal_id == deal_id)
-            .order_by(Activity.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        stmt = select(Activity).where(Activity.deal_id == deal_id)
+        stmt = keyset(
+            stmt, Activity.created_at, Activity.id, descending=True, after=after
         )
+        stmt = stmt.offset(skip).limit(limit)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
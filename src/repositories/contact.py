@@ -1,11 +1,49 @@
 from collections.abc import Sequence
+from dataclasses import replace
+from typing import Any
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Select, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.pagination import CountStrategy, Cursor, Page, fetch_page, keyset
 from src.models import Contact
 from src.repositories.base import BaseRepository
 
+# pg_trgm extracts no useful trigrams from shorter strings
+TRIGRAM_MIN_LENGTH = 3
+
+
+def _filter(
+    stmt: Select[Any],
+    organization_id: int,
+    search: str | None,
+    owner_id: int | None,
+) -> Select[Any]:
+    stmt = stmt.where(Contact.organization_id == organization_id)
+
+    if search and len(search) >= TRIGRAM_MIN_LENGTH:
+        # Substring match, served by the trigram GIN indexes
+        stmt = stmt.where(
+            or_(
+                Contact.name.icontains(search, autoescape=True),
+                Contact.email.icontains(search, autoescape=True),
+            )
+        )
+    elif search:
+        # Prefix match, served by the lower(...) prefix indexes
+        prefix = search.lower()
+        stmt = stmt.where(
+            or_(
+                func.lower(Contact.name).startswith(prefix, autoescape=True),
+                func.lower(Contact.email).startswith(prefix, autoescape=True),
+            )
+        )
+
+    if owner_id is not None:
+        stmt = stmt.where(Contact.owner_id == owner_id)
+
+    return stmt
+
 
 class ContactRepository(BaseRepository[Contact]):
     def __init__(self, session: AsyncSession):
@@ -18,25 +56,67 @@ class ContactRepository(BaseRepository[Contact]):
         limit: int = 100,
         search: str | None = None,
         owner_id: int | None = None,
+        after: Cursor | None = None,
     ) -> Sequence[Contact]:
-        """Get contacts for organization with optional filters."""
-        stmt = select(Contact).where(Contact.organization_id == organization_id)
-
-        if search:
-            search_pattern = f"%{search}%"
-            stmt = stmt.where(
-                or_(
-                    Contact.name.ilike(search_pattern),
-                    Contact.email.ilike(search_pattern),
-                )
-            )
+        """Get contacts for organization with optional filters, by name.
+
+        Searches of ``TRIGRAM_MIN_LENGTH`` characters or more match
+        substrings of name or email, best trigram similarity first; shorter
+        ones match name or email prefixes.
+        """
+        page = await self.get_page(
+            organization_id,
+            skip=skip,
+            limit=limit,
+            search=search,
+            owner_id=owner_id,
+            after=after,
+            count=None,
+        )
+        return page.items
 
-        if owner_id is not None:
-            stmt = stmt.where(Contact.owner_id == owner_id)
+    async def get_page(
+        self,
+        organization_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        search: str | None = None,
+        owner_id: int | None = None,
+        after: Cursor | None = None,
+        count: CountStrategy | None = CountStrategy.EXACT,
+    ) -> Page:
+        """Get a page of contacts (see ``get_by_organization``) and the
+        number matching the filters, counted with ``count``."""
+        stmt = _filter(select(Contact), organization_id, search, owner_id)
 
+        if search and len(search) >= TRIGRAM_MIN_LENGTH:
+            rank = func.greatest(
+                func.similarity(Contact.name, search),
+                func.coalesce(func.similarity(Contact.email, search), 0),
+            )
+            if after is not None:
+                # Ranks are not stored: the cursor names the row only
+                after_rank = (
+                    select(rank).where(Contact.id == after.id).scalar_subquery()
+                )
+                after = replace(after, key=after_rank)
+            stmt = keyset(stmt, rank, Contact.id, descending=True, after=after)
+        else:
+            stmt = keyset(
+                stmt, Contact.name, Contact.id, descending=False, after=after
+            )
         stmt = stmt.offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+
+        matching = _filter(
+            select(Contact.id), organization_id, search, owner_id
+        )
+        return await fetch_page(
+            self.session,
+            stmt,
+            matching,
+            count,
+            first=not skip and after is None,
+        )
 
     async def count_by_organization(
         self,
@@ -45,24 +125,12 @@ class ContactRepository(BaseRepository[Contact]):
         owner_id: int | None = None,
     ) -> int:
         """Count contacts for organization with optional filters."""
-        stmt = (
-            select(func.count())
-            .select_from(Contact)
-            .where(Contact.organization_id == organization_id)
+        stmt = _filter(
+            select(func.count()).select_from(Contact),
+            organization_id,
+            search,
+            owner_id,
         )
-
-        if search:
-            search_pattern = f"%{search}%"
-            stmt = stmt.where(
-                or_(
-                    Contact.name.ilike(search_pattern),
-                    Contact.email.ilike(search_pattern),
-                )
-            )
-
-        if owner_id is not None:
-            stmt = stmt.where(Contact.owner_id == owner_id)
-
         result = await self.session.execute(stmt)
         return result.scalar() or 0
 
@@ -1,19 +1,91 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import Label, Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.pagination import CountStrategy, Cursor, Page, fetch_page, keyset
 from src.models import Deal, DealStage, DealStatus
 from src.repositories.base import BaseRepository
 
 
+def _filter(
+    stmt: Select[Any],
+    organization_id: int,
+    status: list[DealStatus] | None = None,
+    stage: DealStage | None = None,
+    owner_id: int | None = None,
+    min_amount: Decimal | None = None,
+    max_amount: Decimal | None = None,
+) -> Select[Any]:
+    stmt = stmt.where(Deal.organization_id == organization_id)
+
+    if status:
+        stmt = stmt.where(Deal.status.in_(status))
+
+    if stage:
+        stmt = stmt.where(Deal.stage == stage)
+
+    if owner_id is not None:
+        stmt = stmt.where(Deal.owner_id == owner_id)
+
+    if min_amount is not None:
+        stmt = stmt.where(Deal.amount >= min_amount)
+
+    if max_amount is not None:
+        stmt = stmt.where(Deal.amount <= max_amount)
+
+    return stmt
+
+
+def funnel_from_counts(rows: Iterable[Any]) -> dict:
+    """Build the sales funnel from ``(stage, status, count)`` rows."""
+    funnel: dict[str, Any] = {}
+    for row in rows:
+        stage = row.stage
+        if stage not in funnel:
+            funnel[stage] = {"total": 0, "by_status": {}}
+        funnel[stage]["total"] += row.count
+        funnel[stage]["by_status"][row.status] = row.count
+
+    # Calculate conversion rates
+    stages = list(DealStage)
+    for i, stage in enumerate(stages[1:], 1):
+        prev_stage = stages[i - 1]
+        prev_total = funnel.get(prev_stage, {}).get("total", 0)
+        curr_total = funnel.get(stage, {}).get("total", 0)
+        if prev_total > 0:
+            funnel.setdefault(stage, {})["conversion_from_prev"] = round(
+                curr_total / prev_total * 100, 2
+            )
+        else:
+            funnel.setdefault(stage, {})["conversion_from_prev"] = 0
+
+    return funnel
+
+
 class DealRepository(BaseRepository[Deal]):
     def __init__(self, session: AsyncSession):
         super().__init__(Deal, session)
 
+    async def get_for_update(self, deal_id: int) -> Deal | None:
+        """Get a deal and lock its row until the transaction ends.
+
+        Writers that derive rollup deltas from the current stage, status
+        and amount wait here for each other, and each sees the values the
+        previous one committed.
+        """
+        stmt = (
+            select(Deal)
+            .where(Deal.id == deal_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_by_organization(
         self,
         organization_id: int,
@@ -26,35 +98,68 @@ class DealRepository(BaseRepository[Deal]):
         max_amount: Decimal | None = None,
         order_by: str = "created_at",
         order: str = "desc",
+        after: Cursor | None = None,
     ) -> Sequence[Deal]:
-        """Get deals for organization with filters and sorting."""
-        stmt = select(Deal).where(Deal.organization_id == organization_id)
-
-        if status:
-            stmt = stmt.where(Deal.status.in_(status))
+        """Get deals for organization with filters and sorting.
 
-        if stage:
-            stmt = stmt.where(Deal.stage == stage)
-
-        if owner_id is not None:
-            stmt = stmt.where(Deal.owner_id == owner_id)
-
-        if min_amount is not None:
-            stmt = stmt.where(Deal.amount >= min_amount)
+        Rows are ordered by ``(order_by, id)``; with ``after`` only rows
+        past that cursor are returned.
+        """
+        page = await self.get_page(
+            organization_id,
+            skip=skip,
+            limit=limit,
+            status=status,
+            stage=stage,
+            owner_id=owner_id,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            order_by=order_by,
+            order=order,
+            after=after,
+            count=None,
+        )
+        return page.items
 
-        if max_amount is not None:
-            stmt = stmt.where(Deal.amount <= max_amount)
+    async def get_page(
+        self,
+        organization_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        status: list[DealStatus] | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        order_by: str = "created_at",
+        order: str = "desc",
+        after: Cursor | None = None,
+        count: CountStrategy | None = CountStrategy.EXACT,
+    ) -> Page:
+        """Get a page of deals and the number of deals matching the filters,
+        counted with ``count`` (see ``fetch_page``)."""
+        filters: dict[str, Any] = {
+            "status": status,
+            "stage": stage,
+            "owner_id": owner_id,
+            "min_amount": min_amount,
+            "max_amount": max_amount,
+        }
+        stmt = _filter(select(Deal), organization_id, **filters)
 
         # Sorting
         order_column = getattr(Deal, order_by, Deal.created_at)
-        if order == "asc":
-            stmt = stmt.order_by(order_column.asc())
-        else:
-            stmt = stmt.order_by(order_column.desc())
-
+        stmt = keyset(stmt, order_column, Deal.id, order != "asc", after)
         stmt = stmt.offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+
+        matching = _filter(select(Deal.id), organization_id, **filters)
+        return await fetch_page(
+            self.session,
+            stmt,
+            matching,
+            count,
+            first=not skip and after is None,
+        )
 
     async def count_by_organization(
         self,
@@ -62,72 +167,104 @@ class DealRepository(BaseRepository[Deal]):
         status: list[DealStatus] | None = None,
         stage: DealStage | None = None,
         owner_id: int | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
     ) -> int:
         """Count deals for organization with optional filters."""
+        stmt = _filter(
+            select(func.count()).select_from(Deal),
+            organization_id,
+            status=status,
+            stage=stage,
+            owner_id=owner_id,
+            min_amount=min_amount,
+            max_amount=max_amount,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar() or 0
+
+    async def count_created(
+        self,
+        organization_id: int,
+        since: datetime,
+        until: datetime | None = None,
+    ) -> int:
+        """Count deals created from ``since`` up to ``until`` (exclusive)."""
         stmt = (
             select(func.count())
             .select_from(Deal)
-            .where(Deal.organization_id == organization_id)
+            .where(
+                Deal.organization_id == organization_id,
+                Deal.created_at >= since,
+            )
         )
-
-        if status:
-            stmt = stmt.where(Deal.status.in_(status))
-
-        if stage:
-            stmt = stmt.where(Deal.stage == stage)
-
-        if owner_id is not None:
-            stmt = stmt.where(Deal.owner_id == owner_id)
-
+        if until is not None:
+            stmt = stmt.where(Deal.created_at < until)
         result = await self.session.execute(stmt)
         return result.scalar() or 0
 
-    async def get_summary(self, organization_id: int, days: int = 30) -> dict:
-        """Get deals summary for analytics."""
-        # Count and sum by status
+    async def get_recently_active_organization_ids(
+        self, limit: int, scan: int = 10_000
+    ) -> list[int]:
+        """Get ids of organizations with the most recently updated deals.
+
+        Only the ``scan`` most recently updated deals are read (a bounded
+        scan of ``ix_deals_updated_at``), so the cost does not grow with
+        the table; organizations whose latest update is older than those
+        deals are not returned.
+        """
         stmt = (
-            select(
-                Deal.status,
-                func.count(Deal.id).label("count"),
-                func.sum(Deal.amount).label("total_amount"),
-            )
-            .where(Deal.organization_id == organization_id)
-            .group_by(Deal.status)
+            select(Deal.organization_id)
+            .order_by(Deal.updated_at.desc())
+            .limit(scan)
         )
         result = await self.session.execute(stmt)
-        by_status = {
-            row.status: {
-                "count": row.count,
-                "total_amount": row.total_amount or Decimal(0),
-            }
-            for row in result
-        }
+        return list(dict.fromkeys(result.scalars()))[:limit]
 
-        # Average amount for won deals
-        stmt_avg = select(func.avg(Deal.amount)).where(
-            Deal.organization_id == organization_id,
-            Deal.status == DealStatus.WON,
-        )
-        avg_result = await self.session.execute(stmt_avg)
-        avg_won = avg_result.scalar() or Decimal(0)
+    async def get_summary(self, organization_id: int, days: int = 30) -> dict:
+        """Get deals summary for analytics.
 
-        # New deals in last N days
+        One pass over the organization's deals: every figure is a
+        conditional aggregate (``FILTER (WHERE ...)``) of the same scan.
+        """
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        stmt_new = (
-            select(func.count())
-            .select_from(Deal)
-            .where(
-                Deal.organization_id == organization_id,
-                Deal.created_at >= cutoff_date,
-            )
-        )
-        new_result = await self.session.execute(stmt_new)
-        new_count = new_result.scalar() or 0
+
+        # Count and sum by status
+        by_status_columns: list[Label[Any]] = []
+        for status in DealStatus:
+            is_status = Deal.status == status
+            by_status_columns += [
+                func.count().filter(is_status).label(f"{status.value}_count"),
+                func.sum(Deal.amount)
+                .filter(is_status)
+                .label(f"{status.value}_amount"),
+            ]
+
+        stmt = select(
+            *by_status_columns,
+            # Average amount for won deals
+            func.avg(Deal.amount)
+            .filter(Deal.status == DealStatus.WON)
+            .label("avg_won_amount"),
+            # New deals in last N days
+            func.count()
+            .filter(Deal.created_at >= cutoff_date)
+            .label("new_deals"),
+        ).where(Deal.organization_id == organization_id)
+        result = await self.session.execute(stmt)
+        row = result.one()._mapping
 
         return {
-            "by_status": by_status,
-            "avg_won_amount": avg_won,
-            "new_deals_last_n_days": new_count,
+            "by_status": {
+                status: {
+                    "count": row[f"{status.value}_count"],
+                    "total_amount": row[f"{status.value}_amount"] or Decimal(0),
+                }
+                for status in DealStatus
+                if row[f"{status.value}_count"]
+            },
+            "avg_won_amount": row["avg_won_amount"] or Decimal(0),
+            "new_deals_last_n_days": row["new_deals"],
             "days": days,
         }
 
@@ -143,26 +280,4 @@ class DealRepository(BaseRepository[Deal]):
             .group_by(Deal.stage, Deal.status)
         )
         result = await self.session.execute(stmt)
-
-        funnel: dict[str, Any] = {}
-        for row in result:
-            stage = row.stage
-            if stage not in funnel:
-                funnel[stage] = {"total": 0, "by_status": {}}
-            funnel[stage]["total"] += row.count
-            funnel[stage]["by_status"][row.status] = row.count
-
-        # Calculate conversion rates
-        stages = list(DealStage)
-        for i, stage in enumerate(stages[1:], 1):
-            prev_stage = stages[i - 1]
-            prev_total = funnel.get(prev_stage, {}).get("total", 0)
-            curr_total = funnel.get(stage, {}).get("total", 0)
-            if prev_total > 0:
-                funnel.setdefault(stage, {})["conversion_from_prev"] = round(
-                    curr_total / prev_total * 100, 2
-                )
-            else:
-                funnel.setdefault(stage, {})["conversion_from_prev"] = 0
-
-        return funnel
+        return funnel_from_counts(result)
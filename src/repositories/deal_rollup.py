@@ -0,0 +1,162 @@
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import Deal, DealRollup, DealStage, DealStatus
+from src.repositories.base import BaseRepository
+from src.repositories.deal import DealRepository, funnel_from_counts
+
+# Change of one rollup row: stage, status, deal count delta, amount delta
+RollupDelta = tuple[DealStage, DealStatus, int, Decimal]
+
+
+def summary_from_counts(rows: Iterable[Any], new_deals: int, days: int) -> dict:
+    """Build the deals summary from ``(status, count, total_amount)`` rows."""
+    by_status: dict[DealStatus, dict[str, Any]] = {
+        row.status: {
+            "count": row.count,
+            "total_amount": row.total_amount or Decimal(0),
+        }
+        for row in rows
+    }
+    won = by_status.get(DealStatus.WON)
+    avg_won = won["total_amount"] / won["count"] if won else Decimal(0)
+    return {
+        "by_status": by_status,
+        "avg_won_amount": avg_won,
+        "new_deals_last_n_days": new_deals,
+        "days": days,
+    }
+
+
+class DealRollupRepository(BaseRepository[DealRollup]):
+    """Per-(stage, status) deal counts and amounts of organizations.
+
+    Writes never commit: ``apply`` runs in the transaction of the deal write
+    it accounts for, so the rollups and the deals commit or roll back
+    together.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(DealRollup, session)
+
+    async def apply(
+        self, organization_id: int, deltas: Iterable[RollupDelta]
+    ) -> None:
+        """Add deal count and amount deltas to the rollups of an organization.
+
+        Deltas of one row are merged and empty ones skipped. Rows are
+        upserted in key order, so concurrent deal writes of a tenant lock
+        them in the same order and cannot deadlock each other.
+        """
+        merged: dict[tuple[DealStage, DealStatus], tuple[int, Decimal]] = {}
+        for stage, status, count, amount in deltas:
+            old_count, old_amount = merged.get((stage, status), (0, Decimal(0)))
+            merged[stage, status] = (old_count + count, old_amount + amount)
+
+        for (stage, status), (count, amount) in sorted(merged.items()):
+            if not count and not amount:
+                continue
+            stmt = insert(DealRollup).values(
+                organization_id=organization_id,
+                stage=stage,
+                status=status,
+                count=count,
+                total_amount=amount,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[
+                    DealRollup.organization_id,
+                    DealRollup.stage,
+                    DealRollup.status,
+                ],
+                set_={
+                    "count": DealRollup.count + stmt.excluded.count,
+                    "total_amount": DealRollup.total_amount
+                    + stmt.excluded.total_amount,
+                },
+            )
+            await self.session.execute(stmt)
+
+    async def rebuild(self, organization_id: int | None = None) -> None:
+        """Recompute the rollups of an organization, or of all of them, from
+        the deals table.
+
+        The table is locked against concurrent ``apply`` until the caller
+        commits, so no deal write lands between the delete and the insert.
+        """
+        await self.session.execute(
+            text("LOCK TABLE deal_rollups IN SHARE ROW EXCLUSIVE MODE")
+        )
+        stmt_delete = delete(DealRollup)
+        stmt_select = select(
+            Deal.organization_id,
+            Deal.stage,
+            Deal.status,
+            func.count(),
+            func.coalesce(func.sum(Deal.amount), 0),
+        ).group_by(Deal.organization_id, Deal.stage, Deal.status)
+        if organization_id is not None:
+            stmt_delete = stmt_delete.where(
+                DealRollup.organization_id == organization_id
+            )
+            stmt_select = stmt_select.where(
+                Deal.organization_id == organization_id
+            )
+
+        await self.session.execute(stmt_delete)
+        await self.session.execute(
+            insert(DealRollup).from_select(
+                [
+                    DealRollup.organization_id,
+                    DealRollup.stage,
+                    DealRollup.status,
+                    DealRollup.count,
+                    DealRollup.total_amount,
+                ],
+                stmt_select,
+            )
+        )
+
+    async def get_summary(self, organization_id: int, days: int = 30) -> dict:
+        """Get deals summary for analytics, same shape as
+        ``DealRepository.get_summary``.
+
+        Counts and amounts come from the rollups; new deals of the last
+        ``days`` are a range scan of the ``(organization_id, created_at)``
+        index, which rollups keyed by stage and status cannot answer.
+        """
+        stmt = (
+            select(
+                DealRollup.status,
+                func.sum(DealRollup.count).label("count"),
+                func.sum(DealRollup.total_amount).label("total_amount"),
+            )
+            .where(
+                DealRollup.organization_id == organization_id,
+                DealRollup.count > 0,
+            )
+            .group_by(DealRollup.status)
+        )
+        result = await self.session.execute(stmt)
+        new_count = await DealRepository(self.session).count_created(
+            organization_id, datetime.utcnow() - timedelta(days=days)
+        )
+        return summary_from_counts(result, new_count, days)
+
+    async def get_funnel(self, organization_id: int) -> dict:
+        """Get sales funnel data for analytics, same shape as
+        ``DealRepository.get_funnel``."""
+        stmt = select(
+            DealRollup.stage, DealRollup.status, DealRollup.count
+        ).where(
+            DealRollup.organization_id == organization_id,
+            DealRollup.count > 0,
+        )
+        result = await self.session.execute(stmt)
+        return funnel_from_counts(result)
@@ -0,0 +1,128 @@
+from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import DealRollup, DealSnapshot, DealStage, DealStatus
+from src.repositories.base import BaseRepository
+from src.repositories.deal import DealRepository, funnel_from_counts
+from src.repositories.deal_rollup import summary_from_counts
+
+
+class DealSnapshotRepository(BaseRepository[DealSnapshot]):
+    """Daily copies of the deal rollups of organizations."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(DealSnapshot, session)
+
+    async def take(self, day: date, organization_ids: Sequence[int]) -> None:
+        """Replace the snapshot of ``day`` of the given organizations with
+        their current rollups (the caller commits).
+
+        Every organization gets at least one row, a zero one when it has
+        no rollups, so ``get_day`` tells a snapshot without deals from a
+        missing snapshot.
+        """
+        await self.session.execute(
+            delete(DealSnapshot).where(
+                DealSnapshot.organization_id.in_(organization_ids),
+                DealSnapshot.day == day,
+            )
+        )
+        await self.session.execute(
+            insert(DealSnapshot).from_select(
+                [
+                    DealSnapshot.organization_id,
+                    DealSnapshot.day,
+                    DealSnapshot.stage,
+                    DealSnapshot.status,
+                    DealSnapshot.count,
+                    DealSnapshot.total_amount,
+                ],
+                select(
+                    DealRollup.organization_id,
+                    literal(day),
+                    DealRollup.stage,
+                    DealRollup.status,
+                    DealRollup.count,
+                    DealRollup.total_amount,
+                ).where(DealRollup.organization_id.in_(organization_ids)),
+            )
+        )
+        if organization_ids:
+            await self.session.execute(
+                insert(DealSnapshot)
+                .values(
+                    [
+                        {
+                            "organization_id": organization_id,
+                            "day": day,
+                            "stage": DealStage.QUALIFICATION,
+                            "status": DealStatus.NEW,
+                            "count": 0,
+                            "total_amount": 0,
+                        }
+                        for organization_id in organization_ids
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+
+    async def get_day(self, organization_id: int, as_of: date) -> date | None:
+        """Day of the latest snapshot of an organization on or before
+        ``as_of``, ``None`` if there is none."""
+        stmt = select(func.max(DealSnapshot.day)).where(
+            DealSnapshot.organization_id == organization_id,
+            DealSnapshot.day <= as_of,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar()
+
+    async def get_summary(
+        self, organization_id: int, day: date | None, days: int = 30
+    ) -> dict:
+        """Get deals summary as of the snapshot of ``day`` (empty when
+        ``None``), same shape as ``DealRollupRepository.get_summary``.
+
+        New deals are those created in the ``days`` days up to the end of
+        ``day`` and still present: deals deleted since are not counted.
+        """
+        if day is None:
+            return summary_from_counts([], 0, days)
+        stmt = (
+            select(
+                DealSnapshot.status,
+                func.sum(DealSnapshot.count).label("count"),
+                func.sum(DealSnapshot.total_amount).label("total_amount"),
+            )
+            .where(
+                DealSnapshot.organization_id == organization_id,
+                DealSnapshot.day == day,
+                DealSnapshot.count > 0,
+            )
+            .group_by(DealSnapshot.status)
+        )
+        result = await self.session.execute(stmt)
+
+        until = datetime.combine(day + timedelta(days=1), time.min)
+        new_count = await DealRepository(self.session).count_created(
+            organization_id, until - timedelta(days=days), until
+        )
+        return summary_from_counts(result, new_count, days)
+
+    async def get_funnel(self, organization_id: int, day: date | None) -> dict:
+        """Get sales funnel data as of the snapshot of ``day`` (empty when
+        ``None``), same shape as ``DealRollupRepository.get_funnel``."""
+        if day is None:
+            return funnel_from_counts([])
+        stmt = select(
+            DealSnapshot.stage, DealSnapshot.status, DealSnapshot.count
+        ).where(
+            DealSnapshot.organization_id == organization_id,
+            DealSnapshot.day == day,
+            DealSnapshot.count > 0,
+        )
+        result = await self.session.execute(stmt)
+        return funnel_from_counts(result)
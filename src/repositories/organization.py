@@ -11,6 +11,18 @@ class OrganizationRepository(BaseRepository[Organization]):
     def __init__(self, session: AsyncSession):
         super().__init__(Organization, session)
 
+    async def get_ids_after(self, after_id: int, limit: int) -> Sequence[int]:
+        """Get up to ``limit`` organization ids greater than ``after_id``, in
+        order, to walk all organizations in batches."""
+        stmt = (
+            select(Organization.id)
+            .where(Organization.id > after_id)
+            .order_by(Organization.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
     async def get_user_organizations(
         self, user_id: int
     ) -> Sequence[Organization]:
@@ -23,6 +35,14 @@ class OrganizationRepository(BaseRepository[Organization]):
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def get_user_roles(self, user_id: int) -> dict[int, UserRole]:
+        """Get the user's role in each of their organizations."""
+        stmt = select(
+            OrganizationMember.organization_id, OrganizationMember.role
+        ).where(OrganizationMember.user_id == user_id)
+        result = await self.session.execute(stmt)
+        return {row.organization_id: row.role for row in result}
+
     async def get_member(
         self, organization_id: int, user_id: int
     ) -> OrganizationMember | None:
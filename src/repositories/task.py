@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.pagination import Cursor, keyset
 from src.models import Task
 from src.repositories.base import BaseRepository
 
@@ -18,8 +19,11 @@ class TaskRepository(BaseRepository[Task]):
         only_open: bool = False,
         due_before: datetime | None = None,
         due_after: datetime | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Cursor | None = None,
     ) -> Sequence[Task]:
-        """Get tasks for a deal with optional filters."""
+        """Get tasks for a deal with optional filters, by due date."""
         stmt = select(Task).where(Task.deal_id == deal_id)
 
         if only_open:
@@ -31,7 +35,10 @@ class TaskRepository(BaseRepository[Task]):
         if due_after:
             stmt = stmt.where(Task.due_date >= due_after)
 
-        stmt = stmt.order_by(Task.due_date.asc())
+        stmt = keyset(
+            stmt, Task.due_date, Task.id, descending=False, after=after
+        )
+        stmt = stmt.offset(skip).limit(limit)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
@@ -43,8 +50,9 @@ class TaskRepository(BaseRepository[Task]):
         due_after: datetime | None = None,
         skip: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
     ) -> Sequence[Task]:
-        """Get all tasks for organization (via deals)."""
+        """Get all tasks for organization (via deals), by due date."""
         from src.models import Deal
 
         stmt = (
@@ -62,7 +70,10 @@ class TaskRepository(BaseRepository[Task]):
         if due_after:
             stmt = stmt.where(Task.due_date >= due_after)
 
-        stmt = stmt.order_by(Task.due_date.asc()).offset(skip).limit(limit)
+        stmt = keyset(
+            stmt, Task.due_date, Task.id, descending=False, after=after
+        )
+        stmt = stmt.offset(skip).limit(limit)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import User
@@ -13,3 +13,29 @@ class UserRepository(BaseRepository[User]):
         stmt = select(User).where(User.email == email)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def get_membership_version(self, user_id: int) -> int | None:
+        stmt = select(User.membership_version).where(User.id == user_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def bump_membership_version(self, user_id: int) -> None:
+        """Invalidate role claims in the user's issued access tokens."""
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(membership_version=User.membership_version + 1)
+        )
+        await self.session.execute(stmt)
+
+    async def replace_password_hash(
+        self, user_id: int, old_hash: str, new_hash: str
+    ) -> bool:
+        """Swap the hash only if it is still ``old_hash`` (no lost updates)."""
+        stmt = (
+            update(User)
+            .where(User.id == user_id, User.hashed_password == old_hash)
+            .values(hashed_password=new_hash)
+        )
+        result = await self.session.execute(stmt)
+        return bool(result.rowcount)  # type: ignore[attr-defined]
@@ -19,6 +19,7 @@ class ActivityResponse(BaseModel):
 
 class ActivityListResponse(BaseModel):
     items: list[ActivityResponse]
+    next_cursor: str | None = None
 
 
 class CreateCommentRequest(BaseModel):
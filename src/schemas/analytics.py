@@ -1,3 +1,5 @@
+from datetime import date
+
 from pydantic import BaseModel
 
 
@@ -11,6 +13,9 @@ class DealsSummaryResponse(BaseModel):
     avg_won_amount: float
     new_deals_last_n_days: int
     days: int
+    # Day of the snapshot read for as_of (the latest on or before it); None
+    # for current data, or when the organization had no snapshot by then
+    as_of: date | None = None
 
 
 class StageFunnel(BaseModel):
@@ -21,3 +26,5 @@ class StageFunnel(BaseModel):
 
 class DealsFunnelResponse(BaseModel):
     stages: dict[str, StageFunnel]
+    # As in DealsSummaryResponse
+    as_of: date | None = None
@@ -16,6 +16,9 @@ class MessageResponse(BaseModel):
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
-    total: int
+    total: int | None = None
+    # False when total is a cap ("1000+") or a planner estimate
+    total_is_exact: bool = True
     page: int = 1
     page_size: int = 100
+    next_cursor: str | None = None
@@ -31,3 +31,4 @@ class TaskResponse(TaskBase):
 
 class TaskListResponse(BaseModel):
     items: list[TaskResponse]
+    next_cursor: str | None = None
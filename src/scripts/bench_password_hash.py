@@ -0,0 +1,32 @@
+import sys
+import time
+
+from passlib.context import CryptContext
+
+from src.core.config import settings
+
+# scheme:rounds pairs measured when none are given on the command line
+DEFAULT_CONFIGS = ["bcrypt:10", "bcrypt:12", "pbkdf2_sha256:29000"]
+
+
+def bench_password_hash(configs: list[str], seconds: float = 2.0) -> None:
+    """Report single-thread (per core) hashes/sec for each scheme:rounds."""
+    for config in configs:
+        scheme, _, rounds = config.partition(":")
+        context = CryptContext(
+            schemes=[scheme], **{f"{scheme}__rounds": int(rounds)}
+        )
+        count = 0
+        started = time.perf_counter()
+        while (elapsed := time.perf_counter() - started) < seconds:
+            context.hash("benchmark-password")
+            count += 1
+        print(
+            f"{config:<24} {count / elapsed:8.1f} hashes/sec/core"
+            f" {elapsed / count * 1000:8.1f} ms/hash"
+        )
+
+
+if __name__ == "__main__":
+    current = f"{settings.PASSWORD_HASH_SCHEME}:{settings.PASSWORD_HASH_ROUNDS}"
+    bench_password_hash(sys.argv[1:] or [current, *DEFAULT_CONFIGS])
@@ -0,0 +1,155 @@
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import AsyncSessionLocal
+from src.models import Deal, DealStatus
+from src.repositories import DealRepository, DealRollupRepository
+
+BENCH_ORG_NAME = "bench-summary"
+BENCH_EMAIL = "bench-summary@example.com"
+
+
+async def legacy_summary(
+    session: AsyncSession, organization_id: int, days: int = 30
+) -> dict:
+    """The three-query summary replaced by ``DealRepository.get_summary``:
+    GROUP BY status, AVG of won deals and COUNT of recent deals, each its
+    own pass over the organization's deals."""
+    stmt = (
+        select(
+            Deal.status,
+            func.count(Deal.id).label("count"),
+            func.sum(Deal.amount).label("total_amount"),
+        )
+        .where(Deal.organization_id == organization_id)
+        .group_by(Deal.status)
+    )
+    result = await session.execute(stmt)
+    by_status = {
+        row.status: {
+            "count": row.count,
+            "total_amount": row.total_amount or Decimal(0),
+        }
+        for row in result
+    }
+
+    stmt_avg = select(func.avg(Deal.amount)).where(
+        Deal.organization_id == organization_id,
+        Deal.status == DealStatus.WON,
+    )
+    avg_won = (await session.execute(stmt_avg)).scalar() or Decimal(0)
+
+    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    stmt_new = (
+        select(func.count())
+        .select_from(Deal)
+        .where(
+            Deal.organization_id == organization_id,
+            Deal.created_at >= cutoff_date,
+        )
+    )
+    new_count = (await session.execute(stmt_new)).scalar() or 0
+
+    return {
+        "by_status": by_status,
+        "avg_won_amount": avg_won,
+        "new_deals_last_n_days": new_count,
+        "days": days,
+    }
+
+
+async def seed_tenant(session: AsyncSession, deals: int) -> int:
+    """Create an organization with ``deals`` deals spread over statuses and
+    the last year; return its id."""
+    user_id = await session.scalar(
+        text(
+            "INSERT INTO users (email, hashed_password, name)"
+            " VALUES (:email, '-', 'Bench') RETURNING id"
+        ),
+        {"email": BENCH_EMAIL},
+    )
+    org_id = await session.scalar(
+        text("INSERT INTO organizations (name) VALUES (:name) RETURNING id"),
+        {"name": BENCH_ORG_NAME},
+    )
+    contact_id = await session.scalar(
+        text(
+            "INSERT INTO contacts (organization_id, owner_id, name)"
+            " VALUES (:org, :user, 'Bench') RETURNING id"
+        ),
+        {"org": org_id, "user": user_id},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO deals (organization_id, contact_id, owner_id, title,"
+            " amount, currency, status, stage, created_at, updated_at)"
+            " SELECT :org, :contact, :user, 'Deal ' || g, (g % 1000) * 10,"
+            " 'USD', (ARRAY['NEW', 'IN_PROGRESS', 'WON', 'LOST'])"
+            "[g % 4 + 1]::dealstatus, 'QUALIFICATION',"
+            " now() - (g % 365) * interval '1 day', now()"
+            " FROM generate_series(1, :deals) AS g"
+        ),
+        {"org": org_id, "contact": contact_id, "user": user_id, "deals": deals},
+    )
+    await session.commit()
+    await session.execute(text("ANALYZE deals"))
+    return org_id
+
+
+async def drop_tenant(session: AsyncSession) -> None:
+    for table in ("deals", "deal_rollups", "deal_snapshots", "contacts"):
+        await session.execute(
+            text(
+                f"DELETE FROM {table} WHERE organization_id IN"
+                " (SELECT id FROM organizations WHERE name = :name)"
+            ),
+            {"name": BENCH_ORG_NAME},
+        )
+    await session.execute(
+        text("DELETE FROM organizations WHERE name = :name"),
+        {"name": BENCH_ORG_NAME},
+    )
+    await session.execute(
+        text("DELETE FROM users WHERE email = :email"), {"email": BENCH_EMAIL}
+    )
+    await session.commit()
+
+
+async def bench_summary(deals: int = 200_000, repeat: int = 20) -> None:
+    """Compare the rollup summary, the single-scan one and the three-query
+    one on a seeded tenant of ``deals`` deals (removed afterwards)."""
+    async with AsyncSessionLocal() as session:
+        await drop_tenant(session)
+        org_id = await seed_tenant(session, deals)
+        try:
+            repo = DealRepository(session)
+            rollup_repo = DealRollupRepository(session)
+            await rollup_repo.rebuild(org_id)
+            await session.commit()
+            timings = {}
+            for name, summary in (
+                ("3 queries (legacy)", lambda: legacy_summary(session, org_id)),
+                ("1 query (FILTER)", lambda: repo.get_summary(org_id)),
+                ("rollups", lambda: rollup_repo.get_summary(org_id)),
+            ):
+                await summary()  # warm caches and plans
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    await summary()
+                timings[name] = (time.perf_counter() - started) / repeat
+
+            print(f"deals in tenant: {deals}")
+            for name, seconds in timings.items():
+                print(f"{name:<20} {seconds * 1000:8.2f} ms/summary")
+        finally:
+            await drop_tenant(session)
+
+
+if __name__ == "__main__":
+    asyncio.run(bench_summary(*(int(arg) for arg in sys.argv[1:3])))
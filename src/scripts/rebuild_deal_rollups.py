@@ -0,0 +1,26 @@
+import asyncio
+import logging
+import sys
+
+from src.core.database import AsyncSessionLocal
+from src.services import AnalyticsService
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def rebuild_deal_rollups(organization_id: int | None = None) -> None:
+    """Rebuild deal rollups from the deals table: of one organization, or of
+    all of them when no id is given."""
+    async with AsyncSessionLocal() as session:
+        await AnalyticsService(session).rebuild_rollups(organization_id)
+    logger.info(
+        "Rebuilt deal rollups of %s",
+        "all organizations"
+        if organization_id is None
+        else f"organization {organization_id}",
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_deal_rollups(*(int(arg) for arg in sys.argv[1:2])))
@@ -3,6 +3,7 @@ import logging
 from decimal import Decimal
 
 from src.core.database import AsyncSessionLocal
+from src.domain import Principal, TenantContext, UserRole
 from src.models.enums import DealStage
 from src.services import AuthService, ContactService, DealService
 
@@ -28,6 +29,11 @@ async def seed_data():
             )
             user = result["user"]
             org = result["organization"]
+            ctx = TenantContext(
+                user=Principal.from_user(user),
+                organization_id=org.id,
+                role=UserRole.OWNER,
+            )
             logger.info(
                 f"Created user: {user.email}, Org: {org.name} (ID: {org.id})"
             )
@@ -35,15 +41,13 @@ async def seed_data():
             # 2. Create Contacts
             logger.info("Creating contacts...")
             c1 = await contact_service.create_contact(
-                organization_id=org.id,
-                user=user,
+                ctx=ctx,
                 name="Alice Smith",
                 email="alice@example.com",
                 phone="+123456789",
             )
             c2 = await contact_service.create_contact(
-                organization_id=org.id,
-                user=user,
+                ctx=ctx,
                 name="Bob Jones",
                 email="bob@example.com",
             )
@@ -51,8 +55,7 @@ async def seed_data():
             # 3. Create Deals
             logger.info("Creating deals...")
             await deal_service.create_deal(
-                organization_id=org.id,
-                user=user,
+                ctx=ctx,
                 contact_id=c1.id,
                 title="Big Enterprise Contract",
                 amount=Decimal("50000.00"),
@@ -60,8 +63,7 @@ async def seed_data():
             )
 
             d2 = await deal_service.create_deal(
-                organization_id=org.id,
-                user=user,
+                ctx=ctx,
                 contact_id=c2.id,
                 title="Small Consulting Gig",
                 amount=Decimal("5000.00"),
@@ -69,8 +71,7 @@ async def seed_data():
             # Advance stage for d2
             await deal_service.update_deal(
                 deal_id=d2.id,
-                organization_id=org.id,
-                user=user,
+                ctx=ctx,
                 stage=DealStage.NEGOTIATION,
             )
 
@@ -0,0 +1,31 @@
+import asyncio
+import logging
+import sys
+from datetime import UTC, date, datetime
+
+from src.core.config import settings
+from src.core.database import AsyncSessionLocal
+from src.services.analytics import snapshot_pipelines
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main(day: date) -> None:
+    """Snapshot the pipelines of all organizations for ``day``, e.g. from
+    cron when the in-app job is disabled."""
+    processed = await snapshot_pipelines(
+        AsyncSessionLocal, day, settings.PIPELINE_SNAPSHOT_BATCH_SIZE
+    )
+    logger.info(
+        "Snapshotted pipelines of %d organizations for %s", processed, day
+    )
+
+
+if __name__ == "__main__":
+    day = (
+        date.fromisoformat(sys.argv[1])
+        if len(sys.argv) > 1
+        else datetime.now(UTC).date()
+    )
+    asyncio.run(main(day))
@@ -1,11 +1,10 @@
-from collections.abc import Sequence
-
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import NotFoundError, ValidationError
-from src.models import Activity, User
+from src.core.pagination import Cursor, Page, next_cursor
+from src.domain import TenantContext
+from src.models import Activity
 from src.repositories import ActivityRepository, DealRepository
-from src.services.organization import OrganizationService
 
 
 class ActivityService:
@@ -13,40 +12,48 @@ class ActivityService:
         self.session = session
         self.repo = ActivityRepository(session)
         self.deal_repo = DealRepository(session)
-        self.org_service = OrganizationService(session)
 
     async def get_activities(
         self,
         deal_id: int,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
         page: int = 1,
         page_size: int = 50,
-    ) -> Sequence[Activity]:
-        """Get activities for a deal."""
-        await self.org_service.get_membership(organization_id, user)
+        cursor: str | None = None,
+    ) -> Page:
+        """Get activities for a deal, newest first.
+
+        With ``cursor`` the page after it is returned and ``page`` is
+        ignored; every full page carries the cursor to the next one.
+        """
+        after = Cursor.decode(cursor, "created_at:desc") if cursor else None
 
         # Validate deal belongs to organization
         deal = await self.deal_repo.get_by_id(deal_id)
-        if not deal or deal.organization_id != organization_id:
+        if not deal or deal.organization_id != ctx.organization_id:
             raise NotFoundError("Deal not found")
 
-        skip = (page - 1) * page_size
-        return await self.repo.get_by_deal(deal_id, skip=skip, limit=page_size)
+        skip = 0 if after else (page - 1) * page_size
+        activities = await self.repo.get_by_deal(
+            deal_id, skip=skip, limit=page_size, after=after
+        )
+        return Page(
+            activities,
+            next_cursor=next_cursor(
+                activities, page_size, "created_at:desc", "created_at"
+            ),
+        )
 
     async def create_comment(
         self,
         deal_id: int,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
         text: str,
     ) -> Activity:
         """Create comment activity (only type users can create directly)."""
-        await self.org_service.get_membership(organization_id, user)
-
         # Validate deal belongs to organization
         deal = await self.deal_repo.get_by_id(deal_id)
-        if not deal or deal.organization_id != organization_id:
+        if not deal or deal.organization_id != ctx.organization_id:
             raise NotFoundError("Deal not found")
 
         if not text or not text.strip():
@@ -54,7 +61,7 @@ class ActivityService:
 
         activity = await self.repo.create_comment(
             deal_id=deal_id,
-            author_id=user.id,
+            author_id=ctx.user.id,
             text=text.strip(),
         )
         await self.session.commit()
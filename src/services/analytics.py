@@ -1,33 +1,175 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.core import cache
-from src.models import User
-from src.repositories import DealRepository
-from src.services.organization import OrganizationService
+from src.core.config import settings
+from src.core.database import try_advisory_lock
+from src.domain import TenantContext
+from src.repositories import (
+    DealRepository,
+    DealRollupRepository,
+    DealSnapshotRepository,
+    OrganizationRepository,
+)
+
+ANALYTICS_CACHE = cache.Namespace("analytics")
+# Period warmed for the summary, the default of the analytics endpoint
+DEFAULT_SUMMARY_DAYS = 30
+
+# Advisory lock names: one worker runs each periodic job at a time
+WARMER_LOCK = "analytics:warmer"
+SNAPSHOT_LOCK = "analytics:snapshot"
 
-CACHE_TTL = 60  # seconds
+logger = logging.getLogger(__name__)
 
 
 class AnalyticsService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.deal_repo = DealRepository(session)
-        self.org_service = OrganizationService(session)
+        self.rollup_repo = DealRollupRepository(session)
+        self.snapshot_repo = DealSnapshotRepository(session)
+
+    @staticmethod
+    async def invalidate_cache(organization_id: int) -> None:
+        """Drop cached analytics of an organization (call after deal writes)."""
+        await ANALYTICS_CACHE.invalidate_tenant(organization_id)
+
+    async def rebuild_rollups(self, organization_id: int | None = None) -> None:
+        """Recompute deal rollups from the deals table, for one organization
+        or all of them, for deals written outside ``DealService``."""
+        await self.rollup_repo.rebuild(organization_id)
+        await self.session.commit()
+        if organization_id is not None:
+            await self.invalidate_cache(organization_id)
+        else:
+            await ANALYTICS_CACHE.invalidate()
 
     async def get_deals_summary(
-        self,
-        organization_id: int,
-        user: User,
-        days: int = 30,
+        self, ctx: TenantContext, days: int = 30, as_of: date | None = None
+    ) -> dict:
+        """Get deals summary analytics with caching.
+
+        With ``as_of`` the summary is read from the latest pipeline snapshot
+        on or before that day instead of the current rollups.
+        """
+        return await self._cached_summary(ctx.organization_id, days, as_of)
+
+    async def get_deals_funnel(
+        self, ctx: TenantContext, as_of: date | None = None
+    ) -> dict:
+        """Get sales funnel analytics with caching (``as_of`` as for the
+        summary)."""
+        return await self._cached_funnel(ctx.organization_id, as_of)
+
+    async def warm_cache(self, organization_id: int) -> None:
+        """Recompute and store the analytics of an organization (no access
+        check).
+
+        Values are computed in this session and written whether or not a
+        stale one is cached, never through background refreshes, so the
+        warmer's concurrency bounds the connections it uses.
+        """
+        summary_key = await self._summary_key(
+            organization_id, DEFAULT_SUMMARY_DAYS
+        )
+        summary = await self._compute_summary(
+            organization_id, DEFAULT_SUMMARY_DAYS
+        )
+        await self._store(summary_key, summary)
+
+        funnel_key = await self._funnel_key(organization_id)
+        await self._store(
+            funnel_key, await self._compute_funnel(organization_id)
+        )
+
+    @staticmethod
+    async def _store(cache_key: str, value: dict) -> None:
+        await cache.set(
+            cache_key,
+            value,
+            ttl=settings.ANALYTICS_CACHE_TTL_SECONDS,
+            soft_ttl=settings.ANALYTICS_CACHE_SOFT_TTL_SECONDS,
+        )
+
+    @staticmethod
+    async def _summary_key(
+        organization_id: int, days: int, as_of: date | None = None
+    ) -> str:
+        return await ANALYTICS_CACHE.key(
+            "summary",
+            {"days": days, "as_of": as_of and as_of.isoformat()},
+            tenant=organization_id,
+        )
+
+    @staticmethod
+    async def _funnel_key(
+        organization_id: int, as_of: date | None = None
+    ) -> str:
+        return await ANALYTICS_CACHE.key(
+            "funnel",
+            {"as_of": as_of and as_of.isoformat()},
+            tenant=organization_id,
+        )
+
+    async def _cached_summary(
+        self, organization_id: int, days: int, as_of: date | None = None
     ) -> dict:
-        """Get deals summary analytics with caching."""
-        await self.org_service.get_membership(organization_id, user)
+        cache_key = await self._summary_key(organization_id, days, as_of)
+        return await cache.get_or_set(
+            cache_key,
+            lambda: self._compute_summary(organization_id, days, as_of),
+            ttl=settings.ANALYTICS_CACHE_TTL_SECONDS,
+            soft_ttl=settings.ANALYTICS_CACHE_SOFT_TTL_SECONDS,
+            refresh=lambda: self._in_new_session(
+                lambda service: service._compute_summary(
+                    organization_id, days, as_of
+                )
+            ),
+        )
 
-        cache_key = f"analytics:summary:{organization_id}:{days}"
-        if cached := cache.get(cache_key):
-            return cached
+    async def _cached_funnel(
+        self, organization_id: int, as_of: date | None = None
+    ) -> dict:
+        cache_key = await self._funnel_key(organization_id, as_of)
+        return await cache.get_or_set(
+            cache_key,
+            lambda: self._compute_funnel(organization_id, as_of),
+            ttl=settings.ANALYTICS_CACHE_TTL_SECONDS,
+            soft_ttl=settings.ANALYTICS_CACHE_SOFT_TTL_SECONDS,
+            refresh=lambda: self._in_new_session(
+                lambda service: service._compute_funnel(organization_id, as_of)
+            ),
+        )
 
-        summary = await self.deal_repo.get_summary(organization_id, days=days)
+    async def _in_new_session(
+        self, compute: Callable[["AnalyticsService"], Awaitable[dict]]
+    ) -> dict:
+        """Run a computation in its own session, for background refreshes
+        that outlive the request session."""
+        session_factory = async_sessionmaker(
+            bind=self.session.bind, expire_on_commit=False
+        )
+        async with session_factory() as session:
+            return await compute(AnalyticsService(session))
+
+    async def _compute_summary(
+        self, organization_id: int, days: int, as_of: date | None = None
+    ) -> dict:
+        day = None
+        if as_of is None:
+            summary = await self.rollup_repo.get_summary(
+                organization_id, days=days
+            )
+        else:
+            day = await self.snapshot_repo.get_day(organization_id, as_of)
+            summary = await self.snapshot_repo.get_summary(
+                organization_id, day, days=days
+            )
 
         result = {
             "by_status": {
@@ -40,24 +182,21 @@ class AnalyticsService:
             "avg_won_amount": float(summary["avg_won_amount"]),
             "new_deals_last_n_days": summary["new_deals_last_n_days"],
             "days": summary["days"],
+            "as_of": day,
         }
-
-        cache.set(cache_key, result, CACHE_TTL)
         return result
 
-    async def get_deals_funnel(
-        self,
-        organization_id: int,
-        user: User,
+    async def _compute_funnel(
+        self, organization_id: int, as_of: date | None = None
     ) -> dict:
-        """Get sales funnel analytics with caching."""
-        await self.org_service.get_membership(organization_id, user)
-
-        cache_key = f"analytics:funnel:{organization_id}"
-        if cached := cache.get(cache_key):
-            return cached
-
-        funnel_data = await self.deal_repo.get_funnel(organization_id)
+        day = None
+        if as_of is None:
+            funnel_data = await self.rollup_repo.get_funnel(organization_id)
+        else:
+            day = await self.snapshot_repo.get_day(organization_id, as_of)
+            funnel_data = await self.snapshot_repo.get_funnel(
+                organization_id, day
+            )
 
         result = {
             "stages": {
@@ -70,8 +209,133 @@ class AnalyticsService:
                     "conversion_from_prev": data.get("conversion_from_prev", 0),
                 }
                 for stage, data in funnel_data.items()
-            }
+            },
+            "as_of": day,
         }
-
-        cache.set(cache_key, result, CACHE_TTL)
         return result
+
+
+async def warm_active_organizations(
+    session_factory: async_sessionmaker[AsyncSession],
+    limit: int,
+    concurrency: int,
+) -> int:
+    """Warm analytics of the ``limit`` most recently active organizations.
+
+    At most ``concurrency`` organizations are computed at once, each in its
+    own session, so warming holds at most that many DB connections plus
+    the one holding the warmer lock. Returns the number of organizations
+    warmed, 0 when another worker holds the warmer lock and is warming
+    already.
+    """
+    async with try_advisory_lock(session_factory, WARMER_LOCK) as leader:
+        if not leader:
+            return 0
+        return await _warm(session_factory, limit, concurrency)
+
+
+async def _warm(
+    session_factory: async_sessionmaker[AsyncSession],
+    limit: int,
+    concurrency: int,
+) -> int:
+    async with session_factory() as session:
+        organization_ids = await DealRepository(
+            session
+        ).get_recently_active_organization_ids(limit)
+
+    slots = asyncio.Semaphore(concurrency)
+
+    async def warm(organization_id: int) -> bool:
+        async with slots, session_factory() as session:
+            try:
+                await AnalyticsService(session).warm_cache(organization_id)
+            except Exception:
+                logger.exception(
+                    "Failed to warm analytics of organization %d",
+                    organization_id,
+                )
+                return False
+            return True
+
+    results = await asyncio.gather(*(warm(i) for i in organization_ids))
+    return sum(results)
+
+
+async def run_warmer(
+    session_factory: async_sessionmaker[AsyncSession],
+    interval: float,
+    limit: int,
+    concurrency: int,
+) -> None:
+    """Warm active organizations on startup, then every ``interval``."""
+    while True:
+        try:
+            warmed = await warm_active_organizations(
+                session_factory, limit, concurrency
+            )
+            logger.info("Warmed analytics of %d organizations", warmed)
+        except Exception:
+            logger.exception("Analytics cache warming failed")
+        await asyncio.sleep(interval)
+
+
+async def snapshot_pipelines(
+    session_factory: async_sessionmaker[AsyncSession],
+    day: date,
+    batch_size: int,
+) -> int:
+    """Snapshot the deal rollups of every organization for ``day``.
+
+    Organizations are walked in id order, ``batch_size`` per transaction,
+    so a run over many tenants never holds one long transaction. Returns
+    the number of organizations processed, 0 when another worker (or the
+    snapshot script) holds the snapshot lock and is snapshotting already.
+    """
+    async with try_advisory_lock(session_factory, SNAPSHOT_LOCK) as leader:
+        if not leader:
+            return 0
+        return await _snapshot(session_factory, day, batch_size)
+
+
+async def _snapshot(
+    session_factory: async_sessionmaker[AsyncSession],
+    day: date,
+    batch_size: int,
+) -> int:
+    after_id = 0
+    processed = 0
+    while True:
+        async with session_factory() as session:
+            organization_ids = await OrganizationRepository(
+                session
+            ).get_ids_after(after_id, batch_size)
+            if not organization_ids:
+                return processed
+            await DealSnapshotRepository(session).take(day, organization_ids)
+            await session.commit()
+        processed += len(organization_ids)
+        after_id = organization_ids[-1]
+
+
+async def run_snapshotter(
+    session_factory: async_sessionmaker[AsyncSession],
+    interval: float,
+    batch_size: int,
+) -> None:
+    """Snapshot pipelines for the current (UTC) day on startup, then every
+    ``interval``; the last run of a day stands as that day's snapshot."""
+    while True:
+        day = datetime.now(UTC).date()
+        try:
+            processed = await snapshot_pipelines(
+                session_factory, day, batch_size
+            )
+            logger.info(
+                "Snapshotted pipelines of %d organizations for %s",
+                processed,
+                day,
+            )
+        except Exception:
+            logger.exception("Pipeline snapshot failed")
+        await asyncio.sleep(interval)
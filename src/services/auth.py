@@ -1,5 +1,10 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import logging
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core import cache
+from src.core.config import settings
 from src.core.exceptions import (
     ConflictError,
     UnauthorizedError,
@@ -8,12 +13,19 @@ from src.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    password_needs_update,
+    verify_password_async,
 )
+from src.domain import Principal
 from src.models import User, UserRole
 from src.repositories import OrganizationRepository, UserRepository
 
+logger = logging.getLogger(__name__)
+
+# Running background rehashes (kept referenced until they finish)
+_rehash_tasks: set[asyncio.Task] = set()
+
 
 class AuthService:
     def __init__(self, session: AsyncSession):
@@ -35,7 +47,7 @@ class AuthService:
             raise ConflictError("User with this email already exists")
 
         # Create user
-        hashed = hash_password(password)
+        hashed = await hash_password_async(password)
         user = await self.user_repo.create(
             email=email,
             hashed_password=hashed,
@@ -51,7 +63,7 @@ class AuthService:
         await self.session.commit()
 
         # Generate tokens
-        tokens = self._generate_tokens(user.id)
+        tokens = await self._generate_tokens(user)
 
         return {
             "user": user,
@@ -65,10 +77,17 @@ class AuthService:
         if not user:
             raise UnauthorizedError("Invalid email or password")
 
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             raise UnauthorizedError("Invalid email or password")
 
-        tokens = self._generate_tokens(user.id)
+        if password_needs_update(user.hashed_password):
+            task = asyncio.create_task(
+                self._rehash_password(user.id, user.hashed_password, password)
+            )
+            _rehash_tasks.add(task)
+            task.add_done_callback(_rehash_tasks.discard)
+
+        tokens = await self._generate_tokens(user)
 
         return {
             "user": user,
@@ -89,15 +108,20 @@ class AuthService:
         if not user:
             raise UnauthorizedError("User not found")
 
-        tokens = self._generate_tokens(user.id)
+        tokens = await self._generate_tokens(user)
 
         return {
             "user": user,
             **tokens,
         }
 
-    async def get_current_user(self, token: str) -> User:
-        """Get current user from access token."""
+    @staticmethod
+    async def invalidate_principal(user_id: int) -> None:
+        """Drop the cached principal of a user (call after user changes)."""
+        await cache.delete(_principal_key(user_id))
+
+    async def get_current_user(self, token: str) -> Principal:
+        """Get current user from access token, cached for a short TTL."""
         payload = decode_token(token)
         if not payload or payload.get("type") != "access":
             raise UnauthorizedError("Invalid access token")
@@ -106,15 +130,52 @@ class AuthService:
         if not user_id:
             raise UnauthorizedError("Invalid access token")
 
+        cache_key = _principal_key(int(user_id))
+        principal = await cache.get(cache_key)
+        if principal is not None:
+            return principal
+
         user = await self.user_repo.get_by_id(int(user_id))
         if not user:
             raise UnauthorizedError("User not found")
 
-        return user
-
-    def _generate_tokens(self, user_id: int) -> dict:
+        principal = Principal.from_user(user)
+        await cache.set(
+            cache_key, principal, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+        )
+        return principal
+
+    async def _rehash_password(
+        self, user_id: int, old_hash: str, password: str
+    ) -> None:
+        """Store a hash with the current parameters, in its own session so
+        it outlives the login request."""
+        try:
+            new_hash = await hash_password_async(password)
+            session_factory = async_sessionmaker(bind=self.session.bind)
+            async with session_factory() as session:
+                await UserRepository(session).replace_password_hash(
+                    user_id, old_hash, new_hash
+                )
+                await session.commit()
+        except Exception:
+            # The next successful login retries
+            logger.exception("Failed to rehash password of user %d", user_id)
+
+    async def _generate_tokens(self, user: User) -> dict:
+        claims: dict = {"sub": str(user.id)}
+        if settings.ACCESS_TOKEN_ROLE_CLAIMS:
+            roles = await self.org_repo.get_user_roles(user.id)
+            claims["orgs"] = {
+                str(org): role.value for org, role in roles.items()
+            }
+            claims["mv"] = user.membership_version
         return {
-            "access_token": create_access_token({"sub": str(user_id)}),
-            "refresh_token": create_refresh_token({"sub": str(user_id)}),
+            "access_token": create_access_token(claims),
+            "refresh_token": create_refresh_token({"sub": str(user.id)}),
             "token_type": "bearer",
         }
+
+
+def _principal_key(user_id: int) -> str:
+    return f"principal:{user_id}"
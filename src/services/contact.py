@@ -1,78 +1,83 @@
-from collections.abc import Sequence
-
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import ConflictError, ForbiddenError, NotFoundError
-from src.models import Contact, User
+from src.core.pagination import CountStrategy, Cursor, Page, next_cursor
+from src.domain import TenantContext, can_manage_all
+from src.models import Contact
 from src.repositories import ContactRepository
-from src.services.organization import OrganizationService
+from src.repositories.contact import TRIGRAM_MIN_LENGTH
 
 
 class ContactService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.repo = ContactRepository(session)
-        self.org_service = OrganizationService(session)
 
     async def get_contacts(
         self,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
         page: int = 1,
         page_size: int = 20,
         search: str | None = None,
         owner_id: int | None = None,
-    ) -> tuple[Sequence[Contact], int]:
-        """Get paginated contacts for organization."""
-        member = await self.org_service.get_membership(organization_id, user)
-
+        cursor: str | None = None,
+        include_total: bool = True,
+        count: CountStrategy = CountStrategy.EXACT,
+    ) -> Page:
+        """Get paginated contacts for organization.
+
+        With ``cursor`` the page after it is returned and ``page`` is
+        ignored; every full page carries the cursor to the next one.
+        ``total`` is counted with ``count``, ``None`` unless
+        ``include_total``.
+        """
         # Members can only filter by owner if it's themselves
-        if owner_id is not None and not self.org_service.can_manage_all(member):
-            owner_id = user.id
-
-        skip = (page - 1) * page_size
-        contacts = await self.repo.get_by_organization(
-            organization_id,
+        if owner_id is not None and not can_manage_all(ctx):
+            owner_id = ctx.user.id
+
+        # Ranked searches are ordered by a computed similarity, looked up
+        # again from the contact id when paging
+        ranked = search is not None and len(search) >= TRIGRAM_MIN_LENGTH
+        sort = "rank" if ranked else "name"
+        after = Cursor.decode(cursor, sort) if cursor else None
+        skip = 0 if after else (page - 1) * page_size
+        result = await self.repo.get_page(
+            ctx.organization_id,
             skip=skip,
             limit=page_size,
             search=search,
             owner_id=owner_id,
-        )
-        total = await self.repo.count_by_organization(
-            organization_id, search=search, owner_id=owner_id
+            after=after,
+            count=count if include_total else None,
         )
 
-        return contacts, total
+        key = None if ranked else "name"
+        result.next_cursor = next_cursor(result.items, page_size, sort, key)
+        return result
 
     async def get_contact(
         self,
         contact_id: int,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
     ) -> Contact:
         """Get single contact by ID."""
-        await self.org_service.get_membership(organization_id, user)
-
         contact = await self.repo.get_by_id(contact_id)
-        if not contact or contact.organization_id != organization_id:
+        if not contact or contact.organization_id != ctx.organization_id:
             raise NotFoundError("Contact not found")
 
         return contact
 
     async def create_contact(
         self,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
         name: str,
         email: str | None = None,
         phone: str | None = None,
     ) -> Contact:
         """Create new contact."""
-        await self.org_service.get_membership(organization_id, user)
-
         contact = await self.repo.create(
-            organization_id=organization_id,
-            owner_id=user.id,
+            organization_id=ctx.organization_id,
+            owner_id=ctx.user.id,
             name=name,
             email=email,
             phone=phone,
@@ -83,22 +88,16 @@ class ContactService:
     async def update_contact(
         self,
         contact_id: int,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
         **kwargs,
     ) -> Contact:
         """Update contact."""
-        member = await self.org_service.get_membership(organization_id, user)
-
         contact = await self.repo.get_by_id(contact_id)
-        if not contact or contact.organization_id != organization_id:
+        if not contact or contact.organization_id != ctx.organization_id:
             raise NotFoundError("Contact not found")
 
         # Members can only update their own contacts
-        if (
-            not self.org_service.can_manage_all(member)
-            and contact.owner_id != user.id
-        ):
+        if not can_manage_all(ctx) and contact.owner_id != ctx.user.id:
             raise ForbiddenError("You can only update your own contacts")
 
         # Filter out None values and owner_id (shouldn't be changed)
@@ -113,21 +112,15 @@ class ContactService:
     async def delete_contact(
         self,
         contact_id: int,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
     ) -> None:
         """Delete contact (only if no deals)."""
-        member = await self.org_service.get_membership(organization_id, user)
-
         contact = await self.repo.get_by_id(contact_id)
-        if not contact or contact.organization_id != organization_id:
+        if not contact or contact.organization_id != ctx.organization_id:
             raise NotFoundError("Contact not found")
 
         # Members can only delete their own contacts
-        if (
-            not self.org_service.can_manage_all(member)
-            and contact.owner_id != user.id
-        ):
+        if not can_manage_all(ctx) and contact.owner_id != ctx.user.id:
             raise ForbiddenError("You can only delete your own contacts")
 
         # Check for existing deals
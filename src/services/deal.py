@@ -1,23 +1,26 @@
-from collections.abc import Sequence
 from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports import DealRepositoryProtocol
 from src.core.exceptions import ForbiddenError, NotFoundError, ValidationError
+from src.core.pagination import CountStrategy, Cursor, Page, next_cursor
 from src.domain import (
     DealStage,
     DealStatus,
+    TenantContext,
+    can_manage_all,
     ensure_stage_change_is_valid,
     ensure_status_change_is_valid,
 )
-from src.models import Deal, User
+from src.models import Deal
 from src.repositories import (
     ActivityRepository,
     ContactRepository,
     DealRepository,
+    DealRollupRepository,
 )
-from src.services.organization import OrganizationService
+from src.services.analytics import AnalyticsService
 
 
 class DealService:
@@ -30,12 +33,11 @@ class DealService:
         self.repo = deal_repo or DealRepository(session)
         self.contact_repo = ContactRepository(session)
         self.activity_repo = ActivityRepository(session)
-        self.org_service = OrganizationService(session)
+        self.rollup_repo = DealRollupRepository(session)
 
     async def get_deals(
         self,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
         page: int = 1,
         page_size: int = 20,
         status: list[DealStatus] | None = None,
@@ -45,17 +47,26 @@ class DealService:
         max_amount: Decimal | None = None,
         order_by: str = "created_at",
         order: str = "desc",
-    ) -> tuple[Sequence[Deal], int]:
-        """Get paginated deals for organization."""
-        member = await self.org_service.get_membership(organization_id, user)
-
+        cursor: str | None = None,
+        include_total: bool = True,
+        count: CountStrategy = CountStrategy.EXACT,
+    ) -> Page:
+        """Get paginated deals for organization.
+
+        With ``cursor`` the page after it is returned and ``page`` is
+        ignored; every full page carries the cursor to the next one.
+        ``total`` is counted with ``count``, ``None`` unless
+        ``include_total``.
+        """
         # Members can only filter by owner if it's themselves
-        if owner_id is not None and not self.org_service.can_manage_all(member):
-            owner_id = user.id
-
-        skip = (page - 1) * page_size
-        deals = await self.repo.get_by_organization(
-            organization_id,
+        if owner_id is not None and not can_manage_all(ctx):
+            owner_id = ctx.user.id
+
+        sort = f"{order_by}:{order}"
+        after = Cursor.decode(cursor, sort) if cursor else None
+        skip = 0 if after else (page - 1) * page_size
+        result = await self.repo.get_page(
+            ctx.organization_id,
             skip=skip,
             limit=page_size,
             status=status,
@@ -65,79 +76,73 @@ class DealService:
             max_amount=max_amount,
             order_by=order_by,
             order=order,
-        )
-        total = await self.repo.count_by_organization(
-            organization_id, status=status, stage=stage, owner_id=owner_id
+            after=after,
+            count=count if include_total else None,
         )
 
-        return deals, total
+        result.next_cursor = next_cursor(
+            result.items, page_size, sort, key=order_by
+        )
+        return result
 
     async def get_deal(
         self,
         deal_id: int,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
     ) -> Deal:
         """Get single deal by ID."""
-        await self.org_service.get_membership(organization_id, user)
-
         deal = await self.repo.get_by_id(deal_id)
-        if not deal or deal.organization_id != organization_id:
+        if not deal or deal.organization_id != ctx.organization_id:
             raise NotFoundError("Deal not found")
 
         return deal
 
     async def create_deal(
         self,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
         contact_id: int,
         title: str,
         amount: Decimal = Decimal(0),
         currency: str = "USD",
     ) -> Deal:
         """Create new deal."""
-        await self.org_service.get_membership(organization_id, user)
-
         # Validate contact belongs to same organization
         contact = await self.contact_repo.get_by_id(contact_id)
-        if not contact or contact.organization_id != organization_id:
+        if not contact or contact.organization_id != ctx.organization_id:
             raise ValidationError("Contact not found in this organization")
 
         deal = await self.repo.create(
-            organization_id=organization_id,
+            organization_id=ctx.organization_id,
             contact_id=contact_id,
-            owner_id=user.id,
+            owner_id=ctx.user.id,
             title=title,
             amount=amount,
             currency=currency,
             status=DealStatus.NEW,
             stage=DealStage.QUALIFICATION,
         )
+        await self.rollup_repo.apply(
+            ctx.organization_id, [(deal.stage, deal.status, 1, deal.amount)]
+        )
         await self.session.commit()
+        await AnalyticsService.invalidate_cache(ctx.organization_id)
         return deal
 
     async def update_deal(
         self,
         deal_id: int,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
         status: DealStatus | None = None,
         stage: DealStage | None = None,
         **kwargs,
     ) -> Deal:
         """Update deal with business rule validations."""
-        member = await self.org_service.get_membership(organization_id, user)
-
-        deal = await self.repo.get_by_id(deal_id)
-        if not deal or deal.organization_id != organization_id:
+        deal = await self.repo.get_for_update(deal_id)
+        if not deal or deal.organization_id != ctx.organization_id:
             raise NotFoundError("Deal not found")
 
         # Members can only update their own deals
-        if (
-            not self.org_service.can_manage_all(member)
-            and deal.owner_id != user.id
-        ):
+        if not can_manage_all(ctx) and deal.owner_id != ctx.user.id:
             raise ForbiddenError("You can only update your own deals")
 
         # Validate status change
@@ -146,7 +151,7 @@ class DealService:
 
         # Validate stage change
         if stage is not None:
-            ensure_stage_change_is_valid(deal, stage, member)
+            ensure_stage_change_is_valid(deal, stage, ctx)
 
         # Build update data
         update_data = {
@@ -158,6 +163,7 @@ class DealService:
 
         old_status = deal.status
         old_stage = deal.stage
+        old_amount = deal.amount
 
         if status is not None:
             update_data["status"] = status
@@ -165,12 +171,19 @@ class DealService:
             update_data["stage"] = stage
 
         deal = await self.repo.update(deal, **update_data)
+        await self.rollup_repo.apply(
+            ctx.organization_id,
+            [
+                (old_stage, old_status, -1, -old_amount),
+                (deal.stage, deal.status, 1, deal.amount),
+            ],
+        )
 
         # Create activity records for status/stage changes
         if status is not None and status != old_status:
             await self.activity_repo.create_status_changed(
                 deal_id=deal.id,
-                author_id=user.id,
+                author_id=ctx.user.id,
                 old_status=old_status.value,
                 new_status=status.value,
             )
@@ -178,33 +191,32 @@ class DealService:
         if stage is not None and stage != old_stage:
             await self.activity_repo.create_stage_changed(
                 deal_id=deal.id,
-                author_id=user.id,
+                author_id=ctx.user.id,
                 old_stage=old_stage.value,
                 new_stage=stage.value,
             )
 
         await self.session.commit()
+        await AnalyticsService.invalidate_cache(ctx.organization_id)
         return deal
 
     async def delete_deal(
         self,
         deal_id: int,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
     ) -> None:
         """Delete deal."""
-        member = await self.org_service.get_membership(organization_id, user)
-
-        deal = await self.repo.get_by_id(deal_id)
-        if not deal or deal.organization_id != organization_id:
+        deal = await self.repo.get_for_update(deal_id)
+        if not deal or deal.organization_id != ctx.organization_id:
             raise NotFoundError("Deal not found")
 
         # Members can only delete their own deals
-        if (
-            not self.org_service.can_manage_all(member)
-            and deal.owner_id != user.id
-        ):
+        if not can_manage_all(ctx) and deal.owner_id != ctx.user.id:
             raise ForbiddenError("You can only delete your own deals")
 
         await self.repo.delete(deal)
+        await self.rollup_repo.apply(
+            ctx.organization_id, [(deal.stage, deal.status, -1, -deal.amount)]
+        )
         await self.session.commit()
+        await AnalyticsService.invalidate_cache(ctx.organization_id)
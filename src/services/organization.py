@@ -1,110 +1,193 @@
 from collections.abc import Sequence
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core import cache
+from src.core.config import settings
 from src.core.exceptions import ForbiddenError, NotFoundError, ValidationError
-from src.domain import UserRole, can_manage_all, can_modify_settings
-from src.models import Organization, OrganizationMember, User
-from src.repositories import OrganizationRepository
+from src.domain import (
+    Membership,
+    Principal,
+    TenantContext,
+    UserRole,
+    can_manage_all,
+    can_modify_settings,
+)
+from src.models import Organization, OrganizationMember
+from src.repositories import OrganizationRepository, UserRepository
+
+# Memberships and membership versions, partitioned per user: a change bumps
+# the user's generation, so a read that started before it can only write
+# its stale result under a key that is no longer looked up
+MEMBERSHIP_CACHE = cache.Namespace("membership")
 
 
 class OrganizationService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.repo = OrganizationRepository(session)
+        self.user_repo = UserRepository(session)
 
     async def get_user_organizations(
-        self, user: User
+        self, user: Principal
     ) -> Sequence[Organization]:
         """Get all organizations where user is a member."""
         return await self.repo.get_user_organizations(user.id)
 
+    @staticmethod
+    async def invalidate_membership(organization_id: int, user_id: int) -> None:
+        """Drop the cached memberships of a user (call after membership
+        changes are committed)."""
+        await MEMBERSHIP_CACHE.invalidate_tenant(_user_tag(user_id))
+
+    async def record_membership_change(
+        self, organization_id: int, user_id: int
+    ) -> None:
+        """Commit a membership change made outside this service (admin)."""
+        await self.user_repo.bump_membership_version(user_id)
+        await self.session.commit()
+        await self.invalidate_membership(organization_id, user_id)
+
+    async def get_membership_version(self, user_id: int) -> int | None:
+        """Current membership version of a user, ``None`` if there is no
+        such user.
+
+        It decides whether token role claims are trusted, so it is only
+        cached in a shared backend: a per-process copy misses changes made
+        through other workers.
+        """
+        if not cache.is_shared():
+            return await self.user_repo.get_membership_version(user_id)
+        cache_key = await MEMBERSHIP_CACHE.key(
+            "version", {}, tenant=_user_tag(user_id)
+        )
+        version = await cache.get(cache_key)
+        if version is None:
+            version = await self.user_repo.get_membership_version(user_id)
+            if version is not None:
+                await cache.set(
+                    cache_key,
+                    version,
+                    ttl=_membership_ttl(),
+                )
+        return version
+
     async def get_membership(
-        self, organization_id: int, user: User
-    ) -> OrganizationMember:
+        self, organization_id: int, user: Principal
+    ) -> Membership:
         """Get user's membership in organization or raise error."""
+        cache_key = await MEMBERSHIP_CACHE.key(
+            "membership",
+            {"organization_id": organization_id},
+            tenant=_user_tag(user.id),
+        )
+        membership = await cache.get(cache_key)
+        if membership is not None:
+            return membership
+
         member = await self.repo.get_member(organization_id, user.id)
         if not member:
             raise ForbiddenError("You are not a member of this organization")
-        return member
 
-    async def check_permission(
+        membership = Membership.from_member(member)
+        await cache.set(cache_key, membership, ttl=_membership_ttl())
+        return membership
+
+    async def get_context(
         self,
         organization_id: int,
-        user: User,
+        user: Principal,
+        claims: dict[str, Any] | None = None,
+    ) -> TenantContext:
+        """Resolve who acts in which organization with which role.
+
+        Role claims of the access token are trusted while their membership
+        version is current; otherwise the membership is looked up.
+        """
+        if claims is not None and "orgs" in claims:
+            version = await self.get_membership_version(user.id)
+            if claims.get("mv") == version:
+                role = claims["orgs"].get(str(organization_id))
+                if role is None:
+                    raise ForbiddenError(
+                        "You are not a member of this organization"
+                    )
+                return TenantContext(
+                    user=user,
+                    organization_id=organization_id,
+                    role=UserRole(role),
+                )
+
+        membership = await self.get_membership(organization_id, user)
+        return TenantContext(
+            user=user, organization_id=organization_id, role=membership.role
+        )
+
+    def check_permission(
+        self,
+        ctx: TenantContext,
         required_roles: list[UserRole] | None = None,
-    ) -> OrganizationMember:
+    ) -> None:
         """Check if user has required role in organization."""
-        member = await self.get_membership(organization_id, user)
-
-        if required_roles and member.role not in required_roles:
+        if required_roles and ctx.role not in required_roles:
             raise ForbiddenError("You don't have permission for this action")
 
-        return member
-
     async def add_member(
         self,
-        organization_id: int,
+        ctx: TenantContext,
         user_id: int,
         role: UserRole,
-        current_user: User,
     ) -> OrganizationMember:
         """Add new member to organization (admin/owner only)."""
-        await self.check_permission(
-            organization_id, current_user, [UserRole.OWNER, UserRole.ADMIN]
-        )
+        self.check_permission(ctx, [UserRole.OWNER, UserRole.ADMIN])
 
         # Check if already a member
-        existing = await self.repo.get_member(organization_id, user_id)
+        existing = await self.repo.get_member(ctx.organization_id, user_id)
         if existing:
             raise ValidationError(
                 "User is already a member of this organization"
             )
 
-        member = await self.repo.add_member(organization_id, user_id, role)
+        member = await self.repo.add_member(ctx.organization_id, user_id, role)
+        await self.user_repo.bump_membership_version(user_id)
         await self.session.commit()
+        await self.invalidate_membership(ctx.organization_id, user_id)
         return member
 
     async def update_member_role(
         self,
-        organization_id: int,
+        ctx: TenantContext,
         user_id: int,
         new_role: UserRole,
-        current_user: User,
     ) -> OrganizationMember:
         """Update member's role (admin/owner only)."""
-        await self.check_permission(
-            organization_id, current_user, [UserRole.OWNER, UserRole.ADMIN]
-        )
+        self.check_permission(ctx, [UserRole.OWNER, UserRole.ADMIN])
 
-        member = await self.repo.get_member(organization_id, user_id)
+        member = await self.repo.get_member(ctx.organization_id, user_id)
         if not member:
             raise NotFoundError("Member not found")
 
         # Only owner can change to/from owner role
         if member.role == UserRole.OWNER or new_role == UserRole.OWNER:
-            current_member = await self.repo.get_member(
-                organization_id, current_user.id
-            )
-            if not current_member or current_member.role != UserRole.OWNER:
+            if ctx.role != UserRole.OWNER:
                 raise ForbiddenError("Only owner can change owner role")
 
         member = await self.repo.update_member_role(member, new_role)
+        await self.user_repo.bump_membership_version(user_id)
         await self.session.commit()
+        await self.invalidate_membership(ctx.organization_id, user_id)
         return member
 
     async def remove_member(
         self,
-        organization_id: int,
+        ctx: TenantContext,
         user_id: int,
-        current_user: User,
     ) -> None:
         """Remove member from organization (admin/owner only)."""
-        await self.check_permission(
-            organization_id, current_user, [UserRole.OWNER, UserRole.ADMIN]
-        )
+        self.check_permission(ctx, [UserRole.OWNER, UserRole.ADMIN])
 
-        member = await self.repo.get_member(organization_id, user_id)
+        member = await self.repo.get_member(ctx.organization_id, user_id)
         if not member:
             raise NotFoundError("Member not found")
 
@@ -113,12 +196,29 @@ class OrganizationService:
             raise ValidationError("Cannot remove organization owner")
 
         await self.repo.remove_member(member)
+        await self.user_repo.bump_membership_version(user_id)
         await self.session.commit()
+        await self.invalidate_membership(ctx.organization_id, user_id)
 
-    def can_manage_all(self, member: OrganizationMember) -> bool:
+    def can_manage_all(self, ctx: TenantContext) -> bool:
         """Check if member can manage all entities (not just their own)."""
-        return can_manage_all(member)
+        return can_manage_all(ctx)
 
-    def can_modify_settings(self, member: OrganizationMember) -> bool:
+    def can_modify_settings(self, ctx: TenantContext) -> bool:
         """Check if member can modify organization settings."""
-        return can_modify_settings(member)
+        return can_modify_settings(ctx)
+
+
+def _membership_ttl() -> float:
+    # A per-process cache never hears of changes made by other workers
+    if cache.is_shared():
+        return settings.MEMBERSHIP_CACHE_TTL_SECONDS
+    return min(
+        settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+        settings.MEMBERSHIP_CACHE_LOCAL_TTL_SECONDS,
+    )
+
+
+def _user_tag(user_id: int) -> str:
+    # Distinct from organization ids, which share the global tenant tags
+    return f"user:{user_id}"
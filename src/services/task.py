@@ -1,4 +1,3 @@
-from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
@@ -6,10 +5,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.ports import TaskRepositoryProtocol
 from src.core.exceptions import ForbiddenError, NotFoundError
-from src.domain import ensure_due_date_not_in_past
-from src.models import Task, User, UserRole
+from src.core.pagination import Cursor, Page, next_cursor
+from src.domain import TenantContext, ensure_due_date_not_in_past
+from src.models import Task, UserRole
 from src.repositories import ActivityRepository, DealRepository, TaskRepository
-from src.services.organization import OrganizationService
 
 
 class TaskService:
@@ -22,84 +21,90 @@ class TaskService:
         self.repo = task_repo or TaskRepository(session)
         self.deal_repo = DealRepository(session)
         self.activity_repo = ActivityRepository(session)
-        self.org_service = OrganizationService(session)
 
     async def get_tasks(
         self,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
         deal_id: int | None = None,
         only_open: bool = False,
         due_before: datetime | None = None,
         due_after: datetime | None = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> Sequence[Task]:
-        """Get tasks for organization or specific deal."""
-        await self.org_service.get_membership(organization_id, user)
+        cursor: str | None = None,
+    ) -> Page:
+        """Get tasks for organization or specific deal, by due date.
+
+        With ``cursor`` the page after it is returned and ``page`` is
+        ignored; every full page carries the cursor to the next one.
+        """
+        after = Cursor.decode(cursor, "due_date") if cursor else None
+        skip = 0 if after else (page - 1) * page_size
 
         if deal_id:
             # Validate deal belongs to organization
             deal = await self.deal_repo.get_by_id(deal_id)
-            if not deal or deal.organization_id != organization_id:
+            if not deal or deal.organization_id != ctx.organization_id:
                 raise NotFoundError("Deal not found")
 
-            return await self.repo.get_by_deal(
+            tasks = await self.repo.get_by_deal(
                 deal_id,
                 only_open=only_open,
                 due_before=due_before,
                 due_after=due_after,
+                skip=skip,
+                limit=page_size,
+                after=after,
+            )
+        else:
+            tasks = await self.repo.get_by_organization(
+                ctx.organization_id,
+                only_open=only_open,
+                due_before=due_before,
+                due_after=due_after,
+                skip=skip,
+                limit=page_size,
+                after=after,
             )
 
-        skip = (page - 1) * page_size
-        return await self.repo.get_by_organization(
-            organization_id,
-            only_open=only_open,
-            due_before=due_before,
-            due_after=due_after,
-            skip=skip,
-            limit=page_size,
+        return Page(
+            tasks,
+            next_cursor=next_cursor(tasks, page_size, "due_date", "due_date"),
         )
 
     async def get_task(
         self,
         task_id: int,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
     ) -> Task:
         """Get single task by ID."""
-        await self.org_service.get_membership(organization_id, user)
-
         task = await self.repo.get_by_id(task_id)
         if not task:
             raise NotFoundError("Task not found")
 
         # Validate task's deal belongs to organization
         deal = await self.deal_repo.get_by_id(task.deal_id)
-        if not deal or deal.organization_id != organization_id:
+        if not deal or deal.organization_id != ctx.organization_id:
             raise NotFoundError("Task not found")
 
         return task
 
     async def create_task(
         self,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
         deal_id: int,
         title: str,
         due_date: datetime,
         description: str | None = None,
     ) -> Task:
         """Create new task for a deal."""
-        member = await self.org_service.get_membership(organization_id, user)
-
         # Validate deal belongs to organization
         deal = await self.deal_repo.get_by_id(deal_id)
-        if not deal or deal.organization_id != organization_id:
+        if not deal or deal.organization_id != ctx.organization_id:
             raise NotFoundError("Deal not found")
 
         # Rule: Members can only create tasks for their own deals
-        if member.role == UserRole.MEMBER and deal.owner_id != user.id:
+        if ctx.role == UserRole.MEMBER and deal.owner_id != ctx.user.id:
             raise ForbiddenError("You can only create tasks for your own deals")
 
         # Rule: due_date cannot be in the past
@@ -116,7 +121,7 @@ class TaskService:
         # Create activity for task creation
         await self.activity_repo.create_task_created(
             deal_id=deal_id,
-            author_id=user.id,
+            author_id=ctx.user.id,
             task_id=task.id,
             task_title=title,
         )
@@ -127,26 +132,23 @@ class TaskService:
     async def update_task(
         self,
         task_id: int,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
         title: str | None = None,
         description: str | None = None,
         due_date: datetime | None = None,
         is_done: bool | None = None,
     ) -> Task:
         """Update task."""
-        member = await self.org_service.get_membership(organization_id, user)
-
         task = await self.repo.get_by_id(task_id)
         if not task:
             raise NotFoundError("Task not found")
 
         deal = await self.deal_repo.get_by_id(task.deal_id)
-        if not deal or deal.organization_id != organization_id:
+        if not deal or deal.organization_id != ctx.organization_id:
             raise NotFoundError("Task not found")
 
         # Members can only update tasks for their own deals
-        if member.role == UserRole.MEMBER and deal.owner_id != user.id:
+        if ctx.role == UserRole.MEMBER and deal.owner_id != ctx.user.id:
             raise ForbiddenError("You can only update tasks for your own deals")
 
         # Validate due_date if provided
@@ -170,22 +172,19 @@ class TaskService:
     async def delete_task(
         self,
         task_id: int,
-        organization_id: int,
-        user: User,
+        ctx: TenantContext,
     ) -> None:
         """Delete task."""
-        member = await self.org_service.get_membership(organization_id, user)
-
         task = await self.repo.get_by_id(task_id)
         if not task:
             raise NotFoundError("Task not found")
 
         deal = await self.deal_repo.get_by_id(task.deal_id)
-        if not deal or deal.organization_id != organization_id:
+        if not deal or deal.organization_id != ctx.organization_id:
             raise NotFoundError("Task not found")
 
         # Members can only delete tasks for their own deals
-        if member.role == UserRole.MEMBER and deal.owner_id != user.id:
+        if ctx.role == UserRole.MEMBER and deal.owner_id != ctx.user.id:
             raise ForbiddenError("You can only delete tasks for your own deals")
 
         await self.repo.delete(task)
@@ -2,6 +2,8 @@ from collections.abc import AsyncGenerator
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -9,6 +11,7 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.pool import NullPool
 
+from src.core import cache, rate_limit
 from src.core.config import settings
 from src.core.database import Base, get_db
 from src.main import app
@@ -30,9 +33,27 @@ TestSessionLocal = async_sessionmaker(
 )
 
 
+@pytest.fixture(autouse=True)
+async def clear_cache() -> None:
+    """Tables are recreated per test, so ids repeat: start with empty cache."""
+    await cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits() -> None:
+    """Start every test with full rate limit buckets."""
+    rate_limit.reset()
+
+
 @pytest.fixture(scope="function")
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """Create tables and yield session, then drop tables."""
+    try:
+        async with test_engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except DBAPIError:
+        pass  # Not shipped with this server: trigram tests are skipped
+
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
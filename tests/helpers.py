@@ -0,0 +1,37 @@
+"""Request helpers shared by API tests."""
+
+from httpx import AsyncClient
+
+
+async def setup_org(client: AsyncClient) -> tuple[dict[str, str], int]:
+    """Helper to register user and create a contact, returns headers."""
+    reg_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "StrongPassword123",
+            "name": "Test User",
+            "organization_name": "Test Org",
+        },
+    )
+    data = reg_response.json()
+    headers = {
+        "Authorization": f"Bearer {data['access_token']}",
+        "X-Organization-Id": str(data["organization_id"]),
+    }
+
+    contact_response = await client.post(
+        "/api/v1/contacts", json={"name": "John Doe"}, headers=headers
+    )
+    return headers, contact_response.json()["id"]
+
+
+async def create_deal(
+    client: AsyncClient, headers: dict[str, str], contact_id: int
+) -> int:
+    response = await client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_id, "title": "Deal", "amount": 1000},
+        headers=headers,
+    )
+    return response.json()["id"]
@@ -0,0 +1,114 @@
+"""Minimal in-process Redis stand-in for tests (RESP2, few commands)."""
+
+import asyncio
+import fnmatch
+import time
+from typing import Any
+
+
+class RespServer:
+    def __init__(self) -> None:
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.port = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.port}/0"
+
+    def _get(self, key: bytes) -> bytes | None:
+        item = self.data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                command = await self._read_command(reader)
+                writer.write(self._encode(self._dispatch(command)))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    @staticmethod
+    async def _read_command(reader: asyncio.StreamReader) -> list[bytes]:
+        header = await reader.readuntil(b"\r\n")
+        args = []
+        for _ in range(int(header[1:-2])):
+            length = int((await reader.readuntil(b"\r\n"))[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _encode(self, reply: Any) -> bytes:
+        if isinstance(reply, Exception):
+            return b"-ERR %s\r\n" % str(reply).encode()
+        if reply is None:
+            return b"$-1\r\n"
+        if isinstance(reply, str):
+            return b"+%s\r\n" % reply.encode()
+        if isinstance(reply, int):
+            return b":%d\r\n" % reply
+        if isinstance(reply, bytes):
+            return b"$%d\r\n%s\r\n" % (len(reply), reply)
+        return b"*%d\r\n" % len(reply) + b"".join(
+            self._encode(item) for item in reply
+        )
+
+    def _dispatch(self, args: list[bytes]) -> Any:
+        name, rest = args[0].upper(), args[1:]
+        if name in (b"PING", b"AUTH", b"SELECT"):
+            return "OK" if name != b"PING" else "PONG"
+        if name == b"GET":
+            return self._get(rest[0])
+        if name == b"MGET":
+            return [self._get(key) for key in rest]
+        if name == b"SET":
+            expires_at = None
+            if len(rest) == 4 and rest[2].upper() == b"PX":
+                expires_at = time.monotonic() + int(rest[3]) / 1000
+            self.data[rest[0]] = (rest[1], expires_at)
+            return "OK"
+        if name == b"DEL":
+            return sum(self.data.pop(key, None) is not None for key in rest)
+        if name in (b"INCR", b"INCRBY"):
+            amount = int(rest[1]) if name == b"INCRBY" else 1
+            item = self.data.get(rest[0])
+            current = self._get(rest[0])
+            expires_at = item[1] if item and current is not None else None
+            value = int(current or 0) + amount
+            self.data[rest[0]] = (str(value).encode(), expires_at)
+            return value
+        if name == b"PEXPIRE":
+            item = self.data.get(rest[0])
+            if item is None or self._get(rest[0]) is None:
+                return 0
+            if b"NX" in (arg.upper() for arg in rest[2:]) and item[1]:
+                return 0
+            self.data[rest[0]] = (
+                item[0],
+                time.monotonic() + int(rest[1]) / 1000,
+            )
+            return 1
+        if name == b"SCAN":
+            pattern = rest[rest.index(b"MATCH") + 1].decode()
+            keys = [
+                k for k in self.data if fnmatch.fnmatch(k.decode(), pattern)
+            ]
+            return [b"0", keys]
+        return Exception(f"unknown command '{name.decode()}'")
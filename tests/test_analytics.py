@@ -0,0 +1,370 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import cache
+from src.core.cache.stats import HITS, STALE_HITS
+from src.core.config import settings
+from src.core.database import try_advisory_lock
+from src.core.exceptions import NotFoundError
+from src.domain import Principal, TenantContext
+from src.models import Deal, DealRollup, DealStage, DealStatus, UserRole
+from src.repositories import (
+    DealRepository,
+    DealRollupRepository,
+    UserRepository,
+)
+from src.services import DealService
+from src.services.analytics import (
+    SNAPSHOT_LOCK,
+    WARMER_LOCK,
+    snapshot_pipelines,
+    warm_active_organizations,
+)
+from tests.conftest import TestSessionLocal
+from tests.helpers import create_deal, setup_org
+
+
+async def legacy_summary(
+    session: AsyncSession, organization_id: int, days: int = 30
+) -> dict:
+    """Reference summary: the three queries replaced by
+    ``DealRepository.get_summary``."""
+    stmt = (
+        select(
+            Deal.status,
+            func.count(Deal.id).label("count"),
+            func.sum(Deal.amount).label("total_amount"),
+        )
+        .where(Deal.organization_id == organization_id)
+        .group_by(Deal.status)
+    )
+    result = await session.execute(stmt)
+    by_status = {
+        row.status: {
+            "count": row.count,
+            "total_amount": row.total_amount or Decimal(0),
+        }
+        for row in result
+    }
+
+    stmt_avg = select(func.avg(Deal.amount)).where(
+        Deal.organization_id == organization_id,
+        Deal.status == DealStatus.WON,
+    )
+    avg_won = (await session.execute(stmt_avg)).scalar() or Decimal(0)
+
+    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    stmt_new = (
+        select(func.count())
+        .select_from(Deal)
+        .where(
+            Deal.organization_id == organization_id,
+            Deal.created_at >= cutoff_date,
+        )
+    )
+    new_count = (await session.execute(stmt_new)).scalar() or 0
+
+    return {
+        "by_status": by_status,
+        "avg_won_amount": avg_won,
+        "new_deals_last_n_days": new_count,
+        "days": days,
+    }
+
+
+@pytest.mark.asyncio
+async def test_summary_cache_invalidated_on_deal_writes(client: AsyncClient):
+    """Test that cached summary reflects deal create/update/delete."""
+    headers, contact_id = await setup_org(client)
+    url = "/api/v1/analytics/deals/summary"
+
+    response = await client.get(url, headers=headers)
+    assert response.json()["by_status"] == {}
+
+    deal_id = await create_deal(client, headers, contact_id)
+    response = await client.get(url, headers=headers)
+    assert response.json()["by_status"]["new"]["count"] == 1
+
+    await client.patch(
+        f"/api/v1/deals/{deal_id}", json={"status": "won"}, headers=headers
+    )
+    response = await client.get(url, headers=headers)
+    assert "new" not in response.json()["by_status"]
+    assert response.json()["avg_won_amount"] == 1000
+
+    await client.delete(f"/api/v1/deals/{deal_id}", headers=headers)
+    response = await client.get(url, headers=headers)
+    assert response.json()["by_status"] == {}
+
+
+@pytest.mark.asyncio
+async def test_funnel_cache_invalidated_on_deal_create(client: AsyncClient):
+    """Test that cached funnel reflects newly created deals."""
+    headers, contact_id = await setup_org(client)
+    url = "/api/v1/analytics/deals/funnel"
+
+    response = await client.get(url, headers=headers)
+    assert "qualification" not in response.json()["stages"]
+
+    await create_deal(client, headers, contact_id)
+    response = await client.get(url, headers=headers)
+    assert response.json()["stages"]["qualification"]["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_warmer_fills_cache_of_active_organizations(client: AsyncClient):
+    """Test that warmed analytics are served from cache."""
+    headers, contact_id = await setup_org(client)
+    await create_deal(client, headers, contact_id)
+
+    assert await warm_active_organizations(TestSessionLocal, 10, 2) == 1
+
+    hits = HITS.value(namespace="analytics")
+    await client.get("/api/v1/analytics/deals/summary", headers=headers)
+    await client.get("/api/v1/analytics/deals/funnel", headers=headers)
+    assert HITS.value(namespace="analytics") == hits + 2
+
+
+@pytest.mark.asyncio
+async def test_warmer_recomputes_stale_entries_in_place(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that warming over stale entries recomputes them itself instead
+    of scheduling background refreshes outside its concurrency limit."""
+    monkeypatch.setattr(settings, "ANALYTICS_CACHE_SOFT_TTL_SECONDS", 0)
+    headers, contact_id = await setup_org(client)
+    await create_deal(client, headers, contact_id)
+
+    assert await warm_active_organizations(TestSessionLocal, 10, 2) == 1
+    stale_hits = STALE_HITS.value(namespace="analytics")
+    assert await warm_active_organizations(TestSessionLocal, 10, 2) == 1
+    assert STALE_HITS.value(namespace="analytics") == stale_hits
+    assert not cache._background_tasks
+
+
+@pytest.mark.asyncio
+async def test_warmer_runs_in_one_worker_at_a_time(client: AsyncClient):
+    """Test that the warmer skips while another worker holds its lock."""
+    headers, contact_id = await setup_org(client)
+    await create_deal(client, headers, contact_id)
+
+    async with try_advisory_lock(TestSessionLocal, WARMER_LOCK) as leader:
+        assert leader
+        assert await warm_active_organizations(TestSessionLocal, 10, 2) == 0
+    assert await warm_active_organizations(TestSessionLocal, 10, 2) == 1
+
+
+@pytest.mark.asyncio
+async def test_single_query_summary_matches_legacy_queries(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Test that the FILTER-aggregate summary equals the three queries."""
+    headers, contact_id = await setup_org(client)
+    organization_id = int(headers["X-Organization-Id"])
+    assert await DealRepository(db_session).get_summary(
+        organization_id
+    ) == await legacy_summary(db_session, organization_id)
+
+    for status in ("won", "won", "lost", None):
+        deal_id = await create_deal(client, headers, contact_id)
+        if status:
+            await client.patch(
+                f"/api/v1/deals/{deal_id}",
+                json={"status": status},
+                headers=headers,
+            )
+
+    summary = await DealRepository(db_session).get_summary(organization_id)
+    assert summary == await legacy_summary(db_session, organization_id)
+    assert summary["new_deals_last_n_days"] == 4
+
+
+async def rollup_rows(session: AsyncSession) -> set[tuple]:
+    result = await session.execute(
+        select(
+            DealRollup.stage,
+            DealRollup.status,
+            DealRollup.count,
+            DealRollup.total_amount,
+        ).where(DealRollup.count != 0)
+    )
+    return set(result.tuples())
+
+
+@pytest.mark.asyncio
+async def test_rollups_follow_deal_writes(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Test that incremental rollups equal a rebuild and the deals table."""
+    headers, contact_id = await setup_org(client)
+    organization_id = int(headers["X-Organization-Id"])
+    deal_ids = [
+        await create_deal(client, headers, contact_id) for _ in range(4)
+    ]
+
+    for deal_id, changes in zip(
+        deal_ids,
+        (
+            {"status": "won"},
+            {"stage": "proposal", "amount": 250},
+            {"status": "lost", "stage": "negotiation"},
+        ),
+        strict=False,
+    ):
+        response = await client.patch(
+            f"/api/v1/deals/{deal_id}", json=changes, headers=headers
+        )
+        assert response.status_code == 200
+    await client.delete(f"/api/v1/deals/{deal_ids[-1]}", headers=headers)
+
+    rollup_repo = DealRollupRepository(db_session)
+    deal_repo = DealRepository(db_session)
+    incremental = await rollup_rows(db_session)
+    assert await rollup_repo.get_summary(
+        organization_id
+    ) == await deal_repo.get_summary(organization_id)
+    assert await rollup_repo.get_funnel(
+        organization_id
+    ) == await deal_repo.get_funnel(organization_id)
+
+    await rollup_repo.rebuild(organization_id)
+    assert await rollup_rows(db_session) == incremental
+
+
+@pytest.mark.asyncio
+async def test_concurrent_deal_writes_keep_rollups_exact(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Test that concurrent writes of one deal apply deltas in turn."""
+    headers, contact_id = await setup_org(client)
+    organization_id = int(headers["X-Organization-Id"])
+    updated_id = await create_deal(client, headers, contact_id)
+    deleted_id = await create_deal(client, headers, contact_id)
+
+    async def write(
+        call: Callable[[DealService, TenantContext], Awaitable[object]],
+    ) -> object:
+        async with TestSessionLocal() as session:
+            user = await UserRepository(session).get_by_email(
+                "test@example.com"
+            )
+            assert user is not None
+            ctx = TenantContext(
+                user=Principal.from_user(user),
+                organization_id=organization_id,
+                role=UserRole.OWNER,
+            )
+            return await call(DealService(session), ctx)
+
+    results = await asyncio.gather(
+        write(
+            lambda s, ctx: s.update_deal(updated_id, ctx, status=DealStatus.WON)
+        ),
+        write(
+            lambda s, ctx: s.update_deal(
+                updated_id, ctx, stage=DealStage.PROPOSAL
+            )
+        ),
+        write(lambda s, ctx: s.delete_deal(deleted_id, ctx)),
+        write(lambda s, ctx: s.delete_deal(deleted_id, ctx)),
+        return_exceptions=True,
+    )
+    assert sum(isinstance(r, NotFoundError) for r in results) == 1
+    assert not [
+        r
+        for r in results
+        if isinstance(r, BaseException) and not isinstance(r, NotFoundError)
+    ]
+
+    incremental = await rollup_rows(db_session)
+    await DealRollupRepository(db_session).rebuild(organization_id)
+    assert await rollup_rows(db_session) == incremental
+    assert incremental == {
+        (DealStage.PROPOSAL, DealStatus.WON, 1, 1000),
+    }
+
+
+@pytest.mark.asyncio
+async def test_as_of_reads_pipeline_snapshots(client: AsyncClient):
+    """Test that as_of answers from the latest snapshot on or before it."""
+    headers, contact_id = await setup_org(client)
+    deal_id = await create_deal(client, headers, contact_id)
+    await create_deal(client, headers, contact_id)
+
+    march_1 = date(2026, 3, 1)
+    assert await snapshot_pipelines(TestSessionLocal, march_1, batch_size=1)
+
+    await client.patch(
+        f"/api/v1/deals/{deal_id}", json={"status": "won"}, headers=headers
+    )
+    await create_deal(client, headers, contact_id)
+
+    summary_url = "/api/v1/analytics/deals/summary"
+    funnel_url = "/api/v1/analytics/deals/funnel"
+    live = (await client.get(summary_url, headers=headers)).json()
+    assert live["as_of"] is None
+    assert live["by_status"]["new"]["count"] == 2
+    assert live["by_status"]["won"]["count"] == 1
+
+    for as_of in ("2026-03-01", "2026-03-15"):
+        params = {"as_of": as_of}
+        past = (
+            await client.get(summary_url, params=params, headers=headers)
+        ).json()
+        assert past["as_of"] == "2026-03-01"
+        assert past["by_status"] == {
+            "new": {"count": 2, "total_amount": 2000.0}
+        }
+        funnel = (
+            await client.get(funnel_url, params=params, headers=headers)
+        ).json()
+        assert funnel["stages"]["qualification"]["by_status"] == {"new": 2}
+
+    before = (
+        await client.get(
+            funnel_url, params={"as_of": "2026-02-28"}, headers=headers
+        )
+    ).json()
+    assert before["as_of"] is None
+    assert "qualification" not in before["stages"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_of_tenant_without_deals_is_empty(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Test that a day snapshotted with no deals does not fall back to an
+    older snapshot, and that one worker snapshots at a time."""
+    headers, contact_id = await setup_org(client)
+    organization_id = int(headers["X-Organization-Id"])
+    deal_id = await create_deal(client, headers, contact_id)
+    await snapshot_pipelines(TestSessionLocal, date(2026, 3, 1), batch_size=10)
+
+    await client.delete(f"/api/v1/deals/{deal_id}", headers=headers)
+    # Deleted rollup groups go away on rebuild: the day has no rollups
+    await DealRollupRepository(db_session).rebuild(organization_id)
+    await db_session.commit()
+
+    async with try_advisory_lock(TestSessionLocal, SNAPSHOT_LOCK) as leader:
+        assert leader
+        assert not await snapshot_pipelines(
+            TestSessionLocal, date(2026, 3, 2), batch_size=10
+        )
+    assert await snapshot_pipelines(
+        TestSessionLocal, date(2026, 3, 2), batch_size=10
+    )
+
+    response = await client.get(
+        "/api/v1/analytics/deals/summary",
+        params={"as_of": "2026-03-02"},
+        headers=headers,
+    )
+    assert response.json()["as_of"] == "2026-03-02"
+    assert response.json()["by_status"] == {}
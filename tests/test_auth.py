@@ -1,5 +1,20 @@
+import asyncio
+import time
+from datetime import timedelta
+
 import pytest
 from httpx import AsyncClient
+from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import security
+from src.core.config import settings
+from src.core.exceptions import ServiceUnavailableError
+from src.core.security import create_access_token, decode_token
+from src.models import User
+from src.repositories import UserRepository
+from src.services import AuthService
+from src.services import auth as auth_service_module
 
 
 @pytest.mark.asyncio
@@ -99,3 +114,99 @@ async def test_login_wrong_password(client: AsyncClient):
         },
     )
     assert response.status_code == 401
+
+
+def test_decode_token_caches_only_valid_tokens():
+    """Test that cached verification still rejects bad and expired tokens."""
+    token = create_access_token({"sub": "1"})
+    assert decode_token(token)["sub"] == "1"
+    # Callers get their own copy of the cached payload
+    decode_token(token)["sub"] = "2"
+    assert decode_token(token)["sub"] == "1"
+
+    token = create_access_token({"sub": "1", "orgs": {"1": "member"}})
+    decode_token(token)["orgs"]["1"] = "owner"
+    assert decode_token(token)["orgs"] == {"1": "member"}
+
+    assert decode_token(token[:-2] + "xx") is None
+    expired = create_access_token({"sub": "1"}, timedelta(seconds=-1))
+    assert decode_token(expired) is None
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_cached_until_invalidated(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Test that identity is served from cache and refreshed on change."""
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "StrongPassword123",
+            "name": "Test User",
+            "organization_name": "Test Org",
+        },
+    )
+    token = response.json()["access_token"]
+    service = AuthService(db_session)
+
+    principal = await service.get_current_user(token)
+    assert principal.name == "Test User"
+
+    user = await db_session.get(User, principal.id)
+    user.name = "Renamed"
+    await db_session.commit()
+    assert (await service.get_current_user(token)).name == "Test User"
+
+    await AuthService.invalidate_principal(principal.id)
+    assert (await service.get_current_user(token)).name == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_password_jobs_past_queue_limit_are_rejected(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a full hashing queue fails fast instead of piling up."""
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_QUEUE", 0)
+
+    running = asyncio.create_task(
+        security._run_password_job("hash", time.sleep, 0.2)
+    )
+    await asyncio.sleep(0.05)
+    with pytest.raises(ServiceUnavailableError):
+        await security.verify_password_async("password", "hash")
+    await running
+
+    hashed = await security.hash_password_async("password")
+    assert await security.verify_password_async("password", hashed)
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_hash(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a hash with an old cost is replaced after login."""
+    monkeypatch.setattr(
+        security, "pwd_context", CryptContext(["bcrypt"], bcrypt__rounds=5)
+    )
+    credentials = {"email": "test@example.com", "password": "StrongPassword123"}
+    await client.post(
+        "/api/v1/auth/register",
+        json={**credentials, "name": "Test User", "organization_name": "Org"},
+    )
+
+    monkeypatch.setattr(
+        security, "pwd_context", CryptContext(["bcrypt"], bcrypt__rounds=4)
+    )
+    response = await client.post("/api/v1/auth/login", json=credentials)
+    assert response.status_code == 200
+    await asyncio.gather(*auth_service_module._rehash_tasks)
+
+    user = await UserRepository(db_session).get_by_email(credentials["email"])
+    await db_session.refresh(user)
+    assert user.hashed_password.startswith("$2b$04$")
+    response = await client.post("/api/v1/auth/login", json=credentials)
+    assert response.status_code == 200
@@ -0,0 +1,388 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+
+from src.core import cache
+from src.core.cache.backend import CacheBackend, CacheError
+from src.core.cache.keys import make_digest
+from src.core.cache.memory import MemoryBackend, TTLCache
+from src.core.cache.redis import RedisBackend
+from tests.resp_server import RespServer
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_value_until_ttl_expires():
+    """Test that entries are served until their TTL lapses."""
+    clock = FakeClock()
+    store = TTLCache(clock=clock)
+
+    store.set("key", {"a": 1}, ttl=10)
+    assert store.get("key") == {"a": 1}
+
+    clock.now += 10
+    assert store.get("key") is None
+    assert len(store) == 0
+
+
+def test_lru_eviction_by_entry_count():
+    """Test that the least recently used entry is evicted first."""
+    store = TTLCache(max_entries=2)
+
+    store.set("a", 1)
+    store.set("b", 2)
+    store.get("a")  # "b" is now the least recently used
+    store.set("c", 3)
+
+    assert store.get("a") == 1
+    assert store.get("b") is None
+    assert store.get("c") == 3
+
+
+def test_eviction_by_byte_budget():
+    """Test that the byte budget bounds memory and oversized values are skipped."""
+    store = TTLCache(max_bytes=2048)
+
+    store.set("small", "x" * 100)
+    store.set("huge", "x" * 10_000)
+    assert store.get("huge") is None
+    assert store.get("small") is not None
+
+    for i in range(50):
+        store.set(f"key:{i}", "x" * 100)
+    assert store.size_bytes <= 2048
+    assert store.get("small") is None
+    assert store.get("key:49") is not None
+
+
+def test_overwrite_keeps_accounting_consistent():
+    """Test that overwriting a key does not leak bytes."""
+    store = TTLCache()
+    store.set("key", "x" * 100)
+    size = store.size_bytes
+
+    store.set("key", "x" * 100)
+    assert store.size_bytes == size
+    assert len(store) == 1
+
+    store.delete("key")
+    assert store.size_bytes == 0
+
+
+def test_sweep_removes_only_expired_entries():
+    """Test that the background sweep drops expired entries without reads."""
+    clock = FakeClock()
+    store = TTLCache(clock=clock)
+
+    store.set("short", 1, ttl=5)
+    store.set("long", 2, ttl=60)
+
+    clock.now += 10
+    assert store.sweep() == 1
+    assert len(store) == 1
+    assert store.get("long") == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tag_bumps_generation():
+    """Test that tag invalidation changes the generation used in keys."""
+    assert await cache.generation("analytics:1") == 0
+
+    await cache.invalidate_tag("analytics:1")
+    assert await cache.generation("analytics:1") == 1
+    assert await cache.generation("analytics:2") == 0
+
+
+@pytest.fixture
+async def redis_backend() -> AsyncGenerator[RedisBackend, None]:
+    server = RespServer()
+    await server.start()
+    backend = RedisBackend(server.url, key_prefix="test:")
+    yield backend
+    await backend.close()
+    await server.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["memory", "redis"])
+async def test_backend_contract(backend_name: str, redis_backend: RedisBackend):
+    """Test that both backends behave the same for the cache API."""
+    backend: CacheBackend = (
+        MemoryBackend(max_entries=100, max_bytes=1024 * 1024)
+        if backend_name == "memory"
+        else redis_backend
+    )
+
+    await backend.set("summary", {"by_status": {"new": 1}}, ttl=60)
+    assert await backend.get("summary") == {"by_status": {"new": 1}}
+    await backend.delete("summary")
+    assert await backend.get("summary") is None
+
+    assert await backend.incr("hits", ttl=60) == 1
+    assert await backend.incr("hits", amount=5, ttl=60) == 6
+    # Counters do not clash with values stored under the same key
+    await backend.set("hits", "value", ttl=60)
+    assert await backend.incr("hits", ttl=60) == 7
+    assert await backend.get("hits") == "value"
+
+    assert await backend.generations(["org:1", "org:2"]) == [0, 0]
+    await backend.invalidate_tag("org:1")
+    assert await backend.generations(["org:1", "org:2"]) == [1, 0]
+
+    await backend.set("other", 1, ttl=60)
+    await backend.clear()
+    assert await backend.get("other") is None
+    assert await backend.generations(["org:1"]) == [0]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_expires_entries(redis_backend: RedisBackend):
+    """Test that values written to the shared backend carry their TTL."""
+    await redis_backend.set("short", "value", ttl=0.05)
+    assert await redis_backend.get("short") == "value"
+    await asyncio.sleep(0.1)
+    assert await redis_backend.get("short") is None
+
+
+@pytest.mark.asyncio
+async def test_unreadable_entry_is_a_miss(redis_backend: RedisBackend):
+    """Test that an entry that cannot be unpickled reads as a miss."""
+    await redis_backend.execute(("SET", redis_backend._key("bad"), b"junk"))
+    with pytest.raises(CacheError):
+        await redis_backend.get("bad")
+
+    previous = cache.get_backend()
+    cache.set_backend(redis_backend)
+    try:
+        assert await cache.get("bad") is None
+    finally:
+        cache.set_backend(previous)
+
+
+@pytest.mark.asyncio
+async def test_unreachable_backend_degrades_to_miss():
+    """Test that cache errors never fail the caller, except for counters."""
+    previous = cache.get_backend()
+    cache.set_backend(RedisBackend("redis://127.0.0.1:1/0", timeout=0.5))
+    try:
+        await cache.set("key", 1)
+        assert await cache.get("key") is None
+        assert await cache.generation("org:1") == 0
+        with pytest.raises(CacheError):
+            await cache.incr("counter")
+    finally:
+        cache.set_backend(previous)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_coalesced():
+    """Test that concurrent misses for one key run the factory once."""
+    calls = 0
+
+    async def compute() -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"total": 42}
+
+    results = await asyncio.gather(
+        *(cache.get_or_set("analytics:summary", compute) for _ in range(10))
+    )
+
+    assert calls == 1
+    assert results == [{"total": 42}] * 10
+    assert await cache.get("analytics:summary") == {"total": 42}
+
+
+@pytest.mark.asyncio
+async def test_leader_error_reaches_followers_and_is_not_cached():
+    """Test that a failed computation propagates and the next call retries."""
+    calls = 0
+
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        if calls == 1:
+            raise RuntimeError("database is down")
+        return 1
+
+    results = await asyncio.gather(
+        *(cache.get_or_set("key", compute) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    assert await cache.get_or_set("key", compute) == 1
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_follower_takes_over_when_leader_is_cancelled():
+    """Test that cancelling the leader does not fail waiting followers."""
+    started = asyncio.Event()
+
+    async def slow() -> str:
+        started.set()
+        await asyncio.sleep(10)
+        return "leader"
+
+    async def fast() -> str:
+        return "follower"
+
+    leader = asyncio.create_task(cache.single_flight("key", slow))
+    await started.wait()
+    follower = asyncio.create_task(cache.single_flight("key", fast))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    assert await follower == "follower"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_stale_value_served_while_refreshing_in_background():
+    """Test stale-while-revalidate between the soft and the hard TTL."""
+    version = 0
+    refreshed = asyncio.Event()
+
+    async def compute() -> int:
+        nonlocal version
+        version += 1
+        return version
+
+    async def refresh() -> int:
+        value = await compute()
+        refreshed.set()
+        return value
+
+    async def get_value() -> int:
+        return await cache.get_or_set(
+            "key", compute, ttl=60, soft_ttl=0.05, refresh=refresh
+        )
+
+    assert await get_value() == 1
+    await asyncio.sleep(0.1)
+
+    # Past the soft TTL: stale value right away, a single refresh scheduled
+    assert await asyncio.gather(get_value(), get_value()) == [1, 1]
+    await asyncio.wait_for(refreshed.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert version == 2
+    assert await get_value() == 2
+
+
+@pytest.mark.asyncio
+async def test_past_hard_ttl_recomputes_synchronously():
+    """Test that entries past the hard TTL are recomputed before returning."""
+    version = 0
+
+    async def compute() -> int:
+        nonlocal version
+        version += 1
+        return version
+
+    assert await cache.get_or_set("key", compute, ttl=0.05, soft_ttl=0.01) == 1
+    await asyncio.sleep(0.1)
+    assert await cache.get_or_set("key", compute, ttl=0.05, soft_ttl=0.01) == 2
+
+
+def test_key_parts_serialize_by_value():
+    """Test that enums digest by value and other objects by ``str``."""
+
+    class Stage(Enum):
+        WON = "won"
+
+    class Amount:
+        value = "ignored"
+
+        def __str__(self) -> str:
+            return "amount"
+
+    assert make_digest({"stage": Stage.WON}) == make_digest({"stage": "won"})
+    assert make_digest({"amount": Decimal("1.50")}) == make_digest(
+        {"amount": "1.50"}
+    )
+    assert make_digest({"amount": Amount()}) == make_digest(
+        {"amount": "amount"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_namespace_keys_are_compact_and_droppable():
+    """Test hashed keys and namespace/tenant invalidation."""
+    analytics = cache.Namespace("analytics")
+    other = cache.Namespace("other")
+
+    key = await analytics.key("summary", {"days": 30}, tenant=1)
+    assert key.startswith("analytics:1:summary:")
+    assert len(key.rsplit(":", 1)[1]) == 32
+    assert key == await analytics.key("summary", {"days": 30}, tenant=1)
+    assert key != await analytics.key("summary", {"days": 7}, tenant=1)
+
+    other_tenant = await analytics.key("summary", {"days": 30}, tenant=2)
+    other_space = await other.key("summary", {"days": 30}, tenant=1)
+
+    await analytics.invalidate_tenant(1)
+    assert await analytics.key("summary", {"days": 30}, tenant=1) != key
+    assert (
+        await analytics.key("summary", {"days": 30}, tenant=2) == other_tenant
+    )
+    assert await other.key("summary", {"days": 30}, tenant=1) == other_space
+
+    await cache.drop_tenant(1)
+    assert await other.key("summary", {"days": 30}, tenant=1) != other_space
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_uses_only_declared_params():
+    """Test that self and undeclared arguments stay out of the cache key."""
+
+    class Service:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @cache.cached(namespace="test", key=("days",), tenant="org_id")
+        async def summary(self, org_id: int, days: int, session: object) -> int:
+            self.calls += 1
+            return days
+
+    first, second = Service(), Service()
+    assert await first.summary(1, 30, session=object()) == 30
+    assert await second.summary(1, days=30, session=object()) == 30
+    assert first.calls + second.calls == 1
+
+    assert await second.summary(2, 30, session=object()) == 30
+    assert second.calls == 1
+
+    with pytest.raises(TypeError):
+        cache.cached(key=("missing",))(Service.summary)
+
+
+def test_removals_are_reported_with_their_reason():
+    """Test that expirations and evictions are reported per key."""
+    clock = FakeClock()
+    removed: list[tuple[str, str]] = []
+    store = TTLCache(
+        max_entries=1,
+        clock=clock,
+        on_remove=lambda key, reason: removed.append((key, reason)),
+    )
+
+    store.set("analytics:a", 1, ttl=5)
+    store.set("analytics:b", 2, ttl=5)
+    clock.now += 10
+    assert store.get("analytics:b") is None
+
+    assert removed == [("analytics:a", "evicted"), ("analytics:b", "expired")]
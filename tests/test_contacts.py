@@ -0,0 +1,120 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def register_and_get_headers(client: AsyncClient) -> dict[str, str]:
+    """Helper to register user and get request headers."""
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "StrongPassword123",
+            "name": "Test User",
+            "organization_name": "Test Org",
+        },
+    )
+    data = response.json()
+    return {
+        "Authorization": f"Bearer {data['access_token']}",
+        "X-Organization-Id": str(data["organization_id"]),
+    }
+
+
+async def create_contacts(
+    client: AsyncClient, headers: dict[str, str], *contacts: tuple[str, str]
+) -> None:
+    for name, email in contacts:
+        response = await client.post(
+            "/api/v1/contacts",
+            json={"name": name, "email": email},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+
+async def search(
+    client: AsyncClient, headers: dict[str, str], query: str
+) -> tuple[list[str], int]:
+    response = await client.get(
+        "/api/v1/contacts", params={"search": query}, headers=headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    return [item["name"] for item in data["items"]], data["total"]
+
+
+@pytest.mark.asyncio
+async def test_short_search_matches_prefixes(client: AsyncClient):
+    """Test that queries too short for trigrams match name/email prefixes."""
+    headers = await register_and_get_headers(client)
+    await create_contacts(
+        client,
+        headers,
+        ("Ivan Petrov", "ivan@example.com"),
+        ("Anna Ivanova", "anna@example.com"),
+        ("Boris", "iv@example.com"),
+        ("5% Off", "promo@example.com"),
+        ("50 Cent", "fifty@example.com"),
+    )
+
+    assert await search(client, headers, "iv") == (["Boris", "Ivan Petrov"], 2)
+    assert await search(client, headers, "AN") == (["Anna Ivanova"], 1)
+    # LIKE wildcards in the query are matched literally
+    assert await search(client, headers, "5%") == (["5% Off"], 1)
+    assert await search(client, headers, "_") == ([], 0)
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_by_similarity(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Test that longer queries match substrings, best match first."""
+    installed = await db_session.scalar(
+        text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    )
+    if not installed:
+        pytest.skip("pg_trgm is not available on this server")
+
+    headers = await register_and_get_headers(client)
+    await create_contacts(
+        client,
+        headers,
+        ("Anna Ivanova", "anna@example.com"),
+        ("Ivan", "ivan@example.com"),
+        ("Boris", "boris@example.com"),
+    )
+
+    assert await search(client, headers, "ivan") == (
+        ["Ivan", "Anna Ivanova"],
+        2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_contacts_by_name(client: AsyncClient):
+    """Test that next_cursor pages through contacts in name order."""
+    headers = await register_and_get_headers(client)
+    await create_contacts(
+        client,
+        headers,
+        ("Carol", "carol@example.com"),
+        ("Alice", "alice@example.com"),
+        ("Bob", "bob@example.com"),
+    )
+
+    response = await client.get(
+        "/api/v1/contacts", params={"page_size": 2}, headers=headers
+    )
+    first = response.json()
+    assert [item["name"] for item in first["items"]] == ["Alice", "Bob"]
+
+    response = await client.get(
+        "/api/v1/contacts",
+        params={"page_size": 2, "cursor": first["next_cursor"]},
+        headers=headers,
+    )
+    second = response.json()
+    assert [item["name"] for item in second["items"]] == ["Carol"]
+    assert second["next_cursor"] is None
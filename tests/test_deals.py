@@ -1,5 +1,11 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.repositories import DealRepository
+from tests.conftest import test_engine
 
 
 async def register_and_get_token(client: AsyncClient) -> tuple[str, int]:
@@ -135,3 +141,155 @@ async def test_deal_status_change_creates_activity(client: AsyncClient):
     activities = activities_response.json()["items"]
     assert len(activities) >= 1
     assert any(a["type"] == "status_changed" for a in activities)
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_walks_every_deal_once(client: AsyncClient):
+    """Test that following next_cursor yields the page-based ordering."""
+    token, org_id = await register_and_get_token(client)
+    contact_id = await create_contact(client, token, org_id)
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "X-Organization-Id": str(org_id),
+    }
+    # Equal amounts exercise the id tie-breaker
+    for i, amount in enumerate([300, 100, 200, 100, 100]):
+        await client.post(
+            "/api/v1/deals",
+            json={
+                "contact_id": contact_id,
+                "title": f"Deal {i}",
+                "amount": amount,
+            },
+            headers=headers,
+        )
+
+    params = {"order_by": "amount", "order": "asc", "page_size": 2}
+    response = await client.get(
+        "/api/v1/deals", params={**params, "page_size": 10}, headers=headers
+    )
+    expected = [deal["id"] for deal in response.json()["items"]]
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        response = await client.get(
+            "/api/v1/deals",
+            params={**params, **({"cursor": cursor} if cursor else {})},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        seen += [deal["id"] for deal in data["items"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert len(seen) == 5
+
+    # A cursor is bound to the ordering it was issued for
+    first = await client.get("/api/v1/deals", params=params, headers=headers)
+    response = await client.get(
+        "/api/v1/deals",
+        params={
+            "order_by": "created_at",
+            "cursor": first.json()["next_cursor"],
+        },
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+    response = await client.get(
+        "/api/v1/deals", params={"cursor": "not-a-cursor"}, headers=headers
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_page_and_total_in_one_statement(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Test that a page comes with its total in a single query."""
+    token, org_id = await register_and_get_token(client)
+    contact_id = await create_contact(client, token, org_id)
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "X-Organization-Id": str(org_id),
+    }
+    for amount in (100, 200, 300):
+        await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": "Deal", "amount": amount},
+            headers=headers,
+        )
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        page = await DealRepository(db_session).get_page(
+            org_id, limit=2, min_amount=150
+        )
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+    assert [deal.amount for deal in page.items] == [300, 200]
+    assert page.total == 2
+    assert len(statements) == 1
+
+    response = await client.get(
+        "/api/v1/deals", params={"page": 5, "page_size": 2}, headers=headers
+    )
+    assert response.json()["items"] == []
+    assert response.json()["total"] == 3
+
+    response = await client.get(
+        "/api/v1/deals", params={"include_total": "false"}, headers=headers
+    )
+    assert len(response.json()["items"]) == 3
+    assert response.json()["total"] is None
+
+
+@pytest.mark.asyncio
+async def test_capped_and_estimated_totals(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that capped and estimated totals are flagged as inexact."""
+    monkeypatch.setattr(settings, "LIST_COUNT_CAP", 2)
+    token, org_id = await register_and_get_token(client)
+    contact_id = await create_contact(client, token, org_id)
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "X-Organization-Id": str(org_id),
+    }
+
+    async def total(count: str) -> tuple[int, bool]:
+        response = await client.get(
+            "/api/v1/deals", params={"count": count}, headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        return data["total"], data["total_is_exact"]
+
+    await client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_id, "title": "Deal", "amount": 1},
+        headers=headers,
+    )
+    assert await total("capped") == (1, True)
+
+    for _ in range(2):
+        await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": "Deal", "amount": 1},
+            headers=headers,
+        )
+    assert await total("exact") == (3, True)
+    assert await total("capped") == (2, False)
+
+    estimate, exact = await total("estimated")
+    assert isinstance(estimate, int)
+    assert not exact
@@ -0,0 +1,188 @@
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.pagination import Cursor
+from src.models import DealStatus
+from src.repositories import (
+    ActivityRepository,
+    ContactRepository,
+    DealRepository,
+    OrganizationRepository,
+    TaskRepository,
+)
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+async def explain(
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    query: Callable[[], Awaitable[object]],
+) -> str:
+    """Run a repository call and return the plans of the SQL it executed."""
+    plans = []
+    execute = session.execute
+
+    async def explaining_execute(statement, *args, **kwargs):
+        sql = statement.compile(
+            dialect=session.get_bind().dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+        result = await execute(text(f"EXPLAIN {sql}"))
+        plans.append("\n".join(row[0] for row in result))
+        return await execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(session, "execute", explaining_execute)
+    try:
+        await query()
+    finally:
+        monkeypatch.undo()
+    return "\n".join(plans)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("query", "index"),
+    [
+        (
+            lambda s: DealRepository(s).get_by_organization(1),
+            "ix_deals_organization_id_created_at_id",
+        ),
+        (
+            lambda s: DealRepository(s).get_by_organization(
+                1, order_by="updated_at"
+            ),
+            "ix_deals_organization_id_updated_at_id",
+        ),
+        (
+            lambda s: DealRepository(s).get_by_organization(
+                1, order_by="amount", order="asc"
+            ),
+            "ix_deals_organization_id_amount_id",
+        ),
+        (
+            lambda s: DealRepository(s).count_by_organization(
+                1, status=[DealStatus.WON]
+            ),
+            "ix_deals_organization_id_status",
+        ),
+        (
+            lambda s: DealRepository(s).count_by_organization(1, owner_id=1),
+            "ix_deals_organization_id_owner_id",
+        ),
+        (
+            lambda s: DealRepository(s).get_by_organization(
+                1, after=Cursor("created_at:desc", NOW, 10)
+            ),
+            "ix_deals_organization_id_created_at_id",
+        ),
+        (
+            lambda s: DealRepository(s).get_recently_active_organization_ids(
+                10
+            ),
+            "ix_deals_updated_at",
+        ),
+        (
+            lambda s: ContactRepository(s).get_by_organization(1),
+            "ix_contacts_organization_id_name_id",
+        ),
+        (
+            lambda s: ContactRepository(s).count_by_organization(1, owner_id=1),
+            "ix_contacts_organization_id_owner_id",
+        ),
+        (
+            lambda s: ContactRepository(s).has_deals(1),
+            "ix_deals_contact_id",
+        ),
+        (
+            lambda s: TaskRepository(s).get_by_deal(1),
+            "ix_tasks_deal_id_due_date_id",
+        ),
+        (
+            lambda s: TaskRepository(s).get_by_deal(
+                1, only_open=True, due_before=NOW
+            ),
+            "ix_tasks_deal_id_due_date_id_open",
+        ),
+        (
+            lambda s: TaskRepository(s).get_by_organization(1, only_open=True),
+            "ix_tasks_deal_id_due_date_id_open",
+        ),
+        (
+            lambda s: ActivityRepository(s).get_by_deal(1),
+            "ix_activities_deal_id_created_at_id",
+        ),
+        (
+            lambda s: OrganizationRepository(s).get_member(1, 1),
+            "uq_org_user",
+        ),
+        (
+            lambda s: OrganizationRepository(s).get_user_roles(1),
+            "ix_organization_members_user_id",
+        ),
+    ],
+)
+async def test_repository_queries_use_indexes(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+    query: Callable[[AsyncSession], Awaitable[object]],
+    index: str,
+):
+    """Test that tenant-scoped queries are planned on their index."""
+    # Tables are empty in tests, so take sequential scans and sorts out of
+    # the running to see the plan chosen for a populated table
+    await db_session.execute(text("SET enable_seqscan = off"))
+    await db_session.execute(text("SET enable_sort = off"))
+
+    plan = await explain(db_session, monkeypatch, lambda: query(db_session))
+    assert index in plan, plan
+
+
+@pytest.mark.asyncio
+async def test_contact_search_uses_search_indexes(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that contact search is planned on the prefix/trigram indexes
+    rather than on the tenant's contacts."""
+    await db_session.execute(
+        text("INSERT INTO organizations (id, name) VALUES (1, 'Org')")
+    )
+    await db_session.execute(
+        text(
+            "INSERT INTO users (id, email, hashed_password, name)"
+            " VALUES (1, 'owner@example.com', '-', 'Owner')"
+        )
+    )
+    await db_session.execute(
+        text(
+            "INSERT INTO contacts (organization_id, owner_id, name, email)"
+            " SELECT 1, 1, 'Contact ' || g, 'contact' || g || '@example.com'"
+            " FROM generate_series(1, 5000) AS g"
+        )
+    )
+    await db_session.execute(text("ANALYZE contacts"))
+    repo = ContactRepository(db_session)
+
+    plan = await explain(
+        db_session,
+        monkeypatch,
+        lambda: repo.get_by_organization(1, search="iv"),
+    )
+    assert "ix_contacts_organization_id_name_prefix" in plan, plan
+    assert "ix_contacts_organization_id_email_prefix" in plan, plan
+
+    installed = await db_session.scalar(
+        text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    )
+    if installed:
+        plan = await explain(
+            db_session,
+            monkeypatch,
+            lambda: repo.get_by_organization(1, search="ivan"),
+        )
+        assert "ix_contacts_name_trgm" in plan, plan
+        assert "ix_contacts_email_trgm" in plan, plan
@@ -0,0 +1,94 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.config import settings
+from src.core.database import POOL_TIMEOUTS, POOL_WAIT_SECONDS, engine_options
+from src.core.metrics import Counter, Gauge, Histogram, Registry
+from tests.conftest import TEST_DATABASE_URL
+from tests.helpers import setup_org
+
+
+def test_registry_renders_prometheus_text():
+    """Test the text exposition of counters, gauges and histograms."""
+    registry = Registry()
+    hits = Counter("hits_total", "Hits", ["namespace"], registry=registry)
+    size = Gauge(
+        "entries", "Entries", callback=lambda: {(): 3}, registry=registry
+    )
+    latency = Histogram(
+        "latency_seconds", "Latency", buckets=(0.1, 1), registry=registry
+    )
+
+    hits.inc(namespace="analytics")
+    hits.inc(2, namespace="analytics")
+    latency.observe(0.5)
+
+    text = registry.render()
+    assert 'hits_total{namespace="analytics"} 3' in text
+    assert "entries 3" in text
+    assert 'latency_seconds_bucket{le="0.1"} 0' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 1' in text
+    assert size.value() == 3
+    assert latency.summary()["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_admin_cache_stats_require_admin_key(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that cache stats are admin-only and count analytics lookups."""
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "secret")
+    headers, _ = await setup_org(client)
+    for _ in range(2):
+        await client.get("/api/v1/analytics/deals/funnel", headers=headers)
+
+    response = await client.get("/api/v1/admin/cache", headers=headers)
+    assert response.status_code == 403
+
+    response = await client.get(
+        "/api/v1/admin/cache", headers={"X-Admin-Key": "secret"}
+    )
+    assert response.status_code == 200
+    analytics = response.json()["namespaces"]["analytics"]
+    assert analytics["hits"] >= 1
+    assert analytics["misses"] >= 1
+    assert analytics["entries"] >= 1
+    assert analytics["recompute_seconds"]["count"] >= 1
+
+    response = await client.get("/metrics")
+    assert response.status_code == 403
+    response = await client.get("/metrics", headers={"X-Admin-Key": "secret"})
+    assert response.status_code == 200
+    assert 'cache_hits_total{namespace="analytics"}' in response.text
+    assert 'db_pool_connections{state="in_use"}' in response.text
+
+
+@pytest.mark.asyncio
+async def test_pool_settings_and_checkout_metrics(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that pool settings apply and checkout waits/timeouts are counted."""
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT_SECONDS", 0.1)
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 250)
+    engine = create_async_engine(TEST_DATABASE_URL, **engine_options())
+    checkouts = POOL_WAIT_SECONDS.summary()["count"]
+    timeouts = POOL_TIMEOUTS.value()
+    try:
+        async with engine.connect() as conn:
+            timeout = await conn.scalar(text("SHOW statement_timeout"))
+            assert timeout == "250ms"
+            assert engine.sync_engine.pool.checkedout() == 1
+
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+    finally:
+        await engine.dispose()
+
+    assert POOL_WAIT_SECONDS.summary()["count"] == checkouts + 2
+    assert POOL_TIMEOUTS.value() == timeouts + 1
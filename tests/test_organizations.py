@@ -0,0 +1,226 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.exceptions import ForbiddenError
+from src.core.security import decode_token
+from src.domain import UserRole
+from src.models import OrganizationMember, User
+from src.services import AuthService, OrganizationService
+from tests.conftest import TestSessionLocal
+
+
+async def register(client: AsyncClient, email: str) -> dict:
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": email,
+            "password": "StrongPassword123",
+            "name": "Test User",
+            "organization_name": "Test Org",
+        },
+    )
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_cached_membership_follows_member_changes(
+    client: AsyncClient, db_session: AsyncSession
+):
+    """Test that role changes and removal apply to cached memberships."""
+    owner = await register(client, "owner@example.com")
+    member = await register(client, "member@example.com")
+    org_id = owner["organization_id"]
+    headers = {
+        "Authorization": f"Bearer {member['access_token']}",
+        "X-Organization-Id": str(org_id),
+    }
+    service = OrganizationService(db_session)
+    auth_service = AuthService(db_session)
+    owner_ctx = await service.get_context(
+        org_id, await auth_service.get_current_user(owner["access_token"])
+    )
+    member_principal = await auth_service.get_current_user(
+        member["access_token"]
+    )
+
+    response = await client.get("/api/v1/contacts", headers=headers)
+    assert response.status_code == 403
+
+    await service.add_member(owner_ctx, member["user"]["id"], UserRole.MEMBER)
+    response = await client.get("/api/v1/contacts", headers=headers)
+    assert response.status_code == 200
+
+    await service.update_member_role(
+        owner_ctx, member["user"]["id"], UserRole.ADMIN
+    )
+    membership = await service.get_membership(org_id, member_principal)
+    assert membership.role == UserRole.ADMIN
+
+    await service.remove_member(owner_ctx, member["user"]["id"])
+    response = await client.get("/api/v1/contacts", headers=headers)
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_stale_membership_read_is_not_cached(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a membership read racing a role change cannot cache the
+    old role past the invalidation."""
+    owner = await register(client, "owner@example.com")
+    member = await register(client, "member@example.com")
+    org_id, member_id = owner["organization_id"], member["user"]["id"]
+    service = OrganizationService(db_session)
+    auth_service = AuthService(db_session)
+    owner_principal = await auth_service.get_current_user(owner["access_token"])
+    member_principal = await auth_service.get_current_user(
+        member["access_token"]
+    )
+    owner_ctx = await service.get_context(org_id, owner_principal)
+    await service.add_member(owner_ctx, member_id, UserRole.MEMBER)
+
+    get_member = service.repo.get_member
+
+    async def get_member_then_promote(organization_id: int, user_id: int):
+        found = await get_member(organization_id, user_id)
+        # The role change commits and invalidates between read and cache set
+        async with TestSessionLocal() as session:
+            writer = OrganizationService(session)
+            ctx = await writer.get_context(org_id, owner_principal)
+            await writer.update_member_role(ctx, member_id, UserRole.ADMIN)
+        return found
+
+    monkeypatch.setattr(service.repo, "get_member", get_member_then_promote)
+    stale = await service.get_membership(org_id, member_principal)
+    assert stale.role == UserRole.MEMBER
+
+    async with TestSessionLocal() as session:
+        membership = await OrganizationService(session).get_membership(
+            org_id, member_principal
+        )
+    assert membership.role == UserRole.ADMIN
+
+
+@pytest.mark.asyncio
+async def test_per_process_membership_cache_expires_quickly(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that with the memory backend a role change made by another
+    worker applies within the local TTL, not the full membership TTL."""
+    monkeypatch.setattr(settings, "MEMBERSHIP_CACHE_LOCAL_TTL_SECONDS", 0.05)
+    owner = await register(client, "owner@example.com")
+    org_id = owner["organization_id"]
+    service = OrganizationService(db_session)
+    principal = await AuthService(db_session).get_current_user(
+        owner["access_token"]
+    )
+    assert (await service.get_membership(org_id, principal)).role == (
+        UserRole.OWNER
+    )
+
+    # Another worker demotes the owner: this process is not invalidated
+    async with TestSessionLocal() as session:
+        await session.execute(
+            update(OrganizationMember)
+            .where(OrganizationMember.user_id == principal.id)
+            .values(role=UserRole.MEMBER)
+        )
+        await session.commit()
+
+    await asyncio.sleep(0.1)
+    async with TestSessionLocal() as session:
+        membership = await OrganizationService(session).get_membership(
+            org_id, principal
+        )
+    assert membership.role == UserRole.MEMBER
+
+
+@pytest.mark.asyncio
+async def test_role_claims_trusted_only_while_version_is_current(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that token role claims skip lookups until memberships change."""
+    monkeypatch.setattr(settings, "ACCESS_TOKEN_ROLE_CLAIMS", True)
+    owner = await register(client, "owner@example.com")
+    other = await register(client, "other@example.com")
+    org_id, other_org_id = owner["organization_id"], other["organization_id"]
+
+    claims = decode_token(owner["access_token"])
+    assert claims["orgs"] == {str(org_id): "owner"}
+    assert claims["mv"] == 0
+
+    service = OrganizationService(db_session)
+    principal = await AuthService(db_session).get_current_user(
+        owner["access_token"]
+    )
+    # Claims are signed, a tampered copy only shows which source is used
+    admin_claims = {**claims, "orgs": {str(org_id): "admin"}}
+    ctx = await service.get_context(org_id, principal, admin_claims)
+    assert ctx.role == UserRole.ADMIN
+    with pytest.raises(ForbiddenError):
+        await service.get_context(other_org_id, principal, claims)
+
+    other_ctx = await service.get_context(
+        other_org_id,
+        await AuthService(db_session).get_current_user(other["access_token"]),
+    )
+    await service.add_member(other_ctx, principal.id, UserRole.MEMBER)
+
+    ctx = await service.get_context(org_id, principal, admin_claims)
+    assert ctx.role == UserRole.OWNER
+    ctx = await service.get_context(other_org_id, principal, claims)
+    assert ctx.role == UserRole.MEMBER
+
+    response = await client.post(
+        "/api/v1/auth/refresh",
+        json={"refresh_token": owner["refresh_token"]},
+    )
+    claims = decode_token(response.json()["access_token"])
+    assert claims["mv"] == 1
+    assert claims["orgs"] == {str(org_id): "owner", str(other_org_id): "member"}
+
+
+@pytest.mark.asyncio
+async def test_role_claims_follow_changes_made_by_other_workers(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that with the memory backend role claims are refused as soon as
+    another worker bumps the membership version."""
+    monkeypatch.setattr(settings, "ACCESS_TOKEN_ROLE_CLAIMS", True)
+    owner = await register(client, "owner@example.com")
+    org_id = owner["organization_id"]
+    claims = decode_token(owner["access_token"])
+    admin_claims = {**claims, "orgs": {str(org_id): "admin"}}
+
+    service = OrganizationService(db_session)
+    principal = await AuthService(db_session).get_current_user(
+        owner["access_token"]
+    )
+    ctx = await service.get_context(org_id, principal, admin_claims)
+    assert ctx.role == UserRole.ADMIN
+
+    # Another worker records a membership change: this process is not
+    # invalidated
+    async with TestSessionLocal() as session:
+        await session.execute(
+            update(User)
+            .where(User.id == principal.id)
+            .values(membership_version=User.membership_version + 1)
+        )
+        await session.commit()
+
+    ctx = await service.get_context(org_id, principal, admin_claims)
+    assert ctx.role == UserRole.OWNER
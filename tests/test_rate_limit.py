@@ -0,0 +1,85 @@
+import pytest
+from httpx import AsyncClient
+from pydantic import ValidationError
+
+from src.core.config import Settings, settings
+from src.core.rate_limit import TokenBuckets
+
+# Organization that no test creates, so buckets do not leak into other tests
+HEADERS = {"X-Organization-Id": "424242"}
+
+
+def test_token_bucket_allows_burst_then_refills():
+    """Test burst capacity, wait time and refill of a bucket."""
+    buckets = TokenBuckets()
+
+    assert [buckets.take("key", 1, 3, now=0) for _ in range(3)] == [0, 0, 0]
+    assert buckets.take("key", 1, 3, now=0) == pytest.approx(1)
+    assert buckets.take("other", 1, 3, now=0) == 0
+
+    assert buckets.take("key", 1, 3, now=1.5) == 0
+    assert buckets.take("key", 1, 3, now=1.5) == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shared", [False, True])
+async def test_requests_over_budget_get_429(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch, shared: bool
+):
+    """Test that a route budget is enforced with Retry-After."""
+    monkeypatch.setattr(settings, "RATE_LIMIT_SHARED", shared)
+    monkeypatch.setattr(
+        settings, "RATE_LIMIT_ROUTES", {"GET /api/v1/deals/{id}": (1, 2)}
+    )
+
+    for _ in range(2):
+        response = await client.get("/api/v1/deals/1", headers=HEADERS)
+        assert response.status_code != 429
+    response = await client.get("/api/v1/deals/2", headers=HEADERS)
+    assert response.status_code == 429
+    assert 1 <= int(response.headers["Retry-After"]) <= 2
+    assert response.json() == {"error": "Rate limit exceeded"}
+
+    # Other routes and organizations keep their own budget
+    response = await client.get("/api/v1/deals", headers=HEADERS)
+    assert response.status_code != 429
+    response = await client.get(
+        "/api/v1/deals/1", headers={"X-Organization-Id": "424243"}
+    )
+    assert response.status_code != 429
+
+
+@pytest.mark.asyncio
+async def test_reformatted_organization_header_shares_the_bucket(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that "01", " 1" or "+1" cannot open a fresh bucket for org 1."""
+    monkeypatch.setattr(
+        settings, "RATE_LIMIT_ROUTES", {"GET /api/v1/deals/{id}": (1, 2)}
+    )
+
+    for value in ("424242", "0424242"):
+        response = await client.get(
+            "/api/v1/deals/1", headers={"X-Organization-Id": value}
+        )
+        assert response.status_code != 429
+    for value in ("424242", "0424242", " 424242", "+424242"):
+        response = await client.get(
+            "/api/v1/deals/1", headers={"X-Organization-Id": value}
+        )
+        assert response.status_code == 429
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"RATE_LIMIT_RATE": 0},
+        {"RATE_LIMIT_BURST": 0},
+        {"RATE_LIMIT_ROUTES": {"GET /api/v1/deals": (0, 10)}},
+        {"RATE_LIMIT_TENANT_MULTIPLIERS": {"1": 0}},
+    ],
+)
+def test_non_positive_budgets_are_rejected(overrides: dict):
+    """Test that a zero budget fails at startup, not with a 500 per request."""
+    with pytest.raises(ValidationError):
+        Settings(**overrides)